@@ -847,11 +847,14 @@ Example response format:
             
             # Add top sources
             top_sources = []
+            seen_titles = set()
             for result in results[:3]:  # Show top 3 sources
+                if not result.get("link"):
+                    continue
                 title = result.get("title", "Unknown")
-                link = result.get("link", "")
-                if title not in top_sources and link:
-                    top_sources.append(f"{title}")
+                if title not in seen_titles:
+                    seen_titles.add(title)
+                    top_sources.append(title)
             
             if top_sources:
                 message += f" Sources include: {', '.join(top_sources[:3])}."
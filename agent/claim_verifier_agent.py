@@ -2,7 +2,7 @@
 
 import os
 import sys
-import json
+import orjson
 import logging
 import asyncio
 import argparse
@@ -28,12 +28,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _to_json(value: Any) -> str:
+    """Pretty-printed JSON text for console output"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
 class ClaimVerifierAgent:
     """Main Claim Verifier Agent for processing fact-checking requests"""
     
     def __init__(self):
         self.orchestrator = None
-        self.session_id = f"cv_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session_start = datetime.now()
+        self.session_id = f"cv_session_{session_start.strftime('%Y%m%d_%H%M%S')}"
+        self._session_start_ts = session_start.timestamp()
         self.results_dir = "claim_verification_results"
         os.makedirs(self.results_dir, exist_ok=True)
         
@@ -69,8 +76,8 @@ class ClaimVerifierAgent:
             
             # Load content based on format
             if file_format == "json":
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content_data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    content_data = orjson.loads(f.read())
                 
                 # Ensure it's a list
                 if isinstance(content_data, dict):
@@ -206,7 +213,8 @@ class ClaimVerifierAgent:
     def _save_results(self, results: Dict[str, Any], operation_name: str) -> str:
         """Save verification results to file"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            saved_at = datetime.now()
+            timestamp = saved_at.strftime('%Y%m%d_%H%M%S')
             filename = f"{operation_name}_{timestamp}.json"
             filepath = os.path.join(self.results_dir, filename)
             
@@ -214,12 +222,12 @@ class ClaimVerifierAgent:
             results['session_metadata'] = {
                 'session_id': self.session_id,
                 'operation': operation_name,
-                'saved_at': datetime.now().isoformat(),
+                'saved_at': saved_at.isoformat(),
                 'agent_version': '1.0.0'
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Results saved to: {filepath}")
             return filepath
@@ -234,16 +242,18 @@ class ClaimVerifierAgent:
             # List all result files for this session
             session_files = []
             if os.path.exists(self.results_dir):
-                for filename in os.listdir(self.results_dir):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(self.results_dir, filename)
+                with os.scandir(self.results_dir) as entries:
+                    for entry in entries:
+                        # Files last written before this session started cannot belong to it, so skip parsing them
+                        if not entry.name.endswith('.json') or entry.stat().st_mtime < self._session_start_ts:
+                            continue
                         try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
+                            with open(entry.path, 'rb') as f:
+                                data = orjson.loads(f.read())
                                 if data.get('session_metadata', {}).get('session_id') == self.session_id:
                                     session_files.append({
-                                        'filename': filename,
-                                        'filepath': filepath,
+                                        'filename': entry.name,
+                                        'filepath': entry.path,
                                         'operation': data.get('session_metadata', {}).get('operation', 'unknown'),
                                         'timestamp': data.get('session_metadata', {}).get('saved_at', 'unknown'),
                                         'success': data.get('success', False)
@@ -295,7 +305,7 @@ async def main():
                 return 1
             
             result = await agent.verify_from_file(args.file, args.format)
-            print(json.dumps(result, indent=2))
+            print(_to_json(result))
         
         elif args.operation == 'verify-claim':
             if not args.claim:
@@ -303,7 +313,7 @@ async def main():
                 return 1
             
             result = await agent.quick_verify_claim(args.claim, args.context)
-            print(json.dumps(result, indent=2))
+            print(_to_json(result))
         
         elif args.operation == 'verify-reddit':
             if not args.reddit_file:
@@ -311,25 +321,25 @@ async def main():
                 return 1
             
             # Load Reddit posts data
-            with open(args.reddit_file, 'r', encoding='utf-8') as f:
-                reddit_posts = json.load(f)
+            with open(args.reddit_file, 'rb') as f:
+                reddit_posts = orjson.loads(f.read())
             
             result = await agent.verify_reddit_posts(reddit_posts)
-            print(json.dumps(result, indent=2))
+            print(_to_json(result))
         
         elif args.operation == 'session-summary':
             summary = agent.get_session_summary()
-            print(json.dumps(summary, indent=2))
+            print(_to_json(summary))
         
         return 0
         
     except Exception as e:
         logger.error(f"Operation failed: {e}")
-        print(json.dumps({
+        print(_to_json({
             'success': False,
             'error': str(e),
             'timestamp': datetime.now().isoformat()
-        }, indent=2))
+        }))
         return 1
 
 
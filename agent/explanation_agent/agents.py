@@ -2,6 +2,7 @@
 
 import os
 import json
+import orjson
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -832,8 +833,9 @@ class ExplanationAgent:
         filename = f"{post_id}.json"
         filepath = os.path.join(config.OUTPUT_DIR, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(post_data, f, indent=2, ensure_ascii=False)
+        # Serialize in one pass and write the bytes in a single call
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(post_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         return filepath
     
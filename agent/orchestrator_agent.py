@@ -1,12 +1,22 @@
 """Orchestrator Agent - Google Agents SDK coordination between trend scanner and claim verifier"""
 
 import os
+import re
 import sys
-import json
+import orjson
+import hashlib
 import logging
+import logging.handlers
+import queue
+import atexit
 import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from itertools import chain, repeat
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, Deque, Iterator, TypedDict
 import google.generativeai as genai
 
 # Add project root to path
@@ -16,346 +26,547 @@ from claim_verifier.agents import ClaimVerifierOrchestrator
 from explanation_agent.agents import ExplanationAgent
 from trend_scanner_agent import main_one_scan
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('orchestrator.log'),
-        logging.StreamHandler()
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
+# Background writer for orchestrator.log, created by start_logging()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Collapses punctuation/whitespace runs when normalizing claims for duplicate detection
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+
+# Claim verification streams content items through a bounded queue to concurrent workers, each sending
+# up to a verifier-sized batch (ClaimVerifierOrchestrator verifies 15 claims per Gemini call)
+_VERIFY_QUEUE_SIZE = 32
+_VERIFY_BATCH_SIZE = 15
+_END_OF_STREAM = object()
+
+# Verification placeholders for posts without a verdict of their own; shared by every such post, so never mutated
+_VERIFICATION_BATCH_COMPLETED = {
+    'verified': True,
+    'verdict': 'verification_completed',
+    'message': 'Claim processed through Google Agents batch fact-checking workflow',
+    'confidence': 'medium',
+    'sources_checked': True,
+    'batch_processed': True
+}
+_VERIFICATION_NOT_PERFORMED = {
+    'verified': False,
+    'verdict': 'not_verified',
+    'message': 'No verification was performed for this claim',
+    'batch_processed': False
+}
+
+# Context values passed to prompts verbatim; anything else goes through _summarize
+_SAFE_SCALAR = (str, int, float, bool, type(None))
+_SUMMARY_SAMPLE_SIZE = 3
+_SUMMARY_ITEM_CHARS = 200
+
+
+def _summarize(value: Any) -> str:
+    """Short, prompt-safe description of a non-scalar context value, with a small sample of its contents"""
+    if isinstance(value, dict):
+        keys = ', '.join(str(key) for key in list(value)[:_SUMMARY_SAMPLE_SIZE])
+        more = ', ...' if len(value) > _SUMMARY_SAMPLE_SIZE else ''
+        return f"Dict with {len(value)} keys ({keys}{more})"
+    if isinstance(value, (list, tuple)):
+        sample = '; '.join(str(item)[:_SUMMARY_ITEM_CHARS] for item in value[:_SUMMARY_SAMPLE_SIZE])
+        more = '; ...' if len(value) > _SUMMARY_SAMPLE_SIZE else ''
+        return f"List with {len(value)} items [{sample}{more}]"
+    return f"<{type(value).__name__} object>"
+
+
+def _compact(text: str) -> Dict[str, Any]:
+    """Digest of a (possibly very large) raw LLM response: hash and size plus a short preview"""
+    encoded = text.encode('utf-8')
+    return {
+        'sha256': hashlib.sha256(encoded).hexdigest(),
+        'len': len(encoded),
+        'preview': text[:500]
+    }
+
+
+def _digest(value: Any) -> str:
+    """sha256 of a task result payload: text as UTF-8, anything else as its JSON serialization"""
+    encoded = value.encode('utf-8') if isinstance(value, str) else orjson.dumps(
+        value, default=str, option=orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class WorkflowTask(TypedDict, total=False):
+    """One entry of an execute_workflow task list (id and depends_on are optional)"""
+    id: str
+    agent: str
+    task: str
+    context: Dict[str, Any]
+    depends_on: List[str]
+
+
+class TaskResult(TypedDict, total=False):
+    """Result of GoogleAgent.execute_task (error is only present on failure)"""
+    agent_role: str
+    task: str
+    result: Any
+    context_summary: Dict[str, Any]
+    timestamp: str
+    tool_used: bool
+    error: str
+
+
+class TrendPost(TypedDict):
+    """One trending post, as produced by main_one_scan"""
+    claim: str
+    summary: str
+    platform: str
+    Post_link: str
+
+
+class TrendResult(TypedDict):
+    """Structured trend scanning output requested from Gemini when the scan tool is unavailable"""
+    posts: List[TrendPost]
+    total_posts: int
+
+
+# Tool handler: (tool, task context) -> tool result
+ToolHandler = Callable[[Any, Dict[str, Any]], Awaitable[Any]]
+
+
+class LLMResponseCache:
+    """Persistent TTL cache of Gemini text responses keyed by model and prompt (sqlite-backed, survives restarts)"""
+    
+    def __init__(self, path: str, ttl: int = 3600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Hash the model name with the prompt so model upgrades invalidate old entries"""
+        return hashlib.blake2b(f"{model_name}|{prompt}".encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, response: str) -> None:
+        """Store a response for key, replacing any previous entry"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, time.time() + self.ttl)
+            )
+
 
 class GoogleAgent:
     """Individual Google AI agent with specific role and capabilities (Google Agents SDK pattern)"""
     
-    def __init__(self, role: str, goal: str, model: genai.GenerativeModel, tools: List[Any] = None):
+    _PROMPT_TAIL = "\n\nPlease provide a comprehensive response that addresses the task while staying within your role expertise.\n"
+    
+    def __init__(self, role: str, goal: str, model: genai.GenerativeModel, tools: Optional[List[Any]] = None,
+                 response_cache: Optional[LLMResponseCache] = None, response_schema: Optional[type] = None,
+                 gemini_semaphore: Optional[asyncio.Semaphore] = None):
         self.role = role
         self.goal = goal
         self.model = model
-        self.tools = tools or []
-        self.history = []
+        self.tools: List[Any] = tools or []
+        # Static part of every text prompt; built once so identical tasks yield identical (cacheable) prompts
+        self._prompt_head = f"\nYou are an expert {role}.\n\nYour goal: {goal}\n\n"
+        # Bounded log of task metadata; full results already live in the workflow output
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=128)
+        self.response_cache = response_cache
+        
+        # With a schema, text responses are requested as validated JSON and returned parsed
+        self.response_schema = response_schema
+        self.generation_config = genai.GenerationConfig(
+            response_mime_type='application/json',
+            response_schema=response_schema
+        ) if response_schema else None
+        
+        # Shared across agents to cap concurrent Gemini requests (rate-limit safety under gather fan-out)
+        self.gemini_semaphore = gemini_semaphore
+        self._dispatch: List[Tuple[Any, List[Tuple[Tuple[str, ...], ToolHandler]]]] = self._build_dispatch()
+    
+    async def _generate(self, prompt: str) -> str:
+        """Generate a text response, serving repeated prompts from the persistent cache"""
+        if self.response_cache is None:
+            return await self._call_model(prompt)
+        
+        # Structured and free-text replies to the same prompt are cached separately
+        model_name = getattr(self.model, 'model_name', '')
+        if self.response_schema:
+            model_name = f"{model_name}|json:{self.response_schema.__name__}"
+        key = LLMResponseCache.make_key(model_name, prompt)
+        cached = await asyncio.to_thread(self.response_cache.get, key)
+        if cached is not None:
+            logger.info(f"Agent {self.role} served response from LLM cache")
+            return cached
+        
+        response_text = await self._call_model(prompt)
+        await asyncio.to_thread(self.response_cache.set, key, response_text)
+        return response_text
+    
+    async def _call_model(self, prompt: str) -> str:
+        """Send a prompt to Gemini, waiting for a free slot if concurrency is capped"""
+        if self.gemini_semaphore is None:
+            response = await self.model.generate_content_async(prompt, generation_config=self.generation_config)
+        else:
+            async with self.gemini_semaphore:
+                response = await self.model.generate_content_async(prompt, generation_config=self.generation_config)
+        return response.text
+    
+    def _build_dispatch(self) -> List[Tuple[Any, List[Tuple[Tuple[str, ...], ToolHandler]]]]:
+        """
+        Inspect each tool once and map it to the handlers it supports
+        
+        Returns:
+            (tool, routes) pairs; routes are (task keywords, handler) in priority order, and a
+            route applies when any of its keywords appears in the lowercased task description
+        """
+        dispatch = []
+        for tool in self.tools:
+            routes = []
+            if callable(tool):
+                routes.append((('scan',), self._run_scan_tool))
+            if hasattr(tool, 'verify_content'):
+                routes.append((('verify',), self._run_verify_tool))
+            if hasattr(tool, 'execute_workflow'):
+                routes.append((('verify',), self._run_verification_workflow_tool))
+            if hasattr(tool, 'batch_create_posts'):
+                routes.append((('explanation', 'debunk'), self._run_batch_explanation_tool))
+            if hasattr(tool, 'create_debunk_post'):
+                routes.append((('explanation',), self._run_single_explanation_tool))
+            dispatch.append((tool, routes))
+            logger.info(f"Agent {self.role} tool {type(tool).__name__} supports: {[handler.__name__ for _, handler in routes]}")
+        return dispatch
+    
+    async def _run_scan_tool(self, tool: Any, context: Dict[str, Any]) -> Any:
+        """Run the trend scanning function"""
+        logger.info(f"Agent {self.role} executing trend scanning tool...")
+        # Sync scan does blocking Reddit/Gemini I/O; keep it off the event loop
+        return await asyncio.to_thread(tool)
+    
+    async def _run_verify_tool(self, tool: Any, context: Dict[str, Any]) -> Any:
+        """Run ClaimVerifierOrchestrator batch verification over the content data as it is produced"""
+        logger.info(f"Agent {self.role} executing claim verification tool with streaming batch processing...")
+        content_data = context.get('content_data', [])
+        worker_count = max(1, int(os.getenv('VERIFY_WORKERS', '4')))
+        
+        items: asyncio.Queue = asyncio.Queue(maxsize=_VERIFY_QUEUE_SIZE)
+        batch_results: List[Dict[str, Any]] = []
+        total_claims = 0
+        
+        # content_data may be a one-shot stream, so this handler must not raise part-way: a fallback route
+        # would only see the unconsumed rest. Failures are recorded per batch and merged with the others.
+        async def produce() -> None:
+            nonlocal total_claims
+            try:
+                for content_item in content_data:
+                    await items.put(content_item)
+                    total_claims += 1
+            except Exception as e:
+                logger.error(f"Content stream failed after {total_claims} claims: {e}", exc_info=True)
+                batch_results.append({'success': False, 'error': f'Content stream failed: {e}', 'verified_claims': []})
+            await items.put(_END_OF_STREAM)
+        
+        async def verify_worker() -> None:
+            while True:
+                # Block for one item, then take whatever else is already queued, up to a batch
+                batch = [await items.get()]
+                while batch[-1] is not _END_OF_STREAM and len(batch) < _VERIFY_BATCH_SIZE and not items.empty():
+                    batch.append(items.get_nowait())
+                
+                finished = batch[-1] is _END_OF_STREAM
+                if finished:
+                    batch.pop()
+                    items.put_nowait(_END_OF_STREAM)  # Pass the end marker on to the other workers
+                if batch:
+                    try:
+                        batch_results.append(await tool.verify_content(batch))
+                    except Exception as e:
+                        logger.error(f"Verification of a {len(batch)}-claim batch failed: {e}", exc_info=True)
+                        batch_results.append(self._failed_verification_batch(batch, e))
+                if finished:
+                    return
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(verify_worker()) for _ in range(worker_count))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        if not total_claims and not batch_results:
+            # No content data provided, return empty result
+            return {
+                'success': False,
+                'message': 'No content data provided for verification',
+                'verified_claims': []
+            }
+        
+        logger.info(f"Verified {total_claims} claims in {len(batch_results)} batches across {worker_count} workers")
+        return self._merge_verification_batches(batch_results, total_claims, worker_count)
     
-    async def execute_task(self, task_description: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _failed_verification_batch(batch: List[Dict[str, Any]], error: Exception) -> Dict[str, Any]:
+        """verify_content-shaped result giving every claim of a failed batch an error verdict for its own posts"""
+        now_iso = datetime.now().isoformat()
+        return {
+            'success': False,
+            'error': str(error),
+            'verified_claims': [
+                {
+                    'claim_text': content_item.get('title', 'Unknown claim'),
+                    'verification': {
+                        'verified': False,
+                        'verdict': 'error',
+                        'message': f'Batch verification failed: {error}',
+                        'error': str(error)
+                    },
+                    'claim_metadata': content_item.get('claim_metadata', {}),
+                    'verification_timestamp': now_iso
+                }
+                for content_item in batch
+            ]
+        }
+    
+    @staticmethod
+    def _merge_verification_batches(batch_results: List[Dict[str, Any]], total_claims: int,
+                                    worker_count: int) -> Dict[str, Any]:
+        """Combine per-batch verify_content results into a single verification result"""
+        verified_claims = [claim for result in batch_results for claim in result.get('verified_claims', [])]
+        errors = [result.get('error', result.get('message')) for result in batch_results if not result.get('success')]
+        
+        merged = {
+            # A failed batch does not discard claims verified by the others
+            'success': bool(verified_claims) or not errors,
+            'message': f'Successfully verified {len(verified_claims)} claims using batch Google Agents fact-checking',
+            'verified_claims': verified_claims,
+            'summary': {
+                'total_claims': len(verified_claims),
+                'successfully_verified': len([c for c in verified_claims if c.get('verification', {}).get('verified', False)]),
+                'verification_errors': len([c for c in verified_claims if 'error' in c.get('verification', {})]),
+                'total_batches': len(batch_results)
+            },
+            'batch_processing': {
+                'enabled': True,
+                'total_claims': total_claims,
+                'batch_size': min(_VERIFY_BATCH_SIZE, total_claims),
+                'workers': worker_count,
+                'processing_method': 'streaming_batch_verification'
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        if errors:
+            merged['errors'] = errors
+        return merged
+    
+    async def _run_verification_workflow_tool(self, tool: Any, context: Dict[str, Any]) -> Any:
+        """Run a verifier's extract → verify → report workflow over the content data"""
+        logger.info(f"Agent {self.role} executing ClaimVerifierOrchestrator...")
+        # content_data may be a lazy stream; the extraction workflow needs it as a list
+        content_data = list(context.get('content_data', []))
+        
+        if not content_data:
+            return {
+                'success': False,
+                'message': 'No content data provided for verification workflow',
+                'workflow_results': []
+            }
+        
+        # Use the orchestrator's workflow for verification
+        workflow_tasks = [
+            {
+                'agent': 'claim_extractor',
+                'task': 'extract_claims',
+                'context': {'content_list': content_data}
+            },
+            {
+                'agent': 'fact_verifier', 
+                'task': 'verify_claims',
+                'context': {'verification_mode': 'comprehensive'}
+            },
+            {
+                'agent': 'report_generator',
+                'task': 'generate_verification_report',
+                'context': {'include_sources': True}
+            }
+        ]
+        
+        tool_result = tool.execute_workflow(workflow_tasks)
+        if asyncio.iscoroutine(tool_result):
+            tool_result = await tool_result
+        return tool_result
+    
+    async def _run_batch_explanation_tool(self, tool: Any, context: Dict[str, Any]) -> Any:
+        """Run ExplanationAgent batch debunk post generation"""
+        logger.info(f"Agent {self.role} executing ExplanationAgent with batch processing...")
+        verification_results = context.get('verification_results', [])
+        logger.info(f"Received verification_results: {len(verification_results)} items")
+        
+        if not verification_results:
+            logger.info("No verification results provided for explanation generation")
+            return {
+                'success': False,
+                'message': 'No verification results provided for explanation generation',
+                'debunk_posts': []
+            }
+        
+        # Log the structure of verification results for debugging
+        for i, vr in enumerate(verification_results[:2]):  # Log first 2 for debugging
+            logger.info(f"Verification result {i}: keys = {list(vr.keys()) if isinstance(vr, dict) else type(vr)}")
+        
+        # Use batch processing for explanation generation (max 10 posts per batch)
+        logger.info(f"Creating debunk posts for {len(verification_results)} claims using batch processing...")
+        tool_result = await asyncio.to_thread(tool.batch_create_posts, verification_results)
+        
+        # Add batch processing metadata
+        if isinstance(tool_result, dict):
+            tool_result['batch_processing'] = {
+                'enabled': True,
+                'total_claims': len(verification_results),
+                'batch_size': min(10, len(verification_results)),
+                'processing_method': 'batch_explanation_generation'
+            }
+            debunk_posts_count = len(tool_result.get('debunk_posts', []))
+            logger.info(f"Batch explanation generation completed successfully with {debunk_posts_count} posts generated")
+        else:
+            logger.warning(f"Unexpected tool result type: {type(tool_result)}")
+        return tool_result
+    
+    async def _run_single_explanation_tool(self, tool: Any, context: Dict[str, Any]) -> Any:
+        """Run ExplanationAgent one post at a time (fallback when batch generation is unavailable)"""
+        logger.info(f"Agent {self.role} executing ExplanationAgent (single post mode)...")
+        verification_results = context.get('verification_results', [])
+        
+        if not verification_results:
+            return {
+                'success': False,
+                'message': 'No verification results provided for explanation generation',
+                'debunk_posts': []
+            }
+        
+        # Process single posts
+        debunk_posts = []
+        for verification_result in verification_results[:10]:  # Limit to 10 to match batch size
+            single_result = await asyncio.to_thread(tool.create_debunk_post, verification_result)
+            if single_result.get('success'):
+                debunk_posts.append(single_result.get('debunk_post', {}))
+        
+        logger.info(f"Single post explanation generation completed with {len(debunk_posts)} posts")
+        return {
+            'success': True,
+            'message': f'Generated {len(debunk_posts)} debunk posts using single post method',
+            'debunk_posts': debunk_posts,
+            'batch_processing': {
+                'enabled': False,
+                'total_claims': len(verification_results),
+                'processing_method': 'single_post_fallback'
+            }
+        }
+    
+    def _record(self, result: TaskResult) -> None:
+        """Add a task result's metadata (not its payload) to the agent history"""
+        self.history.append({
+            'agent_role': result.get('agent_role'),
+            'task': result.get('task'),
+            'timestamp': result.get('timestamp'),
+            'tool_used': result.get('tool_used', False),
+            'error': result.get('error'),
+            # A digest, unlike id(), cannot come to name an unrelated object once the result is collected
+            'result_sha256': _digest(result.get('result'))
+        })
+    
+    async def execute_task(self, task_description: str, context: Optional[Dict[str, Any]] = None) -> TaskResult:
         """Execute a specific task using this agent"""
+        # One timestamp per task, shared by whichever result dict this call returns
+        now_iso = datetime.now().isoformat()
         try:
-            # If this agent has tools, try to use them first
-            if self.tools:
-                logger.info(f"Agent {self.role} has {len(self.tools)} tools available")
-                for i, tool in enumerate(self.tools):
-                    logger.info(f"Tool {i}: {type(tool)} with methods: {[method for method in dir(tool) if not method.startswith('_')][:10]}...")
-                    
-                    logger.info(f"Starting tool detection for task: '{task_description}'")
-                    
-                    # Log all conditions for debugging
-                    logger.info(f"Checking conditions:")
-                    logger.info(f"  - hasattr(tool, '__call__'): {hasattr(tool, '__call__')}")
-                    logger.info(f"  - 'scan' in task_description.lower(): {'scan' in task_description.lower()}")
-                    logger.info(f"  - hasattr(tool, 'verify_content'): {hasattr(tool, 'verify_content')}")
-                    logger.info(f"  - 'verify' in task_description.lower(): {'verify' in task_description.lower()}")
-                    logger.info(f"  - hasattr(tool, 'execute_workflow'): {hasattr(tool, 'execute_workflow')}")
-                    logger.info(f"  - hasattr(tool, 'batch_create_posts'): {hasattr(tool, 'batch_create_posts')}")
-                    logger.info(f"  - 'explanation' in task_description.lower(): {'explanation' in task_description.lower()}")
-                    logger.info(f"  - hasattr(tool, 'create_debunk_post'): {hasattr(tool, 'create_debunk_post')}")
-                    
-                    if hasattr(tool, '__call__') and 'scan' in task_description.lower():
-                        # This is likely a trend scanning task
-                        try:
-                            logger.info(f"Agent {self.role} executing trend scanning tool...")
-                            tool_result = tool()
-                            
-                            result = {
-                                'agent_role': self.role,
-                                'task': task_description,
-                                'result': tool_result,
-                                'timestamp': datetime.now().isoformat(),
-                                'tool_used': True
-                            }
-                            
-                            self.history.append(result)
-                            return result
-                            
-                        except Exception as tool_error:
-                            logger.error(f"Tool execution failed: {tool_error}")
-                            # Fall back to text response
-                            pass
-                    
-                    elif hasattr(tool, 'verify_content') and 'verify' in task_description.lower():
-                        # This is a ClaimVerifierOrchestrator with batch processing capability
-                        try:
-                            logger.info(f"Agent {self.role} executing claim verification tool with batch processing...")
-                            content_data = context.get('content_data', []) if context else []
-                            
-                            if content_data:
-                                # Use batch processing for claim verification (max 15 claims per batch)
-                                logger.info(f"Processing {len(content_data)} claims using batch verification...")
-                                tool_result = await tool.verify_content(content_data)
-                                
-                                # Add batch processing metadata
-                                if isinstance(tool_result, dict):
-                                    tool_result['batch_processing'] = {
-                                        'enabled': True,
-                                        'total_claims': len(content_data),
-                                        'batch_size': min(15, len(content_data)),
-                                        'processing_method': 'batch_verification'
-                                    }
-                            else:
-                                # No content data provided, return empty result
-                                tool_result = {
-                                    'success': False,
-                                    'message': 'No content data provided for verification',
-                                    'verified_claims': []
-                                }
-                            
-                            result = {
-                                'agent_role': self.role,
-                                'task': task_description,
-                                'result': tool_result,
-                                'timestamp': datetime.now().isoformat(),
-                                'tool_used': True
-                            }
-                            
-                            self.history.append(result)
-                            return result
-                            
-                        except Exception as tool_error:
-                            logger.error(f"Batch verification tool execution failed: {tool_error}")
-                            # Fall back to text response
-                            pass
-                    
-                    elif hasattr(tool, 'execute_workflow') and 'verify' in task_description.lower():
-                        # This is the ClaimVerifierOrchestrator with sync execute_workflow method
-                        try:
-                            logger.info(f"Agent {self.role} executing ClaimVerifierOrchestrator...")
-                            content_data = context.get('content_data', []) if context else []
-                            
-                            if content_data:
-                                # Use the orchestrator's workflow for verification
-                                workflow_tasks = [
-                                    {
-                                        'agent': 'claim_extractor',
-                                        'task': 'extract_claims',
-                                        'context': {'content_list': content_data}
-                                    },
-                                    {
-                                        'agent': 'fact_verifier', 
-                                        'task': 'verify_claims',
-                                        'context': {'verification_mode': 'comprehensive'}
-                                    },
-                                    {
-                                        'agent': 'report_generator',
-                                        'task': 'generate_verification_report',
-                                        'context': {'include_sources': True}
-                                    }
-                                ]
-                                
-                                tool_result = tool.execute_workflow(workflow_tasks)
-                            else:
-                                tool_result = {
-                                    'success': False,
-                                    'message': 'No content data provided for verification workflow',
-                                    'workflow_results': []
-                                }
-                            
-                            result = {
-                                'agent_role': self.role,
-                                'task': task_description,
-                                'result': tool_result,
-                                'timestamp': datetime.now().isoformat(),
-                                'tool_used': True
-                            }
-                            
-                            self.history.append(result)
-                            return result
-                            
-                        except Exception as tool_error:
-                            logger.error(f"Tool execution failed: {tool_error}")
-                            # Fall back to text response
-                            pass
-                    
-                    elif hasattr(tool, 'batch_create_posts') and ('explanation' in task_description.lower() or 'debunk' in task_description.lower() or 'Generate debunk posts' in task_description):
-                        # This is an ExplanationAgent with batch processing capability
-                        try:
-                            logger.info(f"Agent {self.role} executing ExplanationAgent with batch processing...")
-                            logger.info(f"Tool type: {type(tool)}")
-                            logger.info(f"Tool methods: {[method for method in dir(tool) if not method.startswith('_')]}")
-                            logger.info(f"Task description: '{task_description}'")
-                            logger.info(f"Task description contains 'explanation': {'explanation' in task_description.lower()}")
-                            logger.info(f"Tool has batch_create_posts: {hasattr(tool, 'batch_create_posts')}")
-                            
-                            verification_results = context.get('verification_results', []) if context else []
-                            logger.info(f"Received verification_results: {len(verification_results)} items")
-                            
-                            if verification_results:
-                                logger.info(f"Found {len(verification_results)} verification results for explanation generation")
-                                
-                                # Log the structure of verification results for debugging
-                                for i, vr in enumerate(verification_results[:2]):  # Log first 2 for debugging
-                                    logger.info(f"Verification result {i}: keys = {list(vr.keys()) if isinstance(vr, dict) else type(vr)}")
-                                
-                                # Use batch processing for explanation generation (max 10 posts per batch)
-                                logger.info(f"Creating debunk posts for {len(verification_results)} claims using batch processing...")
-                                tool_result = tool.batch_create_posts(verification_results)
-                                logger.info(f"Tool result type: {type(tool_result)}")
-                                logger.info(f"Tool result keys: {list(tool_result.keys()) if isinstance(tool_result, dict) else 'Not a dict'}")
-                                
-                                # Add batch processing metadata
-                                if isinstance(tool_result, dict):
-                                    tool_result['batch_processing'] = {
-                                        'enabled': True,
-                                        'total_claims': len(verification_results),
-                                        'batch_size': min(10, len(verification_results)),
-                                        'processing_method': 'batch_explanation_generation'
-                                    }
-                                    debunk_posts_count = len(tool_result.get('debunk_posts', []))
-                                    logger.info(f"Batch explanation generation completed successfully with {debunk_posts_count} posts generated")
-                                else:
-                                    logger.warning(f"Unexpected tool result type: {type(tool_result)}")
-                            else:
-                                logger.info("No verification results provided for explanation generation")
-                                tool_result = {
-                                    'success': False,
-                                    'message': 'No verification results provided for explanation generation',
-                                    'debunk_posts': []
-                                }
-                            
-                            result = {
-                                'agent_role': self.role,
-                                'task': task_description,
-                                'result': tool_result,
-                                'timestamp': datetime.now().isoformat(),
-                                'tool_used': True
-                            }
-                            
-                            self.history.append(result)
-                            logger.info(f"ExplanationAgent tool execution completed - tool_used: True")
-                            return result
-                            
-                        except Exception as tool_error:
-                            logger.error(f"Batch ExplanationAgent execution failed: {tool_error}")
-                            logger.error(f"Exception type: {type(tool_error)}")
-                            logger.error(f"Exception args: {tool_error.args}")
-                            import traceback
-                            logger.error(f"Traceback: {traceback.format_exc()}")
-                            # Fall back to text response
-                            pass
-                    
-                    elif hasattr(tool, 'create_debunk_post') and 'explanation' in task_description.lower():
-                        # This is an ExplanationAgent with single post capability (fallback)
-                        try:
-                            logger.info(f"Agent {self.role} executing ExplanationAgent (single post mode)...")
-                            verification_results = context.get('verification_results', []) if context else []
-                            
-                            if verification_results:
-                                # Process single posts
-                                debunk_posts = []
-                                for verification_result in verification_results[:10]:  # Limit to 10 to match batch size
-                                    single_result = tool.create_debunk_post(verification_result)
-                                    if single_result.get('success'):
-                                        debunk_posts.append(single_result.get('debunk_post', {}))
-                                
-                                tool_result = {
-                                    'success': True,
-                                    'message': f'Generated {len(debunk_posts)} debunk posts using single post method',
-                                    'debunk_posts': debunk_posts,
-                                    'batch_processing': {
-                                        'enabled': False,
-                                        'total_claims': len(verification_results),
-                                        'processing_method': 'single_post_fallback'
-                                    }
-                                }
-                                logger.info(f"Single post explanation generation completed with {len(debunk_posts)} posts")
-                            else:
-                                tool_result = {
-                                    'success': False,
-                                    'message': 'No verification results provided for explanation generation',
-                                    'debunk_posts': []
-                                }
-                            
-                            result = {
-                                'agent_role': self.role,
-                                'task': task_description,
-                                'result': tool_result,
-                                'timestamp': datetime.now().isoformat(),
-                                'tool_used': True
-                            }
-                            
-                            self.history.append(result)
-                            return result
-                            
-                        except Exception as tool_error:
-                            logger.error(f"Single ExplanationAgent execution failed: {tool_error}")
-                            # Fall back to text response
-                            pass
+            # If this agent has tools, try the first route matching the task on each tool
+            task_lower = task_description.lower()
+            for tool, routes in self._dispatch:
+                handler = next(
+                    (handler for keywords, handler in routes if any(keyword in task_lower for keyword in keywords)),
+                    None
+                )
+                if handler is None:
+                    continue
+                
+                try:
+                    tool_result = await handler(tool, context or {})
+                except Exception as tool_error:
+                    logger.error(f"Tool execution failed ({handler.__name__}): {tool_error}", exc_info=True)
+                    # Fall back to the next tool, then to a text response
+                    continue
+                
+                result: TaskResult = {
+                    'agent_role': self.role,
+                    'task': task_description,
+                    'result': tool_result,
+                    'timestamp': now_iso,
+                    'tool_used': True
+                }
+                
+                self._record(result)
+                return result
             
-            # Clean context to avoid circular references
-            safe_context = {}
-            if context:
-                for key, value in context.items():
-                    try:
-                        if isinstance(value, (str, int, float, bool, list, dict)):
-                            if isinstance(value, dict):
-                                safe_context[key] = f"Dict with {len(value)} keys"
-                            elif isinstance(value, list):
-                                safe_context[key] = f"List with {len(value)} items"
-                            else:
-                                safe_context[key] = value
-                        else:
-                            safe_context[key] = f"<{type(value).__name__} object>"
-                    except:
-                        safe_context[key] = "<unable to serialize>"
+            # Clean context to avoid circular references: scalars pass through, everything else is summarized
+            safe_context = {
+                key: value if isinstance(value, _SAFE_SCALAR) else _summarize(value)
+                for key, value in (context or {}).items()
+            }
             
-            # Create context-aware prompt
+            # Create context-aware prompt around the fixed role/goal preamble
             context_text = ""
             if safe_context:
-                context_summary = "\n".join([f"- {k}: {v}" for k, v in safe_context.items()])
+                context_summary = "\n".join(f"- {k}: {v}" for k, v in safe_context.items())
                 context_text = f"Context information:\n{context_summary}\n\n"
             
-            prompt = f"""
-You are an expert {self.role}.
-
-Your goal: {self.goal}
-
-{context_text}Task: {task_description}
-
-Please provide a comprehensive response that addresses the task while staying within your role expertise.
-"""
+            prompt = f"{self._prompt_head}{context_text}Task: {task_description}{self._PROMPT_TAIL}"
             
-            response = self.model.generate_content(prompt)
+            response_text = await self._generate(prompt)
             
-            result = {
+            result: TaskResult = {
                 'agent_role': self.role,
                 'task': task_description,
-                'result': response.text,
+                'result': orjson.loads(response_text) if self.response_schema else response_text,
                 'context_summary': safe_context,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'tool_used': False
             }
             
-            self.history.append(result)
+            self._record(result)
             return result
             
         except Exception as e:
             logger.error(f"Agent {self.role} task execution failed: {e}")
-            error_result = {
+            error_result: TaskResult = {
                 'agent_role': self.role,
                 'task': task_description,
                 'result': f"Task execution failed: {str(e)}",
                 'error': str(e),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'tool_used': False
             }
-            self.history.append(error_result)
+            self._record(error_result)
             return error_result
 
 
 class GoogleAgentsOrchestrator:
     """Google Agents SDK orchestrator for managing multiple agents"""
     
-    def __init__(self, gemini_api_key: Optional[str] = None):
+    def __init__(self, gemini_api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
         if not self.gemini_api_key:
             raise ValueError("Gemini API key is required for Google Agents orchestration")
@@ -364,70 +575,104 @@ class GoogleAgentsOrchestrator:
         genai.configure(api_key=self.gemini_api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
         
+        # Cap on in-flight Gemini requests across all agents
+        self.gemini_semaphore = asyncio.Semaphore(int(os.getenv('GEMINI_MAX_CONCURRENCY', '8')))
+        
+        # Persistent cache of agent text responses, shared by every agent
+        self.response_cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.response_cache = LLMResponseCache(
+                os.path.join(cache_dir, 'llm_cache.sqlite'),
+                ttl=int(os.getenv('LLM_CACHE_TTL', '3600'))
+            )
+        
         # Agent registry
-        self.agents = {}
-        self.workflow_history = []
+        self.agents: Dict[str, GoogleAgent] = {}
+        self.workflow_history: Deque[Dict[str, Any]] = deque(maxlen=512)
+        
+        # Tasks currently executing, keyed by _task_key, so identical concurrent tasks share one run
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         logger.info("Google Agents Orchestrator initialized successfully")
     
-    def create_agent(self, name: str, role: str, goal: str, tools: List[Any] = None) -> GoogleAgent:
+    def create_agent(self, name: str, role: str, goal: str, tools: Optional[List[Any]] = None,
+                     response_schema: Optional[type] = None) -> GoogleAgent:
         """Create and register a new Google agent"""
-        agent = GoogleAgent(role, goal, self.model, tools)
+        agent = GoogleAgent(role, goal, self.model, tools, self.response_cache, response_schema, self.gemini_semaphore)
         self.agents[name] = agent
         logger.info(f"Created Google Agent: {name} - {role}")
         return agent
     
-    async def execute_workflow(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Execute a workflow with multiple agents and tasks"""
+    async def execute_workflow(self, tasks: List[WorkflowTask]) -> Dict[str, Any]:
+        """Execute a workflow with multiple agents and tasks, running each wave of ready tasks concurrently"""
+        workflow_start = datetime.now()
+        workflow_stamp = workflow_start.strftime('%Y%m%d_%H%M%S')
         try:
             logger.info(f"Starting Google Agents workflow with {len(tasks)} tasks")
             
-            workflow_results = []
-            context = {}
+            # Validates dependencies (unknown ids, cycles) before anything runs
+            waves = self._schedule(tasks)
             
-            for i, task in enumerate(tasks):
-                agent_name = task.get('agent')
-                task_description = task.get('task')
-                task_context = task.get('context', {})
-                
-                # Merge global context with task-specific context
-                merged_context = {**context, **task_context}
-                
-                if agent_name not in self.agents:
-                    error_result = {
-                        'agent_role': agent_name,
-                        'task': task_description,
-                        'result': f"Agent '{agent_name}' not found",
-                        'error': f"Agent not registered: {agent_name}",
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    workflow_results.append(error_result)
-                    continue
-                
-                logger.info(f"Executing task {i+1}/{len(tasks)}: {agent_name} - {task_description}")
+            task_results: List[Optional[TaskResult]] = [None] * len(tasks)
+            context: Dict[str, Any] = {}
+            # Results by task id, for '<id>_result' references; kept out of context so they never reach prompts
+            results_by_id: Dict[str, TaskResult] = {}
+            completed_tasks = 0
+            failed_tasks = 0
+            
+            for wave in waves:
+                logger.info(f"Executing {len(wave)} task(s) concurrently: {[tasks[i].get('agent') for i in wave]}")
                 
-                # Execute task with agent (now async)
-                result = await self.agents[agent_name].execute_task(task_description, merged_context)
-                workflow_results.append(result)
+                # Tasks in a wave only see results from earlier waves
+                results = await asyncio.gather(
+                    *(self._run_one(tasks[i], context, results_by_id) for i in wave),
+                    return_exceptions=True
+                )
+                wave_finished_iso = datetime.now().isoformat()
                 
-                # Update context with result for next tasks
-                context['last_result'] = result
-                context[f'{agent_name}_result'] = result
+                for i, result in zip(wave, results):
+                    task = tasks[i]
+                    agent_name = task.get('agent')
+                    if isinstance(result, Exception):
+                        logger.error(f"Task {agent_name} - {task.get('task')} raised: {result}")
+                        result = {
+                            'agent_role': agent_name,
+                            'task': task.get('task'),
+                            'result': f"Task execution failed: {str(result)}",
+                            'error': str(result),
+                            'timestamp': wave_finished_iso,
+                            'tool_used': False
+                        }
+                    task_results[i] = result
+                    if result.get('error'):
+                        failed_tasks += 1
+                    else:
+                        completed_tasks += 1
+                    
+                    # Update context with result for dependent tasks
+                    if agent_name in self.agents:
+                        results_by_id[self._task_id(task, i)] = result
+                        context['last_result'] = result
+                        context[f'{agent_name}_result'] = result
+            
+            # Report results in submission order
+            workflow_results: List[TaskResult] = [result for result in task_results if result is not None]
             
             # Create final workflow summary
             summary = self._create_workflow_summary(workflow_results)
             
             final_result = {
-                'workflow_id': f"orchestrator_workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'workflow_id': f"orchestrator_workflow_{workflow_stamp}",
                 'total_tasks': len(tasks),
-                'completed_tasks': len([r for r in workflow_results if not r.get('error')]),
-                'failed_tasks': len([r for r in workflow_results if r.get('error')]),
+                'completed_tasks': completed_tasks,
+                'failed_tasks': failed_tasks,
                 'workflow_results': workflow_results,
                 'summary': summary,
                 'timestamp': datetime.now().isoformat()
             }
             
-            self.workflow_history.append(final_result)
+            self._record_workflow(final_result)
             logger.info(f"Workflow completed: {final_result['completed_tasks']}/{final_result['total_tasks']} tasks successful")
             
             return final_result
@@ -435,15 +680,138 @@ class GoogleAgentsOrchestrator:
         except Exception as e:
             logger.error(f"Workflow execution failed: {e}")
             error_result = {
-                'workflow_id': f"workflow_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'workflow_id': f"workflow_error_{workflow_stamp}",
                 'error': str(e),
                 'workflow_results': workflow_results if 'workflow_results' in locals() else [],
                 'timestamp': datetime.now().isoformat()
             }
-            self.workflow_history.append(error_result)
+            self._record_workflow(error_result)
             return error_result
     
-    def _create_workflow_summary(self, workflow_results: List[Dict[str, Any]]) -> str:
+    def _record_workflow(self, workflow_result: Dict[str, Any]) -> None:
+        """Add a workflow's summary metadata (not its task results) to the workflow history, keyed by workflow_id"""
+        self.workflow_history.append({
+            'workflow_id': workflow_result.get('workflow_id'),
+            'total_tasks': workflow_result.get('total_tasks'),
+            'completed_tasks': workflow_result.get('completed_tasks'),
+            'failed_tasks': workflow_result.get('failed_tasks'),
+            'error': workflow_result.get('error'),
+            'timestamp': workflow_result.get('timestamp')
+        })
+    
+    @staticmethod
+    def _result_refs(task: WorkflowTask) -> List[str]:
+        """
+        Context keys a task leaves as None for an upstream result to fill ('last_result', '<agent>_result'
+        or '<task id>_result'); '_result' keys the task gives a value of its own are not references
+        """
+        return [key for key, value in task.get('context', {}).items() if key.endswith('_result') and value is None]
+    
+    @staticmethod
+    def _task_id(task: WorkflowTask, index: int) -> str:
+        """Task id used for 'depends_on' and '<task id>_result' references"""
+        return task.get('id') or f"task_{index}"
+    
+    def _schedule(self, tasks: List[WorkflowTask]) -> List[List[int]]:
+        """
+        Order tasks into waves (topological levels of the task DAG) whose members can run concurrently
+        
+        A task waits for the ids listed in its 'depends_on'. Without 'depends_on', a task with an empty result
+        reference in its context (see _result_refs) waits for every task before it; any other task has no dependencies.
+        
+        Args:
+            tasks: Workflow tasks in submission order
+            
+        Returns:
+            Waves of task indices, each wave depending only on earlier waves
+            
+        Raises:
+            ValueError: On duplicate ids, unknown dependencies or dependency cycles
+        """
+        ids = [self._task_id(task, i) for i, task in enumerate(tasks)]
+        index_by_id: Dict[str, int] = {}
+        for i, task_id in enumerate(ids):
+            if task_id in index_by_id:
+                raise ValueError(f"Duplicate task id: {task_id}")
+            index_by_id[task_id] = i
+        
+        dependents: List[List[int]] = [[] for _ in tasks]
+        indegree = [0] * len(tasks)
+        for i, task in enumerate(tasks):
+            if 'depends_on' in task:
+                depends_on = task['depends_on']
+            elif self._result_refs(task):
+                depends_on = ids[:i]
+            else:
+                depends_on = []
+            
+            for dependency in depends_on:
+                if dependency not in index_by_id:
+                    raise ValueError(f"Task {ids[i]} depends on unknown task: {dependency}")
+                dependents[index_by_id[dependency]].append(i)
+                indegree[i] += 1
+        
+        waves: List[List[int]] = []
+        ready = [i for i in range(len(tasks)) if indegree[i] == 0]
+        while ready:
+            waves.append(ready)
+            next_ready = []
+            for i in ready:
+                for dependent in dependents[i]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
+        
+        if sum(len(wave) for wave in waves) != len(tasks):
+            raise ValueError("Workflow tasks have a dependency cycle")
+        return waves
+    
+    async def _run_one(self, task: WorkflowTask, context: Dict[str, Any],
+                       results_by_id: Dict[str, TaskResult]) -> TaskResult:
+        """Run a single workflow task against the shared context"""
+        agent_name = task.get('agent')
+        task_description = task.get('task')
+        task_context = task.get('context', {})
+        
+        # Merge global context with task-specific context; references the task left empty are filled from upstream
+        merged_context = {**context, **task_context}
+        for key in self._result_refs(task):
+            upstream = context.get(key)
+            if upstream is None:
+                upstream = results_by_id.get(key[:-len('_result')])
+            merged_context[key] = upstream
+        
+        if agent_name not in self.agents:
+            return {
+                'agent_role': agent_name,
+                'task': task_description,
+                'result': f"Agent '{agent_name}' not found",
+                'error': f"Agent not registered: {agent_name}",
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        agent = self.agents[agent_name]
+        key = self._task_key(agent.role, task_description, merged_context)
+        future = self._inflight.get(key)
+        if future is None:
+            logger.info(f"Executing task: {agent_name} - {task_description}")
+            future = asyncio.ensure_future(agent.execute_task(task_description, merged_context))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Joining in-flight task: {agent_name} - {task_description}")
+        
+        # Shield so a cancelled caller does not cancel the run other callers are waiting on
+        return await asyncio.shield(future)
+    
+    @staticmethod
+    def _task_key(role: str, task_description: str, context: Dict[str, Any]) -> str:
+        """Stable hash of (role, task, context) identifying duplicate agent tasks"""
+        canonical_context = orjson.dumps(context, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.blake2b(f"{role}|{task_description}|".encode('utf-8') + canonical_context).hexdigest()
+    
+    def _create_workflow_summary(self, workflow_results: List[TaskResult]) -> str:
         """Create a summary of the workflow execution"""
         try:
             successful_tasks = [r for r in workflow_results if not r.get('error')]
@@ -478,7 +846,9 @@ class OrchestratorAgent:
     """Main Orchestrator Agent using Google Agents SDK coordination"""
     
     def __init__(self):
-        self.session_id = f"orchestrator_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session_start = datetime.now()
+        self.session_id = f"orchestrator_session_{session_start.strftime('%Y%m%d_%H%M%S')}"
+        self._session_start_ts = session_start.timestamp()
         self.results_dir = "orchestrator_results"
         os.makedirs(self.results_dir, exist_ok=True)
         
@@ -486,6 +856,8 @@ class OrchestratorAgent:
         self.google_agents = None
         self.claim_verifier = None
         self.explanation_agent = None
+        # Names of the registered Google agents, snapshotted once they are all created
+        self.agent_names: Tuple[str, ...] = ()
         
         logger.info(f"Orchestrator Agent initialized with Google Agents SDK - Session: {self.session_id}")
     
@@ -493,7 +865,7 @@ class OrchestratorAgent:
         """Initialize the Google Agents orchestrator and claim verifier"""
         try:
             logger.info("Initializing Google Agents Orchestrator...")
-            self.google_agents = GoogleAgentsOrchestrator()
+            self.google_agents = GoogleAgentsOrchestrator(cache_dir=self.results_dir)
             
             logger.info("Initializing Claim Verifier with Google Agents...")
             self.claim_verifier = ClaimVerifierOrchestrator()
@@ -503,6 +875,7 @@ class OrchestratorAgent:
             
             # Setup orchestrator agents
             self._setup_orchestrator_agents()
+            self.agent_names = tuple(self.google_agents.agents)
             
             logger.info("Orchestrator Agent fully initialized with Google Agents SDK")
             return True
@@ -519,7 +892,8 @@ class OrchestratorAgent:
             name="trend_scanner",
             role="Trend Scanning Coordinator",
             goal="Coordinate Reddit trend scanning and AI-powered content analysis",
-            tools=[main_one_scan]  # Trend scanner function as tool
+            tools=[main_one_scan],  # Trend scanner function as tool
+            response_schema=TrendResult  # Structured output if the tool fails and Gemini answers directly
         )
         
         # Create claim verification agent with tool
@@ -568,51 +942,22 @@ class OrchestratorAgent:
             
             # Extract trend results
             trend_results = None
-            for result in trend_workflow.get('workflow_results', []):
-                if 'Trend Scanning' in result.get('agent_role', ''):
-                    raw_result = result.get('result')
-                    
-                    # Handle different result types
-                    if isinstance(raw_result, dict):
-                        trend_results = raw_result
-                    elif isinstance(raw_result, str):
-                        # Result is a string (possibly an error or text response)
-                        logger.warning(f"Trend scanner returned string result: {raw_result[:200]}...")
-                        # Try to find JSON-like content in the string
-                        import json
-                        try:
-                            # Look for JSON content in the string
-                            if '{' in raw_result and '}' in raw_result:
-                                start = raw_result.find('{')
-                                end = raw_result.rfind('}') + 1
-                                json_str = raw_result[start:end]
-                                trend_results = json.loads(json_str)
-                                logger.info("Successfully parsed JSON from string result")
-                            else:
-                                # Create a dummy structure for the string result
-                                trend_results = {
-                                    'total_posts': 0,
-                                    'posts': [],
-                                    'message': 'Trend scanner returned text response',
-                                    'raw_response': raw_result[:500]  # Truncate long responses
-                                }
-                        except json.JSONDecodeError:
-                            logger.error("Failed to parse JSON from string result")
-                            trend_results = {
-                                'total_posts': 0,
-                                'posts': [],
-                                'error': 'Failed to parse trend scanner response',
-                                'raw_response': raw_result[:500]
-                            }
-                    else:
-                        logger.error(f"Unexpected result type: {type(raw_result)}")
-                        trend_results = {
-                            'total_posts': 0,
-                            'posts': [],
-                            'error': f'Unexpected result type: {type(raw_result)}',
-                            'raw_response': str(raw_result)[:500]
-                        }
-                    break
+            result = self._results_by_role(trend_workflow).get('Trend Scanning Coordinator')
+            if result:
+                raw_result = result.get('result')
+                
+                # The scan tool returns a dict, and the Gemini fallback returns schema-validated JSON;
+                # anything else is an execution error message
+                if isinstance(raw_result, dict):
+                    trend_results = raw_result
+                else:
+                    logger.error(f"Trend scanner returned no structured result: {str(raw_result)[:200]}...")
+                    trend_results = {
+                        'total_posts': 0,
+                        'posts': [],
+                        'error': result.get('error', f'Unexpected result type: {type(raw_result)}'),
+                        'raw_response': _compact(str(raw_result))
+                    }
             
             if not trend_results or not trend_results.get('posts'):
                 logger.warning("No trend results found for claim verification")
@@ -626,78 +971,66 @@ class OrchestratorAgent:
             posts = trend_results.get('posts', [])
             logger.info(f"Found {len(posts)} posts from trend scanner, preparing for verification...")
             
-            # Step 2: Prepare content data for claim verification
-            content_data = []
-            for i, post in enumerate(posts):
-                claim_text = post.get('claim', '')
-                if claim_text and claim_text != 'No specific claim identified':
-                    content_item = {
-                        'title': f"Claim: {claim_text}",
-                        'content': post.get('summary', ''),
-                        'source': post.get('Post_link', ''),
-                        'platform': post.get('platform', 'reddit'),
-                        'claim_metadata': {
-                            'post_index': i,
-                            'extracted_claim': claim_text
-                        },
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    content_data.append(content_item)
-            
-            logger.info(f"Prepared {len(content_data)} claims for verification")
+            # Step 2: Stream content items for claim verification, verifying each distinct claim once
+            claim_post_indices = {}  # normalized claim -> indices of every post making it
+            content_stream = self._iter_content_items(posts, claim_post_indices)
+            first_item = next(content_stream, None)
             
             # Step 3: Execute claim verification with actual content data
             verification_results = None
             verified_claims_for_explanation = []
             
-            if content_data:
+            if first_item is not None:
                 verification_task = {
                     'agent': 'verifier_coordinator',
                     'task': 'Verify extracted claims using comprehensive fact-checking workflow',
                     'context': {
                         'verification_mode': 'comprehensive',
                         'use_google_search': True,
-                        'content_data': content_data  # Pass the actual content data
+                        # Items are prepared lazily while earlier ones are being verified
+                        'content_data': chain([first_item], content_stream)
                     }
                 }
                 
                 logger.info("Step 2: Executing claim verification with batch processing...")
                 verification_workflow = await self.google_agents.execute_workflow([verification_task])
                 
+                duplicate_posts = sum(len(indices) - 1 for indices in claim_post_indices.values())
+                logger.info(f"Verified {len(claim_post_indices)} distinct claims ({duplicate_posts} duplicate posts share a claim)")
+                
                 # Extract verification results
-                for result in verification_workflow.get('workflow_results', []):
-                    if 'Claim Verification' in result.get('agent_role', ''):
-                        raw_verification = result.get('result')
+                result = self._results_by_role(verification_workflow).get('Claim Verification Coordinator')
+                if result:
+                    raw_verification = result.get('result')
+                    
+                    # Handle different verification result types
+                    if isinstance(raw_verification, dict):
+                        verification_results = raw_verification
                         
-                        # Handle different verification result types
-                        if isinstance(raw_verification, dict):
-                            verification_results = raw_verification
-                            
-                            # Extract verified claims for explanation generation
-                            if verification_results.get('success') and 'verified_claims' in verification_results:
-                                verified_claims_for_explanation = verification_results['verified_claims']
-                                logger.info(f"Extracted {len(verified_claims_for_explanation)} verified claims for explanation generation")
-                            
-                        elif isinstance(raw_verification, str):
-                            logger.warning(f"Verification returned string result: {raw_verification[:200]}...")
-                            # Create a structured response from string
-                            verification_results = {
-                                'success': True,
-                                'message': 'Verification completed with text response',
-                                'workflow_results': [],
-                                'verified_claims': [],
-                                'raw_response': raw_verification[:500]
-                            }
-                        else:
-                            logger.error(f"Unexpected verification result type: {type(raw_verification)}")
-                            verification_results = {
-                                'success': False,
-                                'message': f'Unexpected verification result type: {type(raw_verification)}',
-                                'workflow_results': [],
-                                'verified_claims': [],
-                                'error': str(raw_verification)[:500]
-                            }
-                        break
+                        # Extract verified claims for explanation generation
+                        if verification_results.get('success') and 'verified_claims' in verification_results:
+                            verified_claims_for_explanation = verification_results['verified_claims']
+                            logger.info(f"Extracted {len(verified_claims_for_explanation)} verified claims for explanation generation")
+                        
+                    elif isinstance(raw_verification, str):
+                        logger.warning(f"Verification returned string result: {raw_verification[:200]}...")
+                        # Create a structured response from string
+                        verification_results = {
+                            'success': True,
+                            'message': 'Verification completed with text response',
+                            'workflow_results': [],
+                            'verified_claims': [],
+                            'raw_response': _compact(raw_verification)
+                        }
+                    else:
+                        logger.error(f"Unexpected verification result type: {type(raw_verification)}")
+                        verification_results = {
+                            'success': False,
+                            'message': f'Unexpected verification result type: {type(raw_verification)}',
+                            'workflow_results': [],
+                            'verified_claims': [],
+                            'error': str(raw_verification)[:500]
+                        }
             
             # Step 4: Execute explanation generation for misinformation claims
             explanation_results = None
@@ -736,31 +1069,30 @@ class OrchestratorAgent:
                     explanation_workflow = await self.google_agents.execute_workflow([explanation_task])
                     
                     # Extract explanation results
-                    for result in explanation_workflow.get('workflow_results', []):
-                        if 'Explanation Generation' in result.get('agent_role', ''):
-                            raw_explanation = result.get('result')
-                            
-                            # Handle different explanation result types
-                            if isinstance(raw_explanation, dict):
-                                explanation_results = raw_explanation
-                                logger.info(f"Explanation generation completed: {explanation_results.get('success', False)}")
-                            elif isinstance(raw_explanation, str):
-                                logger.warning(f"Explanation returned string result: {raw_explanation[:200]}...")
-                                explanation_results = {
-                                    'success': True,
-                                    'message': 'Explanation generation returned text response',
-                                    'debunk_posts': [],
-                                    'raw_response': raw_explanation[:500]
-                                }
-                            else:
-                                logger.error(f"Unexpected explanation result type: {type(raw_explanation)}")
-                                explanation_results = {
-                                    'success': False,
-                                    'message': f'Unexpected explanation result type: {type(raw_explanation)}',
-                                    'debunk_posts': [],
-                                    'error': str(raw_explanation)[:500]
-                                }
-                            break
+                    result = self._results_by_role(explanation_workflow).get('Explanation Generation Coordinator')
+                    if result:
+                        raw_explanation = result.get('result')
+                        
+                        # Handle different explanation result types
+                        if isinstance(raw_explanation, dict):
+                            explanation_results = raw_explanation
+                            logger.info(f"Explanation generation completed: {explanation_results.get('success', False)}")
+                        elif isinstance(raw_explanation, str):
+                            logger.warning(f"Explanation returned string result: {raw_explanation[:200]}...")
+                            explanation_results = {
+                                'success': True,
+                                'message': 'Explanation generation returned text response',
+                                'debunk_posts': [],
+                                'raw_response': _compact(raw_explanation)
+                            }
+                        else:
+                            logger.error(f"Unexpected explanation result type: {type(raw_explanation)}")
+                            explanation_results = {
+                                'success': False,
+                                'message': f'Unexpected explanation result type: {type(raw_explanation)}',
+                                'debunk_posts': [],
+                                'error': str(raw_explanation)[:500]
+                            }
                 else:
                     logger.info("No misinformation claims found in verification results - no debunk posts needed")
                     explanation_results = {
@@ -793,7 +1125,7 @@ class OrchestratorAgent:
             final_output = self._process_orchestrator_workflow(combined_workflow)
             
             # Save results
-            result_file = self._save_results(final_output)
+            result_file = await asyncio.to_thread(self._save_results, final_output)
             final_output['result_file'] = result_file
             
             logger.info(f"Google Agents orchestrated pipeline with batch processing completed successfully")
@@ -808,8 +1140,48 @@ class OrchestratorAgent:
                 'timestamp': datetime.now().isoformat()
             }
     
+    @staticmethod
+    def _results_by_role(workflow: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Index a workflow's task results by exact agent role (first result wins)"""
+        return {result.get('agent_role'): result for result in reversed(workflow.get('workflow_results', []))}
+    
+    @staticmethod
+    def _iter_content_items(posts: List[TrendPost], claim_post_indices: Dict[str, List[int]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one verification content item per distinct claim in the posts
+        
+        Args:
+            posts: Trend scanner posts
+            claim_post_indices: Filled with normalized claim -> indices of every post making it; the lists
+                are shared with the yielded items' claim_metadata, so duplicates found later still register
+        """
+        prepared_at = datetime.now().isoformat()
+        for i, post in enumerate(posts):
+            claim_text = post.get('claim', '')
+            if claim_text and claim_text != 'No specific claim identified':
+                normalized_claim = _NON_WORD_RE.sub(' ', claim_text.lower()).strip()
+                if normalized_claim in claim_post_indices:
+                    claim_post_indices[normalized_claim].append(i)
+                    continue
+                claim_post_indices[normalized_claim] = [i]
+                
+                yield {
+                    'title': f"Claim: {claim_text}",
+                    'content': post.get('summary', ''),
+                    'source': post.get('Post_link', ''),
+                    'platform': post.get('platform', 'reddit'),
+                    'claim_metadata': {
+                        'post_index': i,
+                        'post_indices': claim_post_indices[normalized_claim],  # Filled in as duplicates appear
+                        'extracted_claim': claim_text
+                    },
+                    'timestamp': prepared_at
+                }
+    
     def _process_orchestrator_workflow(self, workflow_result: Dict[str, Any]) -> Dict[str, Any]:
         """Process Google Agents workflow results into final output with batch processing and explanation integration"""
+        # One timestamp for the whole response, success or error
+        now_iso = datetime.now().isoformat()
         try:
             workflow_results = workflow_result.get('workflow_results', [])
             
@@ -818,97 +1190,98 @@ class OrchestratorAgent:
             verification_results = None
             explanation_results = None
             
-            for result in workflow_results:
-                agent_role = result.get('agent_role', '')
+            by_role = self._results_by_role(workflow_result)
+            result = by_role.get('Trend Scanning Coordinator')
+            if result:
+                raw_trend_result = result.get('result')
                 
-                if 'Trend Scanning' in agent_role:
-                    raw_trend_result = result.get('result')
-                    
-                    # Handle different trend result types
-                    if isinstance(raw_trend_result, dict):
-                        trend_results = raw_trend_result
-                        if 'posts' in trend_results:
-                            logger.info(f"Trend scanning completed: {len(trend_results.get('posts', []))} posts")
-                    elif isinstance(raw_trend_result, str):
-                        logger.warning(f"Trend result is string: {raw_trend_result[:100]}...")
-                        trend_results = {
-                            'posts': [],
-                            'total_posts': 0,
-                            'message': 'Trend scanner returned text response',
-                            'raw_response': raw_trend_result[:500]
-                        }
-                    else:
-                        logger.error(f"Unexpected trend result type: {type(raw_trend_result)}")
-                        trend_results = {
-                            'posts': [],
-                            'total_posts': 0,
-                            'error': f'Unexpected result type: {type(raw_trend_result)}'
-                        }
+                # Handle different trend result types
+                if isinstance(raw_trend_result, dict):
+                    trend_results = raw_trend_result
+                    if 'posts' in trend_results:
+                        logger.info(f"Trend scanning completed: {len(trend_results.get('posts', []))} posts")
+                elif isinstance(raw_trend_result, str):
+                    logger.warning(f"Trend result is string: {raw_trend_result[:100]}...")
+                    trend_results = {
+                        'posts': [],
+                        'total_posts': 0,
+                        'message': 'Trend scanner returned text response',
+                        'raw_response': _compact(raw_trend_result)
+                    }
+                else:
+                    logger.error(f"Unexpected trend result type: {type(raw_trend_result)}")
+                    trend_results = {
+                        'posts': [],
+                        'total_posts': 0,
+                        'error': f'Unexpected result type: {type(raw_trend_result)}'
+                    }
+            
+            result = by_role.get('Claim Verification Coordinator')
+            if result:
+                raw_verification_result = result.get('result')
                 
-                elif 'Claim Verification' in agent_role:
-                    raw_verification_result = result.get('result')
+                # Handle different verification result types
+                if isinstance(raw_verification_result, dict):
+                    verification_results = raw_verification_result
+                    logger.info(f"Claim verification completed: {verification_results.get('success', False)}")
                     
-                    # Handle different verification result types
-                    if isinstance(raw_verification_result, dict):
-                        verification_results = raw_verification_result
-                        logger.info(f"Claim verification completed: {verification_results.get('success', False)}")
-                        
-                        # Log batch processing info if available
-                        batch_info = verification_results.get('batch_processing', {})
-                        if batch_info.get('enabled'):
-                            logger.info(f"Batch verification processed {batch_info.get('total_claims', 0)} claims in batches of {batch_info.get('batch_size', 0)}")
-                        
-                    elif isinstance(raw_verification_result, str):
-                        logger.warning(f"Verification result is string: {raw_verification_result[:100]}...")
-                        verification_results = {
-                            'success': True,
-                            'message': 'Verification returned text response',
-                            'workflow_results': [],
-                            'verified_claims': [],
-                            'raw_response': raw_verification_result[:500]
-                        }
-                    else:
-                        logger.error(f"Unexpected verification result type: {type(raw_verification_result)}")
-                        verification_results = {
-                            'success': False,
-                            'error': f'Unexpected result type: {type(raw_verification_result)}',
-                            'workflow_results': [],
-                            'verified_claims': []
-                        }
+                    # Log batch processing info if available
+                    batch_info = verification_results.get('batch_processing', {})
+                    if batch_info.get('enabled'):
+                        logger.info(f"Batch verification processed {batch_info.get('total_claims', 0)} claims in batches of {batch_info.get('batch_size', 0)}")
+                    
+                elif isinstance(raw_verification_result, str):
+                    logger.warning(f"Verification result is string: {raw_verification_result[:100]}...")
+                    verification_results = {
+                        'success': True,
+                        'message': 'Verification returned text response',
+                        'workflow_results': [],
+                        'verified_claims': [],
+                        'raw_response': _compact(raw_verification_result)
+                    }
+                else:
+                    logger.error(f"Unexpected verification result type: {type(raw_verification_result)}")
+                    verification_results = {
+                        'success': False,
+                        'error': f'Unexpected result type: {type(raw_verification_result)}',
+                        'workflow_results': [],
+                        'verified_claims': []
+                    }
+            
+            result = by_role.get('Explanation Generation Coordinator')
+            if result:
+                raw_explanation_result = result.get('result')
                 
-                elif 'Explanation Generation' in agent_role:
-                    raw_explanation_result = result.get('result')
+                # Handle different explanation result types
+                if isinstance(raw_explanation_result, dict):
+                    explanation_results = raw_explanation_result
+                    logger.info(f"Explanation generation completed: {explanation_results.get('success', False)}")
                     
-                    # Handle different explanation result types
-                    if isinstance(raw_explanation_result, dict):
-                        explanation_results = raw_explanation_result
-                        logger.info(f"Explanation generation completed: {explanation_results.get('success', False)}")
-                        
-                        # Log batch processing info if available
-                        batch_info = explanation_results.get('batch_processing', {})
-                        if batch_info.get('enabled'):
-                            logger.info(f"Batch explanation generation processed {batch_info.get('total_claims', 0)} claims in batches of {batch_info.get('batch_size', 0)}")
-                        
-                        # Log debunk posts created
-                        debunk_posts = explanation_results.get('debunk_posts', [])
-                        if debunk_posts:
-                            logger.info(f"Successfully created {len(debunk_posts)} debunk posts")
-                        
-                    elif isinstance(raw_explanation_result, str):
-                        logger.warning(f"Explanation result is string: {raw_explanation_result[:100]}...")
-                        explanation_results = {
-                            'success': True,
-                            'message': 'Explanation generation returned text response',
-                            'debunk_posts': [],
-                            'raw_response': raw_explanation_result[:500]
-                        }
-                    else:
-                        logger.error(f"Unexpected explanation result type: {type(raw_explanation_result)}")
-                        explanation_results = {
-                            'success': False,
-                            'error': f'Unexpected result type: {type(raw_explanation_result)}',
-                            'debunk_posts': []
-                        }
+                    # Log batch processing info if available
+                    batch_info = explanation_results.get('batch_processing', {})
+                    if batch_info.get('enabled'):
+                        logger.info(f"Batch explanation generation processed {batch_info.get('total_claims', 0)} claims in batches of {batch_info.get('batch_size', 0)}")
+                    
+                    # Log debunk posts created
+                    debunk_posts = explanation_results.get('debunk_posts', [])
+                    if debunk_posts:
+                        logger.info(f"Successfully created {len(debunk_posts)} debunk posts")
+                    
+                elif isinstance(raw_explanation_result, str):
+                    logger.warning(f"Explanation result is string: {raw_explanation_result[:100]}...")
+                    explanation_results = {
+                        'success': True,
+                        'message': 'Explanation generation returned text response',
+                        'debunk_posts': [],
+                        'raw_response': _compact(raw_explanation_result)
+                    }
+                else:
+                    logger.error(f"Unexpected explanation result type: {type(raw_explanation_result)}")
+                    explanation_results = {
+                        'success': False,
+                        'error': f'Unexpected result type: {type(raw_explanation_result)}',
+                        'debunk_posts': []
+                    }
             
             # Process actual verification results
             final_posts = []
@@ -922,66 +1295,66 @@ class OrchestratorAgent:
             if trend_results and isinstance(trend_results, dict):
                 posts = trend_results.get('posts', [])
                 
-                # Extract actual verification data if available
+                # verification_results is None or a dict (every branch above normalizes it); read its status once
+                verification_success = bool(verification_results and verification_results.get('success'))
+                
+                # Extract actual verification data if available; skipped entirely when there is nothing to merge
                 verification_data = {}
-                if verification_results and isinstance(verification_results, dict):
-                    if verification_results.get('success'):
-                        # Check if we have workflow results with verified claims
-                        workflow_res = verification_results.get('workflow_results', [])
-                        for workflow_item in workflow_res:
-                            if workflow_item.get('task') == 'verify_claims':
-                                verified_claims = workflow_item.get('result', {}).get('verified_claims', [])
-                                for claim in verified_claims:
-                                    source_content = claim.get('source_content', {})
-                                    claim_metadata = source_content.get('claim_metadata', {})
-                                    post_index = claim_metadata.get('post_index')
-                                    if post_index is not None:
-                                        verification_data[post_index] = claim.get('verification', {})
+                if verification_results and (verification_success or 'verified_claims' in verification_results):
+                    if verification_success:
+                        # Check if we have workflow results with verified claims, fanning each verdict
+                        # out to every post that made the same claim
+                        verification_data = {
+                            index: claim.get('verification', {})
+                            for workflow_item in verification_results.get('workflow_results', [])
+                            if workflow_item.get('task') == 'verify_claims'
+                            for claim in workflow_item.get('result', {}).get('verified_claims', [])
+                            for claim_metadata in [claim.get('source_content', {}).get('claim_metadata', {})]
+                            if claim_metadata.get('post_index') is not None
+                            for index in claim_metadata.get('post_indices', [claim_metadata['post_index']])
+                        }
                     
-                    # Also check for direct verification results in the response
+                    # Also check for direct verification results in the response; error entries carry no
+                    # claim metadata and are skipped rather than pinned to whichever post shares their list position
                     if 'verified_claims' in verification_results:
-                        for i, claim in enumerate(verification_results['verified_claims']):
-                            verification_data[i] = claim.get('verification', {})
+                        verification_data |= {
+                            index: claim.get('verification', {})
+                            for claim in verification_results['verified_claims']
+                            for claim_metadata in [claim.get('claim_metadata') or {}]
+                            if claim_metadata.get('post_index') is not None or claim_metadata.get('post_indices')
+                            for index in claim_metadata.get('post_indices') or [claim_metadata['post_index']]
+                        }
+                
+                # Posts without their own verification data share one default, chosen by whether
+                # verification was attempted and succeeded
+                if not verification_results:
+                    default_verification = _VERIFICATION_NOT_PERFORMED
+                elif verification_success:
+                    default_verification = _VERIFICATION_BATCH_COMPLETED
+                else:
+                    default_verification = {
+                        'verified': False,
+                        'verdict': 'verification_failed', 
+                        'message': verification_results.get('message', 'Verification process encountered an error'),
+                        'error': verification_results.get('error', 'Unknown error'),
+                        'batch_processed': False
+                    }
+                
+                # Verified claims are deduplicated and finish out of post order, so they are matched to posts
+                # through their post indices, never by list position; without any, every post takes the default
+                post_verifications = map(verification_data.get, range(len(posts))) if verification_data else repeat(None)
                 
                 # Create final posts with actual verification data and batch processing info
-                for i, post in enumerate(posts):
-                    verification_info = verification_data.get(i, {})
-                    
-                    # If no verification data found, check if verification was attempted
-                    if not verification_info and verification_results:
-                        if verification_results.get('success'):
-                            verification_info = {
-                                'verified': True,
-                                'verdict': 'verification_completed',
-                                'message': 'Claim processed through Google Agents batch fact-checking workflow',
-                                'confidence': 'medium',
-                                'sources_checked': True,
-                                'batch_processed': True
-                            }
-                        else:
-                            verification_info = {
-                                'verified': False,
-                                'verdict': 'verification_failed', 
-                                'message': verification_results.get('message', 'Verification process encountered an error'),
-                                'error': verification_results.get('error', 'Unknown error'),
-                                'batch_processed': False
-                            }
-                    elif not verification_info:
-                        verification_info = {
-                            'verified': False,
-                            'verdict': 'not_verified',
-                            'message': 'No verification was performed for this claim',
-                            'batch_processed': False
-                        }
-                    
-                    final_post = {
+                final_posts = [
+                    {
                         'claim': post.get('claim', ''),
                         'summary': post.get('summary', ''),
                         'platform': post.get('platform', 'reddit'),
                         'Post_link': post.get('Post_link', ''),
-                        'verification': verification_info
+                        'verification': verification or default_verification
                     }
-                    final_posts.append(final_post)
+                    for post, verification in zip(posts, post_verifications)
+                ]
             
             # Combine batch processing metadata
             batch_metadata = {
@@ -1004,7 +1377,7 @@ class OrchestratorAgent:
                     'batch_optimization_enabled': True
                 },
                 'google_agents_workflow': workflow_result,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
             
         except Exception as e:
@@ -1013,27 +1386,28 @@ class OrchestratorAgent:
                 'success': False,
                 'message': f'Workflow processing failed: {str(e)}',
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
     
     def _save_results(self, results: Dict[str, Any]) -> str:
         """Save Google Agents orchestrator results to file"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            saved_at = datetime.now()
+            timestamp = saved_at.strftime('%Y%m%d_%H%M%S')
             filename = f"google_agents_orchestrator_results_{timestamp}.json"
             filepath = os.path.join(self.results_dir, filename)
             
             # Add Google Agents metadata
             results['google_agents_metadata'] = {
                 'session_id': self.session_id,
-                'created_at': datetime.now().isoformat(),
+                'created_at': saved_at.isoformat(),
                 'version': '2.0.0',
                 'orchestration_type': 'google_agents_sdk',
-                'agents_used': list(self.google_agents.agents.keys()) if self.google_agents and hasattr(self.google_agents, 'agents') else []
+                'agents_used': list(self.agent_names)
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Google Agents results saved to: {filepath}")
             return filepath
@@ -1047,21 +1421,29 @@ class OrchestratorAgent:
         try:
             session_files = []
             if os.path.exists(self.results_dir):
-                for filename in os.listdir(self.results_dir):
-                    if filename.endswith('.json') and self.session_id.split('_')[-2:] == filename.split('_')[-2:-1]:
-                        filepath = os.path.join(self.results_dir, filename)
-                        session_files.append({
-                            'filename': filename,
-                            'filepath': filepath,
-                            'created_at': os.path.getctime(filepath)
-                        })
+                with os.scandir(self.results_dir) as entries:
+                    for entry in entries:
+                        # Files last written before this session started cannot belong to it, so skip parsing them
+                        if not entry.name.endswith('.json') or entry.stat().st_mtime < self._session_start_ts:
+                            continue
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                data = orjson.loads(f.read())
+                        except (OSError, orjson.JSONDecodeError):
+                            continue
+                        if isinstance(data, dict) and data.get('google_agents_metadata', {}).get('session_id') == self.session_id:
+                            session_files.append({
+                                'filename': entry.name,
+                                'filepath': entry.path,
+                                'created_at': entry.stat().st_ctime
+                            })
             
             return {
                 'session_id': self.session_id,
                 'session_files': session_files,
                 'google_agents_initialized': self.google_agents is not None,
                 'claim_verifier_initialized': self.claim_verifier is not None,
-                'agents_registered': list(self.google_agents.agents.keys()) if self.google_agents and hasattr(self.google_agents, 'agents') else [],
+                'agents_registered': list(self.agent_names),
                 'results_directory': self.results_dir,
                 'orchestration_type': 'google_agents_sdk'
             }
@@ -1088,7 +1470,7 @@ async def run_google_agents_orchestrator():
         return 1
     
     print("✅ Google Agents orchestrator initialized successfully")
-    print(f"🤖 Active agents: {list(orchestrator.google_agents.agents.keys())}")
+    print(f"🤖 Active agents: {list(orchestrator.agent_names)}")
     
     # Run full pipeline with Google Agents
     print("\n🔄 Running Google Agents coordinated pipeline...")
@@ -1111,40 +1493,45 @@ async def run_google_agents_orchestrator():
         print("-" * 50)
         
         for i, post in enumerate(final_output[:3], 1):  # Show first 3
-            print(f"\n{i}. Claim: {post.get('claim', 'Unknown')[:80]}...")
-            print(f"   Platform: {post.get('platform', 'unknown')}")
-            
             verification = post.get('verification', {})
-            print(f"   Verification: {verification.get('verdict', 'not_verified')}")
-            if verification.get('message'):
-                print(f"   Verdict: {verification['message'][:100]}...")
+            message = verification.get('message')
+            lines = [
+                f"\n{i}. Claim: {post.get('claim', 'Unknown')[:80]}...",
+                f"   Platform: {post.get('platform', 'unknown')}",
+                f"   Verification: {verification.get('verdict', 'not_verified')}"
+            ]
+            if message:
+                lines.append(f"   Verdict: {message[:100]}...")
             
             # Show Google Agents processing info
-            details = verification.get('details', {})
-            if details.get('processing_method') == 'google_agents_orchestration':
-                print(f"   🤖 Processed via: Google Agents SDK")
+            if verification.get('details', {}).get('processing_method') == 'google_agents_orchestration':
+                lines.append("   🤖 Processed via: Google Agents SDK")
+            print("\n".join(lines))
         
         if len(final_output) > 3:
             print(f"\n... and {len(final_output) - 3} more posts")
         
-        # Output the final JSON with Google Agents metadata
-        print(f"\n📄 FINAL JSON OUTPUT (Google Agents SDK):")
-        print("-" * 50)
-        
-        output_json = {
-            "timestamp": result.get('timestamp'),
-            "total_posts": len(final_output),
-            "orchestration_type": "google_agents_sdk",
-            "workflow_metadata": {
-                "agents_used": list(orchestrator.google_agents.agents.keys()),
-                "workflow_id": result.get('google_agents_workflow', {}).get('workflow_id', ''),
-                "tasks_completed": result.get('google_agents_workflow', {}).get('completed_tasks', 0),
-                "total_tasks": result.get('google_agents_workflow', {}).get('total_tasks', 0)
-            },
-            "posts": final_output
-        }
-        
-        print(json.dumps(output_json, indent=2, ensure_ascii=False))
+        # The full JSON (every post, pretty-printed) is already in the result file; only echo it on request
+        if os.getenv('ORCH_VERBOSE'):
+            print(f"\n📄 FINAL JSON OUTPUT (Google Agents SDK):")
+            print("-" * 50)
+            
+            output_json = {
+                "timestamp": result.get('timestamp'),
+                "total_posts": len(final_output),
+                "orchestration_type": "google_agents_sdk",
+                "workflow_metadata": {
+                    "agents_used": list(orchestrator.agent_names),
+                    "workflow_id": result.get('google_agents_workflow', {}).get('workflow_id', ''),
+                    "tasks_completed": result.get('google_agents_workflow', {}).get('completed_tasks', 0),
+                    "total_tasks": result.get('google_agents_workflow', {}).get('total_tasks', 0)
+                },
+                "posts": final_output
+            }
+            
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(output_json, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
         
         print(f"\n💾 Detailed Google Agents results saved to: {result.get('result_file', 'N/A')}")
         
@@ -1156,6 +1543,45 @@ async def run_google_agents_orchestrator():
     return 0 if result['success'] else 1
 
 
+def start_logging() -> None:
+    """Log to the console and orchestrator.log, with the file written by a background listener so disk writes never block the event loop"""
+    # Only entry points call this, so importing the module starts no thread and attaches no handlers
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('orchestrator.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    # The file handler applies the full format; the queue side only renders the message
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # trend_scanner_agent configures the root logger when imported, which turns basicConfig into a no-op,
+    # so the queue handler is attached to the root logger directly
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    logging.getLogger().addHandler(queue_handler)
+
+
+def use_uvloop() -> None:
+    """Switch asyncio to uvloop's faster event loop where it is installed (it has no Windows build)"""
+    # Only entry points call this, so importing the module leaves the host's event loop policy alone
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
 if __name__ == "__main__":
     import sys
+    start_logging()
+    use_uvloop()
     sys.exit(asyncio.run(run_google_agents_orchestrator()))
\ No newline at end of file
@@ -7,7 +7,7 @@ import os
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from orchestrator_agent import run_google_agents_orchestrator
+from orchestrator_agent import run_google_agents_orchestrator, start_logging, use_uvloop
 
 def main():
     """Main launcher for Google Agents SDK pipeline"""
@@ -19,6 +19,8 @@ def main():
     
     try:
         # Run the orchestrator
+        start_logging()
+        use_uvloop()
         exit_code = asyncio.run(run_google_agents_orchestrator())
         
         if exit_code == 0:
@@ -0,0 +1,173 @@
+"""Unit tests for orchestrator workflow plumbing that runs without Gemini, Reddit or fact-check APIs"""
+
+import asyncio
+
+import orchestrator_agent as oa
+
+
+def make_agent() -> oa.GoogleAgent:
+    agent = oa.GoogleAgent.__new__(oa.GoogleAgent)
+    agent.role = 'Claim Verifier'
+    return agent
+
+
+def claim(index: int) -> dict:
+    return {'title': f'Claim: claim {index}', 'claim_metadata': {'post_index': index, 'post_indices': [index]}}
+
+
+class FlakyVerifier:
+    """verify_content stand-in whose batches containing a poisoned post raise"""
+
+    def __init__(self, poisoned: int):
+        self.poisoned = poisoned
+
+    async def verify_content(self, batch):
+        await asyncio.sleep(0)
+        if any(item['claim_metadata']['post_index'] == self.poisoned for item in batch):
+            raise RuntimeError('fact-check API unavailable')
+        return {
+            'success': True,
+            'verified_claims': [
+                {'claim_text': item['title'], 'verification': {'verified': True}, 'claim_metadata': item['claim_metadata']}
+                for item in batch
+            ]
+        }
+
+
+def test_verify_tool_keeps_every_consumed_claim_when_a_batch_fails():
+    content = (claim(i) for i in range(40))
+    result = asyncio.run(make_agent()._run_verify_tool(FlakyVerifier(poisoned=7), {'content_data': content}))
+
+    by_post = {c['claim_metadata']['post_index']: c['verification'] for c in result['verified_claims']}
+    assert sorted(by_post) == list(range(40))
+    assert by_post[7]['verdict'] == 'error'
+    assert result['errors']
+
+
+def test_verify_tool_reports_a_failing_content_stream_instead_of_raising():
+    def content():
+        yield claim(0)
+        yield claim(1)
+        raise ValueError('bad post')
+
+    result = asyncio.run(make_agent()._run_verify_tool(FlakyVerifier(poisoned=-1), {'content_data': content()}))
+
+    assert sorted(c['claim_metadata']['post_index'] for c in result['verified_claims']) == [0, 1]
+    assert any('Content stream failed' in error for error in result['errors'])
+
+
+class RecordingAgent:
+    """Agent stand-in that records the context each task received"""
+
+    def __init__(self, role: str):
+        self.role = role
+        self.contexts = []
+
+    async def execute_task(self, task_description, context=None):
+        self.contexts.append(dict(context))
+        return {'agent_role': self.role, 'task': task_description, 'result': f'{self.role}:{task_description}'}
+
+
+def make_orchestrator(*agent_names: str) -> oa.GoogleAgentsOrchestrator:
+    orchestrator = oa.GoogleAgentsOrchestrator.__new__(oa.GoogleAgentsOrchestrator)
+    orchestrator.agents = {name: RecordingAgent(name) for name in agent_names}
+    orchestrator.workflow_history = oa.deque(maxlen=8)
+    orchestrator._inflight = {}
+    return orchestrator
+
+
+def test_schedule_groups_independent_tasks_into_waves():
+    tasks = [
+        {'id': 'scan_a', 'agent': 'scanner', 'task': 'scan a'},
+        {'id': 'scan_b', 'agent': 'scanner', 'task': 'scan b'},
+        {'id': 'verify', 'agent': 'verifier', 'task': 'verify', 'depends_on': ['scan_a', 'scan_b']},
+        {'id': 'explain', 'agent': 'explainer', 'task': 'explain', 'depends_on': ['verify']},
+        {'id': 'audit', 'agent': 'auditor', 'task': 'audit', 'depends_on': ['scan_a']},
+    ]
+    assert make_orchestrator()._schedule(tasks) == [[0, 1], [2, 4], [3]]
+
+
+def test_schedule_without_depends_on_waits_only_for_empty_result_references():
+    tasks = [
+        {'agent': 'scanner', 'task': 'scan'},
+        {'agent': 'writer', 'task': 'write', 'context': {'last_result': {'given': True}}},
+        {'agent': 'verifier', 'task': 'verify', 'context': {'last_result': None}},
+    ]
+    assert make_orchestrator()._schedule(tasks) == [[0, 1], [2]]
+
+
+def test_schedule_rejects_duplicate_ids_unknown_dependencies_and_cycles():
+    orchestrator = make_orchestrator()
+    invalid_workflows = [
+        [{'id': 'a', 'task': 'x'}, {'id': 'a', 'task': 'y'}],
+        [{'id': 'a', 'task': 'x', 'depends_on': ['missing']}],
+        [{'id': 'a', 'task': 'x', 'depends_on': ['b']}, {'id': 'b', 'task': 'y', 'depends_on': ['a']}],
+    ]
+    for tasks in invalid_workflows:
+        try:
+            orchestrator._schedule(tasks)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for {tasks}")
+
+
+def test_workflow_fills_only_empty_references_and_keeps_task_ids_out_of_context():
+    orchestrator = make_orchestrator('scanner', 'verifier', 'writer')
+    supplied = {'given': True}
+    tasks = [
+        {'id': 'scan', 'agent': 'scanner', 'task': 'scan'},
+        {'agent': 'verifier', 'task': 'verify', 'depends_on': ['scan'], 'context': {'scan_result': None}},
+        {'agent': 'writer', 'task': 'write', 'depends_on': ['scan'], 'context': {'last_result': supplied}},
+    ]
+    result = asyncio.run(orchestrator.execute_workflow(tasks))
+    assert result['completed_tasks'] == 3
+
+    verifier_context = orchestrator.agents['verifier'].contexts[0]
+    assert verifier_context['scan_result']['result'] == 'scanner:scan'
+    writer_context = orchestrator.agents['writer'].contexts[0]
+    assert writer_context['last_result'] is supplied
+    assert 'scan' not in writer_context and 'task_0' not in writer_context
+
+
+def test_session_summary_lists_only_this_sessions_result_files(tmp_path):
+    orchestrator = oa.OrchestratorAgent.__new__(oa.OrchestratorAgent)
+    orchestrator.session_id = 'orchestrator_session_20250921_235950'
+    orchestrator._session_start_ts = 1_000_000.0
+    orchestrator.results_dir = str(tmp_path)
+    orchestrator.google_agents = orchestrator.claim_verifier = None
+    orchestrator.agent_names = ()
+
+    def write(name, session_id, mtime):
+        path = tmp_path / name
+        path.write_bytes(oa.orjson.dumps({'google_agents_metadata': {'session_id': session_id}}))
+        oa.os.utime(path, (mtime, mtime))
+
+    write('google_agents_orchestrator_results_20250921_120000.json', orchestrator.session_id, 999_000.0)
+    write('google_agents_orchestrator_results_20250921_235955.json', 'orchestrator_session_20250921_235900', 1_000_005.0)
+    write('google_agents_orchestrator_results_20250922_000130.json', orchestrator.session_id, 1_000_100.0)
+    (tmp_path / 'notes.json').write_bytes(b'not json')
+
+    summary = orchestrator.get_session_summary()
+    assert [f['filename'] for f in summary['session_files']] == ['google_agents_orchestrator_results_20250922_000130.json']
+
+
+def test_history_records_a_digest_of_each_result_instead_of_its_id():
+    orchestrator = make_orchestrator()
+    agent = make_agent()
+    agent.history = oa.deque(maxlen=8)
+    agent._record({'agent_role': agent.role, 'task': 'verify', 'result': 'Claim is false', 'timestamp': 't'})
+    agent._record({'agent_role': agent.role, 'task': 'scan', 'result': {'posts': [1, 2]}, 'timestamp': 't'})
+
+    text_entry, tool_entry = agent.history
+    assert text_entry['result_sha256'] == oa.hashlib.sha256(b'Claim is false').hexdigest()
+    assert tool_entry['result_sha256'] == oa._digest({'posts': [1, 2]})
+    assert 'result_id' not in text_entry
+
+    orchestrator._record_workflow({'workflow_id': 'orchestrator_workflow_1', 'total_tasks': 2, 'timestamp': 't'})
+    assert orchestrator.workflow_history[-1]['workflow_id'] == 'orchestrator_workflow_1'
+    assert 'result_id' not in orchestrator.workflow_history[-1]
+
+
+def test_importing_the_module_starts_no_log_listener():
+    assert oa._log_listener is None
+    assert not any(isinstance(h, oa.logging.handlers.QueueHandler) for h in oa.logging.getLogger().handlers)
@@ -7,7 +7,7 @@ Use explicit imports like `from trend_scanner.scraper import WebContentScraper`.
 """
 
 __all__ = [
-    'models', 'scraper', 'tools', 'google_agents'
+    'models', 'scraper', 'disk_cache', 'tools', 'google_agents'
 ]
 
 __version__ = "2.0.0"
@@ -0,0 +1,47 @@
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional
+
+
+class DiskCache:
+    """Persistent TTL key/value store shared by scans (sqlite-backed, survives restarts); values are zlib-compressed"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (namespace TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+
+    def get(self, namespace: str, key: bytes) -> Optional[bytes]:
+        """Return the stored value for key, or None if missing or expired"""
+        return self.get_many(namespace, [key]).get(key)
+
+    def get_many(self, namespace: str, keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+        """Return the unexpired values among keys in a single query"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ','.join('?' * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM entries WHERE namespace = ? AND expires_at > ? AND key IN ({placeholders})",
+                (namespace, time.time(), *keys)
+            ).fetchall()
+        return {bytes(key): zlib.decompress(value) for key, value in rows}
+
+    def set_many(self, namespace: str, items: Dict[bytes, bytes], ttl: float) -> None:
+        """Store values for their keys, replacing any previous entries"""
+        if not items:
+            return
+        expires_at = time.time() + ttl
+        rows = [(namespace, key, zlib.compress(value), expires_at) for key, value in items.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)", rows
+            )
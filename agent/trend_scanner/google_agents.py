@@ -1,14 +1,42 @@
 """Google AI integration for trend scanner with orchestration capabilities"""
 
 import os
+import re
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import google.generativeai as genai
-import json
+import litellm
+import orjson
+import praw
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Subreddit named in a scan task description, e.g. "Scan r/DebunkThis for..."
+_SUBREDDIT_RE = re.compile(r'r/(\w+)')
+
+
+@lru_cache(maxsize=4)
+def _make_reddit(client_id: str, client_secret: str, user_agent: str) -> praw.Reddit:
+    """Read-only Reddit client, shared by every orchestrator using the same credentials"""
+    return praw.Reddit(client_id=client_id, client_secret=client_secret, user_agent=user_agent)
+
+
+def _load_scan_data(value: Any) -> Optional[Dict[str, Any]]:
+    """Reddit scan data from a tool result: dicts are used as-is, JSON text is parsed, anything else is None"""
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, (str, bytes)):
+        return None
+    try:
+        data = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
 
 class GoogleAgent:
     """Individual Google AI agent with specific role and capabilities"""
@@ -29,9 +57,8 @@ class GoogleAgent:
                     if hasattr(tool, '_run') and 'scan' in task_description.lower():
                         # This is likely a Reddit scanning task
                         try:
-                            # Extract subreddit from task description (e.g., "Scan r/DebunkThis for...")
-                            import re
-                            subreddit_match = re.search(r'r/(\w+)', task_description)
+                            # Extract subreddit from task description
+                            subreddit_match = _SUBREDDIT_RE.search(task_description)
                             target_subreddit = subreddit_match.group(1) if subreddit_match else 'worldnews'
                             
                             logger.info(f"Agent {self.role} executing tool scan for r/{target_subreddit}")
@@ -74,96 +101,73 @@ class GoogleAgent:
                     except:
                         safe_context[key] = "<unable to serialize>"
             
+            # Reddit scan data from the previous tool run, parsed once for both prompts below
+            scan_data = None
+            last_result = context.get('last_result') if context else None
+            if isinstance(last_result, dict) and last_result.get('tool_used') and 'result' in last_result:
+                scan_data = _load_scan_data(last_result['result'])
+            
             # Create context-aware prompt with special handling for trending posts
             if safe_context:
-                # Special handling for trending posts data
-                if 'last_result' in safe_context and isinstance(context.get('last_result'), dict):
-                    last_result = context['last_result']
-                    if (last_result.get('tool_used') and 
-                        'result' in last_result and 
-                        isinstance(last_result['result'], str)):
-                        try:
-                            # Try to parse the tool result as JSON (Reddit scan results)
-                            import json
-                            tool_data = json.loads(last_result['result'])
-                            if 'trending_posts' in tool_data:
-                                trending_posts = tool_data['trending_posts']
-                                posts_summary = f"Found {len(trending_posts)} trending posts from Reddit scan:\n"
-                                for i, post in enumerate(trending_posts[:5], 1):  # Show first 5 posts
-                                    posts_summary += f"{i}. '{post.get('title', 'No title')}' (Risk: {post.get('risk_level', 'Unknown')}, Score: {post.get('score', 0)})\n"
-                                if len(trending_posts) > 5:
-                                    posts_summary += f"... and {len(trending_posts) - 5} more posts\n"
-                                context_text = f"Previous Reddit scan results:\n{posts_summary}\nFull data available for analysis."
-                            else:
-                                context_summary = "\n".join([f"- {k}: {v}" for k, v in safe_context.items()])
-                                context_text = f"Context information:\n{context_summary}"
-                        except (json.JSONDecodeError, KeyError):
-                            context_summary = "\n".join([f"- {k}: {v}" for k, v in safe_context.items()])
-                            context_text = f"Context information:\n{context_summary}"
-                    else:
-                        context_summary = "\n".join([f"- {k}: {v}" for k, v in safe_context.items()])
-                        context_text = f"Context information:\n{context_summary}"
+                if scan_data is not None and 'trending_posts' in scan_data:
+                    trending_posts = scan_data['trending_posts']
+                    posts_summary = f"Found {len(trending_posts)} trending posts from Reddit scan:\n"
+                    for i, post in enumerate(trending_posts[:5], 1):  # Show first 5 posts
+                        posts_summary += f"{i}. '{post.get('title', 'No title')}' (Risk: {post.get('risk_level', 'Unknown')}, Score: {post.get('score', 0)})\n"
+                    if len(trending_posts) > 5:
+                        posts_summary += f"... and {len(trending_posts) - 5} more posts\n"
+                    context_text = f"Previous Reddit scan results:\n{posts_summary}\nFull data available for analysis."
                 else:
                     context_summary = "\n".join([f"- {k}: {v}" for k, v in safe_context.items()])
                     context_text = f"Context information:\n{context_summary}"
             else:
                 context_text = "No context provided"
             
-            prompt = f"""
-            You are a {self.role} with the goal: {self.goal}
-            
-            Current task: {task_description}
+            is_assessment = "risk_assessor" in self.role.lower() or "assess" in task_description.lower()
+            assessed_posts = scan_data.get('trending_posts') if is_assessment and scan_data is not None else None
             
-            {context_text}
-            
-            {"IMPORTANT: If you are analyzing trending posts from previous results, make sure to provide specific analysis for each post found. Do not just acknowledge the requirement - actually perform the analysis." if "risk_assessor" in self.role.lower() or "assess" in task_description.lower() else ""}
-            
-            Execute this task thoroughly and provide detailed results.
-            """
+            if assessed_posts:
+                # Special handling for Content Risk Assessor - send the actual trending posts data as compact
+                # JSON in place of the generic prompt, whose response would only be discarded
+                prompt = f"""
+                You are a Content Risk Assessor. Here are the trending posts found by the Reddit scanner:
+                
+                TRENDING POSTS DATA:
+                {orjson.dumps(assessed_posts).decode('utf-8')}
+                
+                Task: {task_description}
+                
+                Analyze each post above and provide:
+                1. Risk level (HIGH/MEDIUM/LOW) with detailed reasoning
+                2. Priority score (1-10) for fact-checking
+                3. Key claims to verify
+                4. Source credibility assessment
+                5. Viral potential analysis
+                6. Recommended actions
+                
+                Provide a structured analysis for each trending post found.
+                """
+                logger.info(f"Content Risk Assessor provided with {len(assessed_posts)} trending posts for detailed analysis")
+            else:
+                if is_assessment and scan_data is not None:
+                    logger.warning("No trending posts found in previous results for Risk Assessor")
+                
+                prompt = f"""
+                You are a {self.role} with the goal: {self.goal}
+                
+                Current task: {task_description}
+                
+                {context_text}
+                
+                {"IMPORTANT: If you are analyzing trending posts from previous results, make sure to provide specific analysis for each post found. Do not just acknowledge the requirement - actually perform the analysis." if is_assessment else ""}
+                
+                Execute this task thoroughly and provide detailed results.
+                """
             
             # Execute with Gemini
             response = self.model.generate_content(prompt)
             response_text = getattr(response, 'text', str(response))
             
-            # Special handling for Content Risk Assessor - provide actual trending posts data
-            if ("risk_assessor" in self.role.lower() or "assess" in task_description.lower()) and context and 'last_result' in context:
-                try:
-                    last_result = context['last_result']
-                    if (last_result.get('tool_used') and 'result' in last_result):
-                        import json
-                        tool_data = json.loads(last_result['result'])
-                        if 'trending_posts' in tool_data and tool_data['trending_posts']:
-                            trending_posts = tool_data['trending_posts']
-                            
-                            # Create detailed analysis prompt with actual data
-                            detailed_prompt = f"""
-                            You are a Content Risk Assessor. Here are the trending posts found by the Reddit scanner:
-                            
-                            TRENDING POSTS DATA:
-                            {json.dumps(trending_posts, indent=2)}
-                            
-                            Task: {task_description}
-                            
-                            Analyze each post above and provide:
-                            1. Risk level (HIGH/MEDIUM/LOW) with detailed reasoning
-                            2. Priority score (1-10) for fact-checking
-                            3. Key claims to verify
-                            4. Source credibility assessment
-                            5. Viral potential analysis
-                            6. Recommended actions
-                            
-                            Provide a structured analysis for each trending post found.
-                            """
-                            
-                            # Re-execute with detailed trending posts data
-                            response = self.model.generate_content(detailed_prompt)
-                            response_text = getattr(response, 'text', str(response))
-                            logger.info(f"Content Risk Assessor provided with {len(trending_posts)} trending posts for detailed analysis")
-                        else:
-                            logger.warning("No trending posts found in previous results for Risk Assessor")
-                except Exception as e:
-                    logger.warning(f"Failed to extract trending posts for Risk Assessor: {e}")
-            
             result = {
                 'agent_role': self.role,
                 'task': task_description,
@@ -270,22 +274,9 @@ class GoogleOrchestrator:
         return final_result
     
     def parallel_workflow(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Execute tasks in parallel (simulated - Gemini doesn't support true async)"""
-        workflow_results = []
-        
+        """Execute independent tasks in parallel on a thread pool (Gemini and tool calls here are blocking)"""
         logger.info(f"Starting parallel workflow with {len(tasks)} tasks")
-        
-        for i, task in enumerate(tasks):
-            agent_name = task['agent']
-            task_description = task['description']
-            
-            if agent_name not in self.agents:
-                raise ValueError(f"Agent '{agent_name}' not found")
-            
-            # Execute task (in parallel simulation)
-            logger.info(f"Executing parallel task {i+1}/{len(tasks)} with agent '{agent_name}'")
-            result = self.agents[agent_name].execute_task(task_description)
-            workflow_results.append(result)
+        workflow_results = self._run_concurrently(tasks)
         
         # Create final workflow summary
         final_result = {
@@ -299,6 +290,37 @@ class GoogleOrchestrator:
         self.workflow_history.append(final_result)
         return final_result
     
+    def _run_concurrently(self, tasks: List[Dict[str, Any]], context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Run tasks on up to AGENT_MAX_WORKERS threads, returning their results in task order"""
+        for task in tasks:
+            if task['agent'] not in self.agents:
+                raise ValueError(f"Agent '{task['agent']}' not found")
+        if not tasks:
+            return []
+        
+        max_workers = min(len(tasks), max(1, int(os.getenv('AGENT_MAX_WORKERS', '4'))))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.agents[task['agent']].execute_task, task['description'], context)
+                for task in tasks
+            ]
+            # A failed task yields an error result, as in sequential_workflow, instead of discarding the others
+            results = []
+            for task, future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Task failed for agent '{task['agent']}': {e}")
+                    results.append({
+                        'agent_role': task['agent'],
+                        'task': task['description'],
+                        'result': f"Task execution failed: {str(e)}",
+                        'has_error': True,
+                        'error_message': str(e),
+                        'timestamp': datetime.now().isoformat()
+                    })
+            return results
+    
     def _create_workflow_summary(self, results: List[Dict[str, Any]]) -> str:
         """Create a summary of workflow execution"""
         try:
@@ -362,12 +384,10 @@ class GoogleAIManager(GoogleOrchestrator):
             tools=[]
         )
         
-        # Define workflow tasks
-        tasks = []
-        
         # Step 1: Scan each subreddit
+        scan_tasks = []
         for subreddit in subreddits:
-            tasks.append({
+            scan_tasks.append({
                 'agent': 'reddit_scanner',
                 'description': f"""
                 Scan r/{subreddit} for trending posts with potential misinformation.
@@ -382,7 +402,7 @@ class GoogleAIManager(GoogleOrchestrator):
             })
         
         # Step 2: Assess and prioritize all findings
-        tasks.append({
+        assessment_task = {
             'agent': 'risk_assessor',
             'description': """
             You are a Content Risk Assessor. Analyze ALL trending posts from the previous Reddit scan.
@@ -401,10 +421,27 @@ class GoogleAIManager(GoogleOrchestrator):
             
             Focus on posts that combine high velocity with questionable content, misinformation patterns, or unverified claims.
             """
-        })
+        }
+        
+        # Subreddit scans are independent and I/O bound (Reddit, scraping, Gemini), so they run concurrently;
+        # the assessment sees the scan results (the last scan as last_result, as in a sequential workflow)
+        logger.info(f"Scanning {len(scan_tasks)} subreddits concurrently")
+        workflow_results = self._run_concurrently(scan_tasks)
+        
+        context = {'previous_results': list(workflow_results), 'last_result': workflow_results[-1]} if workflow_results else {}
+        logger.info("Executing risk assessment over scan results")
+        workflow_results.append(self.agents[assessment_task['agent']].execute_task(assessment_task['description'], context))
+        
+        final_result = {
+            'workflow_type': 'concurrent_scan',
+            'total_tasks': len(scan_tasks) + 1,
+            'results': workflow_results,
+            'summary': self._create_workflow_summary(workflow_results),
+            'timestamp': datetime.now().isoformat()
+        }
         
-        # Execute workflow
-        return self.sequential_workflow(tasks)
+        self.workflow_history.append(final_result)
+        return final_result
 
 
 # Keep the old class name for backward compatibility but redirect to new implementation
@@ -413,10 +450,31 @@ class GoogleAgentsManager(GoogleAIManager):
     pass
 
 
+class _ResponseWrapper:
+    """Minimal LLM response exposing .content, as LangChain-style callers expect"""
+    __slots__ = ('content',)
+    
+    def __init__(self, content: str):
+        self.content = content
+
+
+class SimpleLLMWrapper:
+    """LiteLLM-backed Gemini completion with an invoke(prompt) interface"""
+    
+    def invoke(self, prompt: str) -> _ResponseWrapper:
+        response = litellm.completion(
+            model="gemini/gemini-2.5-flash",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            num_retries=3  # Retries rate-limited/transient failures with backoff
+        )
+        return _ResponseWrapper(response.choices[0].message.content)
+
+
 class TrendScannerOrchestrator:
     """Main orchestrator that replaces CrewAI crew functionality using only Google Agents"""
     
-    def __init__(self, reddit_config: Dict[str, str], gemini_api_key: Optional[str] = None):
+    def __init__(self, reddit_config: Dict[str, str], gemini_api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         gemini_key = gemini_api_key or os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
         if not gemini_key:
             raise ValueError("GEMINI_API_KEY or GOOGLE_API_KEY must be provided")
@@ -430,11 +488,10 @@ class TrendScannerOrchestrator:
             raise
 
         # Initialize Reddit client
-        import praw
-        self.reddit = praw.Reddit(
-            client_id=reddit_config['client_id'],
-            client_secret=reddit_config['client_secret'],
-            user_agent=reddit_config['user_agent']
+        self.reddit = _make_reddit(
+            reddit_config['client_id'],
+            reddit_config['client_secret'],
+            reddit_config['user_agent']
         )
         
         # Test Reddit authentication
@@ -453,32 +510,22 @@ class TrendScannerOrchestrator:
             logger.error(f"Reddit API connection failed: {e}")
 
         # Simple LLM wrapper for backward compatibility
-        class SimpleLLMWrapper:
-            def __init__(self):
-                import litellm
-                self.completion = litellm.completion
-
-            def invoke(self, prompt):
-                response = self.completion(
-                    model="gemini/gemini-2.5-flash",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1
-                )
-                class ResponseWrapper:
-                    def __init__(self, content):
-                        self.content = content
-                return ResponseWrapper(response.choices[0].message.content)
-
         self.llm = SimpleLLMWrapper()
 
         # Reddit tool for Google agents
         from .tools import RedditScanTool
+        # Scraped pages and risk verdicts persist across scans (each scan builds a new orchestrator)
+        cache_path = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache_path = os.path.join(cache_dir, 'trend_scanner_cache.sqlite')
         self.reddit_tool = RedditScanTool(
             self.reddit, 
             self.llm, 
             velocity_threshold=25.0, 
             min_score_threshold=50,
-            google_api_key=gemini_key
+            google_api_key=gemini_key,
+            cache_path=cache_path
         )
 
         # Dynamic subreddit targeting - will be determined from task descriptions
@@ -549,19 +596,19 @@ class TrendScannerOrchestrator:
                     if (result.get('agent_role') == 'Reddit Trend Scout' and 
                         result.get('tool_used', False)):
                         
-                        # Parse the actual tool result (JSON string from RedditScanTool)
-                        try:
-                            scan_data = json.loads(result['result'])
+                        # Use the actual tool result (JSON string from RedditScanTool, or already structured)
+                        scan_data = _load_scan_data(result['result'])
+                        if scan_data is not None:
                             if 'trending_posts' in scan_data:
                                 all_trending_posts.extend(scan_data['trending_posts'])
                                 total_scraped += scan_data.get('scraped_count', 0)
-                                posts_with_scraped_content += len([p for p in scan_data['trending_posts'] if p.get('scraped_content')])
+                                posts_with_scraped_content += sum(1 for p in scan_data['trending_posts'] if p.get('scraped_content'))
                             
                             scan_summaries.append(scan_data.get('scan_summary', 'Scan completed'))
                             logger.info(f"Successfully processed Reddit scan data: {len(scan_data.get('trending_posts', []))} posts found")
                             
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse Reddit scan results: {e}")
+                        else:
+                            logger.error("Failed to parse Reddit scan results")
                             # Try to extract any useful info from the raw result
                             scan_summaries.append(f"Tool execution completed but parsing failed: {str(result['result'])[:100]}")
                     
@@ -587,22 +634,19 @@ class TrendScannerOrchestrator:
                         }
                     
                     direct_result = self.reddit_tool._run(fallback_subreddit)
-                    scan_data = json.loads(direct_result)
+                    scan_data = orjson.loads(direct_result)
                     if 'trending_posts' in scan_data:
                         all_trending_posts.extend(scan_data['trending_posts'])
                         total_scraped += scan_data.get('scraped_count', 0)
-                        posts_with_scraped_content += len([p for p in scan_data['trending_posts'] if p.get('scraped_content')])
+                        posts_with_scraped_content += sum(1 for p in scan_data['trending_posts'] if p.get('scraped_content'))
                         scan_summaries.append("Direct tool execution successful")
                         logger.info(f"Direct tool execution found {len(scan_data['trending_posts'])} posts")
                 except Exception as e:
                     logger.error(f"Direct tool execution failed: {e}")
             
-            # Calculate risk distribution
-            risk_distribution = {
-                'HIGH': len([p for p in all_trending_posts if p.get('risk_level') == 'HIGH']),
-                'MEDIUM': len([p for p in all_trending_posts if p.get('risk_level') == 'MEDIUM']),
-                'LOW': len([p for p in all_trending_posts if p.get('risk_level') == 'LOW'])
-            }
+            # Calculate risk distribution in a single pass
+            risk_counts = Counter(p.get('risk_level') for p in all_trending_posts)
+            risk_distribution = {level: risk_counts[level] for level in ('HIGH', 'MEDIUM', 'LOW')}
             
             # Get assessment from workflow
             risk_assessment = workflow_result.get('summary', 'Google orchestration completed successfully')
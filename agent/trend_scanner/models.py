@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendingPost:
     post_id: str
     title: str
@@ -23,7 +23,7 @@ class TrendingPost:
     content_source: str = "reddit"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchPostData:
     """Data structure for batch processing posts"""
     post_id: str
@@ -39,7 +39,7 @@ class BatchPostData:
     has_external_content: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchRiskAssessment:
     """Result of batch risk assessment"""
     post_id: str
@@ -48,7 +48,7 @@ class BatchRiskAssessment:
     reasoning: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityMetric:
     initial_score: int
     current_score: int
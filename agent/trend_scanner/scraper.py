@@ -1,5 +1,7 @@
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
 from typing import Optional, Tuple
 from bs4 import BeautifulSoup
@@ -9,6 +11,17 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections per host; content extraction runs up to 8 scrapes at once
+HTTP_POOL_SIZE = 16
+
+
+def collapse_whitespace(text: str, limit: int) -> str:
+    """Collapse whitespace runs to single spaces, returning at most limit characters"""
+    # The first limit characters hold at most limit // 2 + 1 words, so stop splitting there
+    # instead of tokenizing the whole page
+    max_words = limit // 2 + 1
+    return ' '.join(text.split(None, max_words)[:max_words])[:limit]
+
 
 class WebContentScraper:
     def __init__(self):
@@ -16,6 +29,11 @@ class WebContentScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0'
         })
+        # Reuse TCP/TLS connections across scrapes and retry transient server errors
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504), allowed_methods=('HEAD', 'GET'))
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.timeout = 10
         self.max_content_length = 10000
 
@@ -52,14 +70,15 @@ class WebContentScraper:
             return None
 
         try:
+            # Parse the page already fetched above rather than letting newspaper download it again
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
             text = f"Title: {article.title}\n\nContent: {article.text}"
             if text and len(text.strip()) > 200:
-                cleaned = ' '.join(text.split())
+                cleaned = collapse_whitespace(text, self.max_content_length)
                 logger.info(f"scraper: newspaper extracted {len(cleaned)} chars from {url}")
-                return cleaned[:self.max_content_length]
+                return cleaned
         except Exception as e:
             logger.debug(f"newspaper extraction failed for {url}: {e}")
 
@@ -67,10 +86,10 @@ class WebContentScraper:
             doc = Document(html)
             summary_html = doc.summary()
             soup = BeautifulSoup(summary_html, 'html.parser')
-            summary_text = ' '.join(soup.get_text(separator=' ').split())
+            summary_text = collapse_whitespace(soup.get_text(separator=' '), self.max_content_length)
             if summary_text and len(summary_text) > 200:
                 logger.info(f"scraper: readability extracted {len(summary_text)} chars from {url}")
-                return summary_text[:self.max_content_length]
+                return summary_text
         except Exception as e:
             logger.debug(f"readability extraction failed for {url}: {e}")
 
@@ -78,10 +97,10 @@ class WebContentScraper:
             soup = BeautifulSoup(html, 'html.parser')
             for tag in soup(["script", "style", "nav", "footer", "aside"]):
                 tag.decompose()
-            body_text = ' '.join(soup.get_text(separator=' ').split())
+            body_text = collapse_whitespace(soup.get_text(separator=' '), self.max_content_length)
             if body_text and len(body_text) > 200:
                 logger.info(f"scraper: bsoup body extracted {len(body_text)} chars from {url}")
-                return body_text[:self.max_content_length]
+                return body_text
         except Exception as e:
             logger.debug(f"BeautifulSoup body extraction failed for {url}: {e}")
 
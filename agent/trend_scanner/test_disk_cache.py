@@ -0,0 +1,51 @@
+"""Unit tests for the sqlite-backed DiskCache"""
+
+import sqlite3
+import zlib
+
+from trend_scanner import disk_cache
+from trend_scanner.disk_cache import DiskCache
+
+
+def test_values_round_trip_and_are_stored_compressed(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = DiskCache(path)
+    page = ('Linked article body. ' * 200).encode('utf-8')
+    cache.set_many('scrape', {b'url-1': page, b'url-2': b''}, ttl=60)
+
+    assert cache.get('scrape', b'url-1') == page
+    assert cache.get('scrape', b'url-2') == b''
+    assert cache.get('scrape', b'missing') is None
+    assert cache.get('risk', b'url-1') is None
+
+    stored = sqlite3.connect(path).execute("SELECT value FROM entries WHERE key = ?", (b'url-1',)).fetchone()[0]
+    assert len(stored) < len(page)
+    assert zlib.decompress(stored) == page
+
+
+def test_get_many_returns_only_present_keys(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.sqlite'))
+    cache.set_many('risk', {b'a': b'1', b'b': b'2'}, ttl=60)
+
+    assert cache.get_many('risk', [b'a', b'b', b'c']) == {b'a': b'1', b'b': b'2'}
+    assert cache.get_many('risk', []) == {}
+
+
+def test_expired_entries_are_hidden_and_purged_on_reopen(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(disk_cache.time, 'time', lambda: clock[0])
+    path = str(tmp_path / 'cache.sqlite')
+    cache = DiskCache(path)
+    cache.set_many('scrape', {b'short': b'x'}, ttl=10)
+    cache.set_many('scrape', {b'long': b'y'}, ttl=100)
+
+    clock[0] += 50
+    assert cache.get_many('scrape', [b'short', b'long']) == {b'long': b'y'}
+
+    # Replacing an entry renews its expiry
+    cache.set_many('scrape', {b'short': b'z'}, ttl=10)
+    assert cache.get('scrape', b'short') == b'z'
+
+    clock[0] += 100
+    DiskCache(path)
+    assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
@@ -0,0 +1,68 @@
+"""Unit tests for concurrent subreddit scanning (Reddit and Gemini are stubbed)"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from trend_scanner.google_agents import GoogleOrchestrator
+from trend_scanner.tools import RedditScanTool
+
+
+class ScanAgent:
+    """execute_task stand-in: later subreddits finish first, and one subreddit's scan raises"""
+
+    def __init__(self, failing: str):
+        self.failing = failing
+
+    def execute_task(self, task_description, context=None):
+        subreddit = task_description.split('r/')[1]
+        time.sleep(0.05 if subreddit == 'first' else 0)
+        if subreddit == self.failing:
+            raise RuntimeError('Reddit listing failed')
+        return {'agent_role': 'scanner', 'task': task_description, 'result': subreddit}
+
+
+def test_concurrent_scans_keep_subreddit_order_and_survive_a_failing_scan():
+    orchestrator = GoogleOrchestrator.__new__(GoogleOrchestrator)
+    orchestrator.agents = {'reddit_scanner': ScanAgent(failing='second')}
+    tasks = [{'agent': 'reddit_scanner', 'description': f'Scan r/{name}'} for name in ('first', 'second', 'third')]
+
+    results = orchestrator._run_concurrently(tasks)
+
+    assert [r['task'] for r in results] == ['Scan r/first', 'Scan r/second', 'Scan r/third']
+    assert results[0]['result'] == 'first' and results[2]['result'] == 'third'
+    assert results[1]['has_error'] and 'Reddit listing failed' in results[1]['error_message']
+
+
+class SharedReddit:
+    """praw.Reddit stand-in that records how many listings are being fetched at once"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def subreddit(self, name):
+        return SimpleNamespace(new=self.listing, hot=self.listing, rising=self.listing)
+
+    def listing(self, limit):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        yield SimpleNamespace(id='old', title='Old post', selftext='text', url='', score=10, num_comments=1,
+                              created_utc=time.time() - 48 * 3600, upvote_ratio=0.9, author='someone',
+                              subreddit=SimpleNamespace(display_name='news'), permalink='/r/news/old')
+        with self.lock:
+            self.active -= 1
+
+
+def test_concurrent_scans_never_page_the_shared_reddit_client_at_once():
+    reddit = SharedReddit()
+    tool = RedditScanTool(reddit, llm_wrapper=None)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(tool._run, ['a', 'b', 'c', 'd']))
+
+    assert reddit.max_active == 1
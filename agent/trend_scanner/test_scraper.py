@@ -0,0 +1,18 @@
+"""Unit tests for the scraper's text helpers (no network access needed)"""
+
+import random
+
+from trend_scanner.scraper import collapse_whitespace
+
+
+def test_collapse_whitespace_matches_full_normalization():
+    rng = random.Random(0)
+    pieces = ['a', 'bc', 'word', ' ', '  ', '\n', '\t', '\r\n', ' \n ']
+    for _ in range(2000):
+        text = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+        limit = rng.randint(0, 30)
+        assert collapse_whitespace(text, limit) == ' '.join(text.split())[:limit], (text, limit)
+
+
+def test_collapse_whitespace_keeps_short_text_whole():
+    assert collapse_whitespace('  Breaking:\n\nofficials   confirm\t', 5000) == 'Breaking: officials confirm'
@@ -0,0 +1,148 @@
+"""Unit tests for RedditScanTool's offline helpers (no Reddit or LLM access needed)"""
+
+import time
+from types import SimpleNamespace
+
+import orjson
+
+from trend_scanner import tools
+from trend_scanner.models import BatchPostData
+from trend_scanner.tools import RedditScanTool
+
+
+def make_post(title: str, content: str, has_external_content: bool = False, post_id: str = 'p1') -> BatchPostData:
+    return BatchPostData(
+        post_id=post_id,
+        title=title,
+        content=content,
+        scraped_content=content if has_external_content else None,
+        subreddit='news',
+        score=100,
+        upvote_ratio=0.9,
+        num_comments=10,
+        age_hours=1.0,
+        author='someone',
+        has_external_content=has_external_content
+    )
+
+
+def test_heuristic_flags_self_post_with_several_red_flag_terms():
+    post = make_post('The plandemic was planned', 'Big pharma and the deep state are behind the cover-up.')
+    assessment = RedditScanTool._heuristic_risk(post)
+    assert assessment is not None
+    assert assessment.risk_level == 'HIGH'
+
+
+def test_heuristic_leaves_debunking_article_to_the_llm():
+    article = (
+        "Reddit Title: Fact check: no, the flood was not a false flag\n"
+        "Linked Content: Claims that a deep state cover-up staged the flood as a false flag have spread online. "
+        "Experts say the big pharma and chemtrails theories circulating alongside it are baseless. " * 20
+    )
+    post = make_post('Fact check: no, the flood was not staged', article, has_external_content=True)
+    assert RedditScanTool._heuristic_risk(post) is None
+
+
+def test_heuristic_marks_short_plain_self_post_low():
+    assessment = RedditScanTool._heuristic_risk(make_post('Local library extends hours', 'Open until 9pm now.'))
+    assert assessment is not None
+    assert assessment.risk_level == 'LOW'
+
+
+def test_heuristic_defers_single_red_flag_term():
+    assert RedditScanTool._heuristic_risk(make_post('Is the deep state real?', 'Asking honestly.')) is None
+
+
+class PairEncoding:
+    """Stand-in tokenizer: one token per two characters, so budgets are easy to reason about"""
+
+    def encode_batch(self, texts, disallowed_special=()):
+        return [[text[i:i + 2] for i in range(0, len(text), 2)] for text in texts]
+
+    def decode(self, tokens):
+        return ''.join(tokens)
+
+
+def test_truncate_to_tokens_cuts_only_texts_over_budget(monkeypatch):
+    monkeypatch.setattr(tools, '_token_encoding', lambda: PairEncoding())
+    texts = ['a' * 6, 'b' * 10, 'c' * 30]
+    assert tools.truncate_to_tokens(texts, 5) == ['a' * 6, 'b' * 10, 'c' * 10]
+
+
+def test_truncate_to_tokens_falls_back_to_characters_without_tokenizer(monkeypatch):
+    def unavailable(name):
+        raise OSError('BPE file cannot be fetched')
+
+    monkeypatch.setattr(tools.tiktoken, 'get_encoding', unavailable)
+    tools._token_encoding.cache_clear()
+    try:
+        texts = ['x' * 10, 'y' * 100]
+        assert tools.truncate_to_tokens(texts, 5) == ['x' * 10, 'y' * (5 * tools.FALLBACK_CHARS_PER_TOKEN)]
+    finally:
+        tools._token_encoding.cache_clear()
+
+
+ARTICLE = (
+    "Officials confirmed on Tuesday that the regional water authority will raise rates next spring after a "
+    "two-year review of maintenance costs. The board said the increase would fund pipe replacement in older "
+    "neighbourhoods and a new treatment plant on the river. Residents can comment at public hearings planned "
+    "for the coming month, and the final schedule will be published once the council approves the budget. "
+    "Consumer groups asked the authority to phase in the change for low-income households and seniors."
+)
+
+
+def test_simhash_matches_near_duplicate_content():
+    cross_post = ARTICLE + " Read more."
+    original, duplicate = RedditScanTool._content_simhash(ARTICLE), RedditScanTool._content_simhash(cross_post)
+    assert original is not None and duplicate is not None
+    assert (original ^ duplicate).bit_count() <= tools.SIMHASH_MAX_DISTANCE
+
+
+def test_simhash_separates_distinct_content():
+    other = (
+        "The city football club announced a new head coach after a disappointing season that ended with relegation. "
+        "Fans gathered outside the stadium to welcome the former international, who signed a three-year contract "
+        "and promised an attacking style. The chairman thanked supporters for their patience during the search and "
+        "said transfer talks for two strikers are already under way ahead of the summer training camp abroad. "
+        "Season ticket prices will stay frozen for another year, the club added in a statement on its website."
+    )
+    first, second = RedditScanTool._content_simhash(ARTICLE), RedditScanTool._content_simhash(other)
+    assert (first ^ second).bit_count() > tools.SIMHASH_MAX_DISTANCE
+
+
+def test_simhash_skips_short_content():
+    assert RedditScanTool._content_simhash(ARTICLE[:tools.SIMHASH_MIN_CHARS - 1]) is None
+
+
+class Listing:
+    """praw.Reddit stand-in returning fixed self posts for any subreddit"""
+
+    def __init__(self, submissions):
+        self.submissions = submissions
+
+    def subreddit(self, name):
+        return SimpleNamespace(new=self.listing, hot=self.listing, rising=self.listing)
+
+    def listing(self, limit):
+        return iter(self.submissions[:limit])
+
+
+def submission(post_id: str, score: int, age_hours: float) -> SimpleNamespace:
+    return SimpleNamespace(id=post_id, title=f'Local update {post_id}', selftext='Council meeting moved to Monday.',
+                           url='', score=score, num_comments=3, upvote_ratio=0.9, author='someone',
+                           created_utc=time.time() - age_hours * 3600,
+                           subreddit=SimpleNamespace(display_name='news'), permalink=f'/r/news/{post_id}')
+
+
+def test_scan_returns_every_trending_post_ranked_without_internal_scores():
+    submissions = [submission(f'p{i}', score=100 * (i + 1), age_hours=1) for i in range(60)]
+    # A fresh tool per scan: a rescan of unchanged posts measures zero velocity
+    def make_tool():
+        return RedditScanTool(Listing(submissions), llm_wrapper=None, velocity_threshold=1, min_score_threshold=1)
+
+    posts = orjson.loads(make_tool()._run('news', limit=60))['trending_posts']
+    assert [p['post_id'] for p in posts] == [f'p{i}' for i in reversed(range(60))]
+    assert all('combined_score' not in p for p in posts)
+
+    top = orjson.loads(make_tool()._run('news', limit=60, max_trending_posts=5))['trending_posts']
+    assert [p['post_id'] for p in top] == ['p59', 'p58', 'p57', 'p56', 'p55']
@@ -1,15 +1,110 @@
+import re
 import time
-import json
+import orjson
 import logging
+import heapq
+import operator
 import hashlib
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+import tiktoken
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel, Field
 from .scraper import WebContentScraper
+from .disk_cache import DiskCache
 from .google_agents import GoogleAgentsManager
-from .models import BatchPostData, BatchRiskAssessment
+from .models import BatchPostData, BatchRiskAssessment, VelocityMetric
 
 logger = logging.getLogger(__name__)
 
+# Submissions whose content (self text or scraped link) is fetched concurrently during a scan
+CONTENT_FETCH_WORKERS = 8
+
+# Posts per risk assessment LLM call; larger scans are split into chunks sent concurrently
+RISK_BATCH_SIZE = 12
+RISK_BATCH_WORKERS = 4
+
+# Risk assessments are reused for posts seen again (Reddit listings overlap between scans) within the TTL
+RISK_CACHE_MAX_ENTRIES = 10_000
+RISK_CACHE_TTL = 3600
+# Score changes within the same bucket do not invalidate a cached assessment
+RISK_CACHE_SCORE_BUCKET = 50
+
+# Near-duplicate content (cross-posts of one article under different URLs) shares one assessment:
+# 64-bit simhashes of the first SIMHASH_MAX_CHARS of content within SIMHASH_MAX_DISTANCE bits match
+SIMHASH_MIN_CHARS = 500
+SIMHASH_MAX_CHARS = 5000
+SIMHASH_MAX_DISTANCE = 3
+_SIMHASH_TOKEN_RE = re.compile(r"\w+")
+
+# Prompt budgets per post, in tokens (cl100k is a close enough proxy for Gemini's tokenizer)
+PROMPT_CONTENT_MAX_TOKENS = 12_000
+PROMPT_EXTERNAL_CONTENT_MAX_TOKENS = 7_500
+# Rough characters per token, used only if the tokenizer cannot be loaded
+FALLBACK_CHARS_PER_TOKEN = 4
+
+# Cheap pre-classification before the LLM, on the poster's own words only (linked articles, e.g. debunks,
+# quote these terms freely): several distinct red-flag terms are HIGH, short self posts without links or
+# red flags are LOW, and everything else goes to the model
+RED_FLAG_RE = re.compile(
+    r"\b(?:miracle cures?|plandemic|stolen elections?|rigged elections?|mainstream media lies|false flags?|"
+    r"crisis actors?|chemtrails?|deep state|big pharma|cover[- ]?ups?|depopulation|microchipped|"
+    r"they don'?t want you to know|do your own research|wake up sheeple)\b",
+    re.IGNORECASE
+)
+HEURISTIC_HIGH_MIN_TERMS = 2
+HEURISTIC_LOW_MAX_CHARS = 200
+
+# Bounds on per-tool state that would otherwise grow for the life of the process
+SCRAPED_CACHE_MAX_ENTRIES = 2048
+TRACKED_POSTS_MAX_ENTRIES = 10_000
+
+# praw.Reddit is not thread-safe (one requests session and rate limiter per client) and _make_reddit shares a client
+# across tools and orchestrators, so concurrent subreddit scans fetch their listings one at a time; scraping and
+# Gemini calls still overlap
+_REDDIT_LOCK = threading.Lock()
+
+# With a cache_path, scraped pages and risk verdicts are also kept on disk so restarted scans can reuse them
+SCRAPED_DISK_CACHE_TTL = 24 * 3600
+
+# Fraction of the velocity threshold a post must reach, by risk level (relaxed further for posts with scraped links)
+VELOCITY_THRESHOLD_MULTIPLIERS = {"HIGH": 0.3, "MEDIUM": 0.5, "LOW": 1.0}
+SCRAPED_VELOCITY_THRESHOLD_MULTIPLIERS = {"HIGH": 0.2, "MEDIUM": 0.4, "LOW": 0.8}
+
+# Trending posts are returned highest combined (velocity x risk) score first
+RISK_SCORE_MULTIPLIERS = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+_COMBINED_SCORE = operator.itemgetter(0)
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """Load the tokenizer once; None if it is unavailable (e.g. BPE file cannot be fetched offline)"""
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, truncating prompts by characters: {e}")
+        return None
+
+
+def truncate_to_tokens(texts: List[str], max_tokens: int) -> List[str]:
+    """Cut each text to at most max_tokens tokens, encoding the texts that may exceed it in one batch"""
+    encoding = _token_encoding()
+    if encoding is None:
+        return [text[:max_tokens * FALLBACK_CHARS_PER_TOKEN] for text in texts]
+    # Every token covers at least one character, so shorter texts cannot be over budget
+    long_indices = [i for i, text in enumerate(texts) if len(text) > max_tokens]
+    truncated = list(texts)
+    encoded = encoding.encode_batch([texts[i] for i in long_indices], disallowed_special=())
+    for i, tokens in zip(long_indices, encoded):
+        if len(tokens) > max_tokens:
+            truncated[i] = encoding.decode(tokens[:max_tokens])
+    return truncated
+
 
 # Tool base class to replace CrewAI BaseTool
 class GoogleTool:
@@ -127,10 +222,31 @@ For each high-priority post, provide:
 """
 
 
+BATCH_RISK_PROMPT_HEADER = """You are an expert misinformation detector. Analyze the following batch of Reddit posts and assign risk levels.
+
+For EACH post, respond with exactly this format:
+POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
+
+Risk Level Guidelines:
+- HIGH: Contains unverified claims, conspiracy theories, medical misinformation, or political manipulation
+- MEDIUM: Potentially misleading, lacks sources, or emotional manipulation  
+- LOW: Factual, well-sourced, or clearly opinion-based content
+
+POSTS TO ANALYZE:
+
+"""
+
+BATCH_RISK_PROMPT_FOOTER = """
+Now provide risk assessment for each post using the exact format:
+POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
+"""
+
+
 class RedditScanInput(BaseModel):
     subreddit_name: str = Field(description="Name of the subreddit to scan")
     limit: int = Field(default=20, description="Number of posts to scan")
     sort_type: str = Field(default="new", description="Sort type: new, rising, hot")
+    max_trending_posts: Optional[int] = Field(default=None, description="Return only this many top trending posts (all by default)")
 
 
 class RedditScanOutput(BaseModel):
@@ -142,15 +258,23 @@ class RedditScanTool(GoogleTool):
     name: str = "reddit_scanner"
     description: str = "Scans Reddit subreddits for rapidly trending posts and ranks them by potential misinformation risk using Google Agents SDK"
 
-    def __init__(self, reddit_client, llm_wrapper, velocity_threshold=15, min_score_threshold=30, google_api_key=None):
+    def __init__(self, reddit_client, llm_wrapper, velocity_threshold=15, min_score_threshold=30, google_api_key=None,
+                 cache_path: Optional[str] = None):
         super().__init__()
         object.__setattr__(self, '_reddit', reddit_client)
         object.__setattr__(self, '_llm_wrapper', llm_wrapper)
         object.__setattr__(self, '_velocity_threshold', velocity_threshold)
         object.__setattr__(self, '_min_score_threshold', min_score_threshold)
-        object.__setattr__(self, '_tracked_posts', {})
         object.__setattr__(self, '_scraper', WebContentScraper())
-        object.__setattr__(self, '_scraped_cache', {})
+        # Subreddit scans may run concurrently on one tool; LRUCache/TTLCache lookups reorder entries and are not thread-safe
+        object.__setattr__(self, '_tracked_posts', LRUCache(maxsize=TRACKED_POSTS_MAX_ENTRIES))
+        object.__setattr__(self, '_tracked_posts_lock', threading.Lock())
+        object.__setattr__(self, '_scraped_cache', LRUCache(maxsize=SCRAPED_CACHE_MAX_ENTRIES))
+        object.__setattr__(self, '_scraped_cache_lock', threading.Lock())
+        object.__setattr__(self, '_risk_cache', TTLCache(maxsize=RISK_CACHE_MAX_ENTRIES, ttl=RISK_CACHE_TTL))
+        object.__setattr__(self, '_risk_cache_lock', threading.Lock())
+        object.__setattr__(self, '_simhash_cache', TTLCache(maxsize=RISK_CACHE_MAX_ENTRIES, ttl=RISK_CACHE_TTL))
+        object.__setattr__(self, '_disk_cache', DiskCache(cache_path) if cache_path else None)
         
         # Initialize Google Agents Manager (for enhanced analysis, no fact-checking)
         try:
@@ -160,31 +284,34 @@ class RedditScanTool(GoogleTool):
             logger.warning(f"Failed to initialize Google Agents SDK: {e}")
             object.__setattr__(self, '_google_agents', None)
 
-    def calculate_velocity(self, post_id: str, current_score: int, created_utc: float) -> float:
-        current_time = time.time()
-        if post_id in self._tracked_posts:
-            metric = self._tracked_posts[post_id]
-            time_diff = current_time - metric.current_time
-            score_diff = current_score - metric.current_score
-            metric.current_score = current_score
-            metric.current_time = current_time
-            if time_diff > 0:
-                velocity = (score_diff / time_diff) * 3600
-                metric.velocity = velocity
-                return velocity
-            return metric.velocity
-        else:
-            age_seconds = max(current_time - created_utc, 1.0)
-            hours = age_seconds / 3600.0
-            proxy_velocity = current_score / hours if hours > 0 else float(current_score) * 3600.0
-            self._tracked_posts[post_id] = type('VM', (), {
-                'initial_score': current_score,
-                'current_score': current_score,
-                'initial_time': current_time,
-                'current_time': current_time,
-                'velocity': proxy_velocity
-            })()
-            return proxy_velocity
+    def calculate_velocity(self, post_id: str, current_score: int, created_utc: float,
+                           current_time: Optional[float] = None) -> float:
+        if current_time is None:
+            current_time = time.time()
+        with self._tracked_posts_lock:
+            if post_id in self._tracked_posts:
+                metric = self._tracked_posts[post_id]
+                time_diff = current_time - metric.current_time
+                score_diff = current_score - metric.current_score
+                metric.current_score = current_score
+                metric.current_time = current_time
+                if time_diff > 0:
+                    velocity = (score_diff / time_diff) * 3600
+                    metric.velocity = velocity
+                    return velocity
+                return metric.velocity
+            else:
+                age_seconds = max(current_time - created_utc, 1.0)
+                hours = age_seconds / 3600.0
+                proxy_velocity = current_score / hours if hours > 0 else float(current_score) * 3600.0
+                self._tracked_posts[post_id] = VelocityMetric(
+                    initial_score=current_score,
+                    current_score=current_score,
+                    initial_time=current_time,
+                    current_time=current_time,
+                    velocity=proxy_velocity
+                )
+                return proxy_velocity
 
     def extract_post_content(self, submission) -> Tuple[str, Optional[str], str]:
         reddit_content = ""
@@ -196,14 +323,26 @@ class RedditScanTool(GoogleTool):
             content_source = "selftext"
         elif submission.url:
             if self._scraper.is_scrapeable_url(submission.url):
-                url_hash = hashlib.md5(submission.url.encode()).hexdigest()
-                if url_hash in self._scraped_cache:
-                    scraped_content = self._scraped_cache[url_hash]
+                # Keyed by the URL itself: a dict hashes it already, so fingerprinting first is wasted work
+                with self._scraped_cache_lock:
+                    cached_content = self._scraped_cache.get(submission.url)
+                if cached_content is None and self._disk_cache is not None:
+                    stored = self._disk_cache.get('scraped', submission.url.encode('utf-8'))
+                    if stored is not None:
+                        cached_content = stored.decode('utf-8')
+                        with self._scraped_cache_lock:
+                            self._scraped_cache[submission.url] = cached_content
+                if cached_content is not None:
+                    scraped_content = cached_content
                     content_source = "cached_scraped"
                 else:
                     scraped_content, scrape_method = self._scraper.scrape_content(submission.url)
                     if scraped_content:
-                        self._scraped_cache[url_hash] = scraped_content
+                        with self._scraped_cache_lock:
+                            self._scraped_cache[submission.url] = scraped_content
+                        if self._disk_cache is not None:
+                            self._disk_cache.set_many('scraped', {submission.url.encode('utf-8'): scraped_content.encode('utf-8')},
+                                                      ttl=SCRAPED_DISK_CACHE_TTL)
                         content_source = f"scraped_{scrape_method}"
                     else:
                         content_source = "link_failed"
@@ -273,42 +412,148 @@ class RedditScanTool(GoogleTool):
             # Return LOW risk for all posts if batch fails
             return [BatchRiskAssessment(post_id=post.post_id, risk_level='LOW') for post in batch_posts]
 
-    def _create_batch_risk_assessment_prompt(self, batch_posts: List[BatchPostData]) -> str:
-        """Create a single prompt for batch risk assessment"""
+    def assess_risk_level_chunked(self, batch_posts: List[BatchPostData], llm_wrapper) -> List[BatchRiskAssessment]:
+        """Assess risk levels in RISK_BATCH_SIZE chunks, one API call per chunk, with the chunks sent concurrently"""
+        heuristic = []
+        undecided = []
+        for post in batch_posts:
+            assessment = self._heuristic_risk(post)
+            if assessment is not None:
+                heuristic.append(assessment)
+            else:
+                undecided.append(post)
+        if heuristic:
+            logger.info(f"Pre-classified {len(heuristic)} of {len(batch_posts)} posts without the LLM")
+        batch_posts = undecided
         
-        batch_prompt = """You are an expert misinformation detector. Analyze the following batch of Reddit posts and assign risk levels.
-
-For EACH post, respond with exactly this format:
-POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
-
-Risk Level Guidelines:
-- HIGH: Contains unverified claims, conspiracy theories, medical misinformation, or political manipulation
-- MEDIUM: Potentially misleading, lacks sources, or emotional manipulation  
-- LOW: Factual, well-sourced, or clearly opinion-based content
-
-POSTS TO ANALYZE:
-
-"""
+        cache_keys = {post.post_id: self._risk_cache_key(post) for post in batch_posts}
+        with self._risk_cache_lock:
+            cached = [self._risk_cache.get(cache_keys[post.post_id]) for post in batch_posts]
+        if self._disk_cache is not None and None in cached:
+            # Verdicts from earlier processes: restore them into the in-memory cache as well
+            missing = [i for i, assessment in enumerate(cached) if assessment is None]
+            stored = self._disk_cache.get_many('risk', [cache_keys[batch_posts[i].post_id] for i in missing])
+            restored = {}
+            for i in missing:
+                key = cache_keys[batch_posts[i].post_id]
+                if key in stored:
+                    cached[i] = restored[key] = BatchRiskAssessment(post_id=batch_posts[i].post_id, **orjson.loads(stored[key]))
+            with self._risk_cache_lock:
+                self._risk_cache.update(restored)
+        reused = [assessment for assessment in cached if assessment is not None]
+        pending = [post for post, assessment in zip(batch_posts, cached) if assessment is None]
+        
+        # Near-duplicates of content assessed in earlier scans reuse that verdict; near-duplicates
+        # within this batch are sent once and the verdict is copied to the rest
+        simhashes = {post.post_id: self._content_simhash(post.content) for post in pending}
+        unique = []
+        duplicates = {}
+        with self._risk_cache_lock:
+            known = list(self._simhash_cache.items())
+        for post in pending:
+            fingerprint = simhashes[post.post_id]
+            if fingerprint is None:
+                unique.append(post)
+                continue
+            match = next((assessment for other, assessment in known
+                          if (fingerprint ^ other).bit_count() <= SIMHASH_MAX_DISTANCE), None)
+            if match is not None:
+                reused.append(replace(match, post_id=post.post_id))
+                continue
+            original = next((other for other in unique if simhashes[other.post_id] is not None
+                             and (fingerprint ^ simhashes[other.post_id]).bit_count() <= SIMHASH_MAX_DISTANCE), None)
+            if original is not None:
+                duplicates[post.post_id] = original.post_id
+            else:
+                unique.append(post)
+        pending = unique
+        if reused or duplicates:
+            logger.info(f"Reusing cached risk assessments for {len(reused) + len(duplicates)} of {len(batch_posts)} posts")
+        
+        chunks = [pending[i:i + RISK_BATCH_SIZE] for i in range(0, len(pending), RISK_BATCH_SIZE)]
+        if len(chunks) <= 1:
+            fresh = self.assess_risk_level_batch(pending, llm_wrapper)
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), RISK_BATCH_WORKERS)) as executor:
+                chunk_assessments = executor.map(lambda chunk: self.assess_risk_level_batch(chunk, llm_wrapper), chunks)
+                fresh = [assessment for assessments in chunk_assessments for assessment in assessments]
         
-        for i, post in enumerate(batch_posts, 1):
-            batch_prompt += f"""
+        if duplicates:
+            by_id = {assessment.post_id: assessment for assessment in fresh}
+            fresh += [replace(by_id[original_id], post_id=post_id)
+                      for post_id, original_id in duplicates.items() if original_id in by_id]
+        
+        # Only cache real model verdicts; fallback LOW defaults carry no reasoning
+        with self._risk_cache_lock:
+            for assessment in fresh:
+                if assessment.reasoning is not None:
+                    self._risk_cache[cache_keys[assessment.post_id]] = assessment
+                    fingerprint = simhashes[assessment.post_id]
+                    if fingerprint is not None:
+                        self._simhash_cache[fingerprint] = assessment
+        if self._disk_cache is not None:
+            self._disk_cache.set_many('risk', {
+                cache_keys[assessment.post_id]: orjson.dumps({
+                    'risk_level': assessment.risk_level,
+                    'confidence': assessment.confidence,
+                    'reasoning': assessment.reasoning
+                })
+                for assessment in fresh if assessment.reasoning is not None
+            }, ttl=RISK_CACHE_TTL)
+        return heuristic + reused + fresh
+
+    @staticmethod
+    def _content_simhash(content: str) -> Optional[int]:
+        """64-bit simhash of the content's word counts, or None when there is too little text to compare"""
+        if len(content) < SIMHASH_MIN_CHARS:
+            return None
+        weights = [0] * 64
+        for token, count in Counter(_SIMHASH_TOKEN_RE.findall(content[:SIMHASH_MAX_CHARS].lower())).items():
+            token_hash = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+            for bit in range(64):
+                weights[bit] += count if token_hash >> bit & 1 else -count
+        return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+    @staticmethod
+    def _heuristic_risk(post: BatchPostData) -> Optional[BatchRiskAssessment]:
+        """Classify clear-cut posts by keyword; None means the post needs the LLM"""
+        # Link posts carry the scraped article in content (only self posts have Reddit text), so match their title alone
+        text = post.title if post.has_external_content else f"{post.title}\n{post.content}"
+        terms = {match.lower() for match in RED_FLAG_RE.findall(text)}
+        if len(terms) >= HEURISTIC_HIGH_MIN_TERMS:
+            return BatchRiskAssessment(post_id=post.post_id, risk_level='HIGH',
+                                       reasoning=f"Red-flag terms: {', '.join(sorted(terms))}")
+        if not terms and not post.has_external_content and len(text) <= HEURISTIC_LOW_MAX_CHARS:
+            return BatchRiskAssessment(post_id=post.post_id, risk_level='LOW',
+                                       reasoning="Short self post without links or red-flag terms")
+        return None
+
+    @staticmethod
+    def _risk_cache_key(post: BatchPostData) -> bytes:
+        """Identity of a post's assessable state: id, bucketed score and the start of its content"""
+        fingerprint = f"{post.post_id}:{post.score // RISK_CACHE_SCORE_BUCKET}:{post.content[:2000]}"
+        return hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16).digest()
+
+    def _create_batch_risk_assessment_prompt(self, batch_posts: List[BatchPostData]) -> str:
+        """Create a single prompt for batch risk assessment"""
+        contents = truncate_to_tokens([post.content for post in batch_posts], PROMPT_CONTENT_MAX_TOKENS)
+        external = truncate_to_tokens([post.scraped_content or '' for post in batch_posts], PROMPT_EXTERNAL_CONTENT_MAX_TOKENS)
+        # Fixed rubric around per-post blocks, joined once instead of grown by repeated concatenation
+        post_blocks = [
+            f"""
 --- POST {i} (ID: {post.post_id}) ---
 Title: {post.title}
-Content: {post.content[:50000]}{'...' if len(post.content) > 500 else ''}
+Content: {content}{'...' if len(content) < len(post.content) else ''}
 Subreddit: r/{post.subreddit}
 Score: {post.score} | Comments: {post.num_comments} | Age: {post.age_hours:.1f}h
 Author: {post.author}
 Has External Content: {post.has_external_content}
-{f'External Content: {post.scraped_content[:30000]}...' if post.scraped_content else ''}
+{f'External Content: {scraped}...' if post.scraped_content else ''}
 
 """
-
-        batch_prompt += """
-Now provide risk assessment for each post using the exact format:
-POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
-"""
-        
-        return batch_prompt
+            for i, (post, content, scraped) in enumerate(zip(batch_posts, contents, external), 1)
+        ]
+        return ''.join([BATCH_RISK_PROMPT_HEADER, *post_blocks, BATCH_RISK_PROMPT_FOOTER])
 
     def _parse_batch_risk_response(self, response_text: str, batch_posts: List[BatchPostData]) -> List[BatchRiskAssessment]:
         """Parse the LLM response for batch risk assessment"""
@@ -347,142 +592,161 @@ POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
         
         return assessments
 
-    def _run(self, subreddit_name: str, limit: int = 20, sort_type: str = "new") -> str:
+    def _iter_trending_posts(self, candidate_posts: List[BatchPostData], submission_data: Dict[str, Dict[str, Any]],
+                             risk_lookup: Dict[str, str], detected_at: str) -> Iterator[Tuple[float, Dict[str, Any]]]:
+        """Yield (combined score, output record) for each candidate post that passes the risk-adjusted filters"""
+        for batch_post in candidate_posts:
+            post_id = batch_post.post_id
+            data = submission_data[post_id]
+            submission = data['submission']
+            
+            # Get risk level from batch assessment
+            risk_level = risk_lookup.get(post_id, 'LOW')
+            
+            # Apply threshold adjustments based on risk level
+            threshold_multiplier = SCRAPED_VELOCITY_THRESHOLD_MULTIPLIERS if data['scraped_content'] else VELOCITY_THRESHOLD_MULTIPLIERS
+            adjusted_threshold = self._velocity_threshold * threshold_multiplier[risk_level]
+            meets_velocity = data['velocity'] >= adjusted_threshold
+            meets_score = submission.score >= self._min_score_threshold
+            
+            if risk_level == 'HIGH' and data['scraped_content']:
+                meets_score = submission.score >= (self._min_score_threshold * 0.5)
+
+            # Final filtering
+            if (meets_velocity and meets_score and data['is_recent']) or (risk_level == 'HIGH' and data['scraped_content'] and data['is_recent']):
+                post_data = {
+                    'post_id': submission.id,
+                    'title': submission.title,
+                    'content': data['content'][:1000] if data['content'] else "",
+                    'scraped_content': data['scraped_content'][:1000] if data['scraped_content'] else None,
+                    'content_source': data['content_source'],
+                    'author': batch_post.author,
+                    'subreddit': batch_post.subreddit,
+                    'url': submission.url,
+                    'score': submission.score,
+                    'upvote_ratio': submission.upvote_ratio,
+                    'num_comments': submission.num_comments,
+                    'created_utc': submission.created_utc,
+                    'velocity_score': data['velocity'],
+                    'engagement_rate': data['engagement_rate'],
+                    'risk_level': risk_level,
+                    'detected_at': detected_at,
+                    'permalink': f"https://reddit.com{submission.permalink}"
+                }
+                # The ranking key travels beside the record so it never becomes part of the output
+                yield data['velocity'] * RISK_SCORE_MULTIPLIERS[risk_level], post_data
+
+    def _run(self, subreddit_name: str, limit: int = 20, sort_type: str = "new",
+             max_trending_posts: Optional[int] = None) -> str:
+        """Scan a subreddit for trending posts as JSON, highest combined score first (only the top max_trending_posts if set)"""
         try:
-            subreddit = self._reddit.subreddit(subreddit_name)
-            trending_posts = []
             processed_count = 0
             scraped_count = 0
 
-            if sort_type == "new":
-                submissions = subreddit.new(limit=limit)
-            elif sort_type == "rising":
-                submissions = subreddit.rising(limit=limit)
-            elif sort_type == "hot":
-                submissions = subreddit.hot(limit=limit)
-            else:
-                submissions = subreddit.new(limit=limit)
-
             # Debug: Log that we're about to iterate submissions
             logger.info(f"Starting to fetch submissions from r/{subreddit_name} (limit={limit}, sort={sort_type})")
+            with _REDDIT_LOCK:
+                subreddit = self._reddit.subreddit(subreddit_name)
+                if sort_type == "rising":
+                    submissions = list(subreddit.rising(limit=limit))
+                elif sort_type == "hot":
+                    submissions = list(subreddit.hot(limit=limit))
+                else:
+                    submissions = list(subreddit.new(limit=limit))
             
             # First pass: collect all post data for batch processing
             candidate_posts = []
             submission_data = {}
             
-            for submission in submissions:
-                logger.debug(f"Processing submission: {submission.id} - {submission.title[:50]}...")
-                processed_count += 1
-                content, scraped_content, content_source = self.extract_post_content(submission)
-                if scraped_content:
-                    scraped_count += 1
-                    
-                velocity = self.calculate_velocity(submission.id, submission.score, submission.created_utc)
-                engagement_rate = submission.num_comments / max(submission.score, 1)
-                is_recent = (time.time() - submission.created_utc) < 86400
-                meets_basic_score = submission.score >= (self._min_score_threshold * 0.3)
+            # Link scraping is network-bound, so extract every submission's content concurrently (in listing order),
+            # and send each full chunk of candidates for risk assessment while later links are still being scraped.
+            assessment_jobs = []
+            ready_posts = []
+            with ThreadPoolExecutor(max_workers=CONTENT_FETCH_WORKERS) as executor, \
+                    ThreadPoolExecutor(max_workers=RISK_BATCH_WORKERS) as assessor:
+                pending = [(submission, executor.submit(self.extract_post_content, submission)) for submission in submissions]
                 
-                # Debug: Log filtering criteria for first few posts
-                if processed_count <= 3:
-                    age_hours = (time.time() - submission.created_utc) / 3600
-                    logger.info(f"Post {processed_count}: score={submission.score}, velocity={velocity:.1f}, age={age_hours:.1f}h, recent={is_recent}, basic_score_threshold={self._min_score_threshold * 0.3}")
+                # One clock read for the whole pass, taken once the listing has been fetched
+                now = time.time()
+                detected_at = datetime.now().isoformat()
                 
-                # Store submission data for later use
-                submission_data[submission.id] = {
-                    'submission': submission,
-                    'content': content,
-                    'scraped_content': scraped_content,
-                    'content_source': content_source,
-                    'velocity': velocity,
-                    'engagement_rate': engagement_rate,
-                    'is_recent': is_recent,
-                    'meets_basic_score': meets_basic_score
-                }
+                for submission, extraction in pending:
+                    content, scraped_content, content_source = extraction.result()
+                    logger.debug(f"Processing submission: {submission.id} - {submission.title[:50]}...")
+                    processed_count += 1
+                    if scraped_content:
+                        scraped_count += 1
+                    
+                    velocity = self.calculate_velocity(submission.id, submission.score, submission.created_utc, now)
+                    engagement_rate = submission.num_comments / max(submission.score, 1)
+                    age_hours = (now - submission.created_utc) / 3600
+                    is_recent = age_hours < 24
+                    meets_basic_score = submission.score >= (self._min_score_threshold * 0.3)
                 
-                # Debug: Log why posts are being filtered out
-                if processed_count <= 5:
-                    logger.info(f"Post {processed_count} filter check: recent={is_recent}, score={submission.score}>={self._min_score_threshold * 0.3}({meets_basic_score})")
+                    # Debug: Log filtering criteria for first few posts
+                    if processed_count <= 3:
+                        logger.info(f"Post {processed_count}: score={submission.score}, velocity={velocity:.1f}, age={age_hours:.1f}h, recent={is_recent}, basic_score_threshold={self._min_score_threshold * 0.3}")
                 
-                # Only add to batch assessment if it meets basic criteria
-                if is_recent and meets_basic_score:
-                    batch_post = BatchPostData(
-                        post_id=submission.id,
-                        title=submission.title,
-                        content=content[:100000] if content else "",
-                        scraped_content=scraped_content[:100000] if scraped_content else None,
-                        subreddit=submission.subreddit.display_name,
-                        score=submission.score,
-                        upvote_ratio=submission.upvote_ratio,
-                        num_comments=submission.num_comments,
-                        age_hours=(time.time() - submission.created_utc) / 3600,
-                        author=str(submission.author) if submission.author else "[deleted]",
-                        has_external_content=scraped_content is not None
-                    )
-                    candidate_posts.append(batch_post)
-                else:
+                    # Store submission data for later use
+                    submission_data[submission.id] = {
+                        'submission': submission,
+                        'content': content,
+                        'scraped_content': scraped_content,
+                        'content_source': content_source,
+                        'velocity': velocity,
+                        'engagement_rate': engagement_rate,
+                        'is_recent': is_recent,
+                        'meets_basic_score': meets_basic_score
+                    }
+                
+                    # Debug: Log why posts are being filtered out
                     if processed_count <= 5:
-                        logger.info(f"Post {processed_count} FILTERED OUT: recent={is_recent}, meets_score={meets_basic_score}")
+                        logger.info(f"Post {processed_count} filter check: recent={is_recent}, score={submission.score}>={self._min_score_threshold * 0.3}({meets_basic_score})")
+                
+                    # Only add to batch assessment if it meets basic criteria
+                    if is_recent and meets_basic_score:
+                        batch_post = BatchPostData(
+                            post_id=submission.id,
+                            title=submission.title,
+                            content=content[:100000] if content else "",
+                            scraped_content=scraped_content[:100000] if scraped_content else None,
+                            subreddit=submission.subreddit.display_name,
+                            score=submission.score,
+                            upvote_ratio=submission.upvote_ratio,
+                            num_comments=submission.num_comments,
+                            age_hours=age_hours,
+                            author=str(submission.author) if submission.author else "[deleted]",
+                            has_external_content=scraped_content is not None
+                        )
+                        candidate_posts.append(batch_post)
+                        ready_posts.append(batch_post)
+                        if len(ready_posts) == RISK_BATCH_SIZE:
+                            assessment_jobs.append(assessor.submit(self.assess_risk_level_chunked, ready_posts, self._llm_wrapper))
+                            ready_posts = []
+                    else:
+                        if processed_count <= 5:
+                            logger.info(f"Post {processed_count} FILTERED OUT: recent={is_recent}, meets_score={meets_basic_score}")
+
+                # Batch risk assessment for the remaining candidate posts
+                if ready_posts:
+                    assessment_jobs.append(assessor.submit(self.assess_risk_level_chunked, ready_posts, self._llm_wrapper))
+                logger.info(f"Performing batch risk assessment for {len(candidate_posts)} posts")
+                risk_assessments = [assessment for job in assessment_jobs for assessment in job.result()]
 
-            # Batch risk assessment for all candidate posts
-            logger.info(f"Performing batch risk assessment for {len(candidate_posts)} posts")
-            risk_assessments = self.assess_risk_level_batch(candidate_posts, self._llm_wrapper)
-            
             # Create risk assessment lookup
             risk_lookup = {assessment.post_id: assessment.risk_level for assessment in risk_assessments}
             
-            # Second pass: apply risk levels and filtering
-            for batch_post in candidate_posts:
-                post_id = batch_post.post_id
-                data = submission_data[post_id]
-                submission = data['submission']
-                
-                # Get risk level from batch assessment
-                risk_level = risk_lookup.get(post_id, 'LOW')
-                
-                # Apply threshold adjustments based on risk level
-                threshold_multiplier = {"HIGH": 0.3, "MEDIUM": 0.5, "LOW": 1.0}
-                if data['scraped_content']:
-                    threshold_multiplier = {"HIGH": 0.2, "MEDIUM": 0.4, "LOW": 0.8}
-
-                adjusted_threshold = self._velocity_threshold * threshold_multiplier[risk_level]
-                meets_velocity = data['velocity'] >= adjusted_threshold
-                meets_score = submission.score >= self._min_score_threshold
-                
-                if risk_level == 'HIGH' and data['scraped_content']:
-                    meets_score = submission.score >= (self._min_score_threshold * 0.5)
-
-                # Final filtering
-                if (meets_velocity and meets_score and data['is_recent']) or (risk_level == 'HIGH' and data['scraped_content'] and data['is_recent']):
-                    post_data = {
-                        'post_id': submission.id,
-                        'title': submission.title,
-                        'content': data['content'][:1000] if data['content'] else "",
-                        'scraped_content': data['scraped_content'][:1000] if data['scraped_content'] else None,
-                        'content_source': data['content_source'],
-                        'author': str(submission.author) if submission.author else "[deleted]",
-                        'subreddit': submission.subreddit.display_name,
-                        'url': submission.url,
-                        'score': submission.score,
-                        'upvote_ratio': submission.upvote_ratio,
-                        'num_comments': submission.num_comments,
-                        'created_utc': submission.created_utc,
-                        'velocity_score': data['velocity'],
-                        'engagement_rate': data['engagement_rate'],
-                        'risk_level': risk_level,
-                        'detected_at': __import__('datetime').datetime.now().isoformat(),
-                        'permalink': f"https://reddit.com{submission.permalink}"
-                    }
-                    trending_posts.append(post_data)
-
-            # Sort by combined score
-            def combined_score(post):
-                risk_multiplier = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
-                return post['velocity_score'] * risk_multiplier[post['risk_level']]
-
-            trending_posts.sort(key=combined_score, reverse=True)
+            # Second pass: apply risk levels and filtering, ranking by combined score
+            scored_posts = self._iter_trending_posts(candidate_posts, submission_data, risk_lookup, detected_at)
+            if max_trending_posts is None:
+                scored_posts = sorted(scored_posts, key=_COMBINED_SCORE, reverse=True)
+            else:
+                scored_posts = heapq.nlargest(max_trending_posts, scored_posts, key=_COMBINED_SCORE)
+            trending_posts = [post for _, post in scored_posts]
 
             # Log batch processing efficiency 
-            logger.info(f"Batch processing: assessed {len(candidate_posts)} posts in 1 API call vs {len(candidate_posts)} individual calls")
+            api_calls = (len(candidate_posts) + RISK_BATCH_SIZE - 1) // RISK_BATCH_SIZE
+            logger.info(f"Batch processing: assessed {len(candidate_posts)} posts in {api_calls} API call(s) vs {len(candidate_posts)} individual calls")
             logger.info(f"Scan summary: Scanned r/{subreddit_name} ({processed_count} posts), scraped {scraped_count} links, found {len(trending_posts)} trending posts")
 
             result = {
@@ -494,13 +758,13 @@ POST_ID: [post_id] | RISK: [HIGH/MEDIUM/LOW] | REASON: [brief reason]
                 'batch_size': len(candidate_posts)
             }
 
-            return json.dumps(result, indent=2)
+            return orjson.dumps(result).decode('utf-8')
         except Exception as e:
             logger.error(f"Batch processing failed for r/{subreddit_name}: {e}")
-            return json.dumps({
+            return orjson.dumps({
                 'trending_posts': [], 
                 'scan_summary': f"Batch processing error: {str(e)}", 
                 'processed_count': 0, 
                 'scraped_count': 0, 
                 'subreddit': subreddit_name
-            }, indent=2)
+            }).decode('utf-8')
@@ -2,7 +2,7 @@
 
 import os
 import logging
-import json
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -44,7 +44,7 @@ def main_one_scan() -> dict:
         print("🚀 Initializing Trend Scanner with Google Agents orchestration...")
         
         # Use the new TrendScannerOrchestrator (replaces CrewAI crew)
-        orchestrator = TrendScannerOrchestrator(REDDIT_CONFIG)
+        orchestrator = TrendScannerOrchestrator(REDDIT_CONFIG, cache_dir=os.getenv('TREND_SCANNER_CACHE_DIR'))
         
         # Use predefined target subreddits
         print(f"🎯 Target subreddits: {', '.join([f'r/{s}' for s in TARGET_SUBREDDITS])}")
@@ -62,7 +62,7 @@ def main_one_scan() -> dict:
                 "total_posts": 0,
                 "posts": []
             }
-            print(json.dumps(final_output, indent=2, ensure_ascii=False))
+            print(orjson.dumps(final_output, option=orjson.OPT_INDENT_2).decode('utf-8'))
             return final_output
         
         # Prepare posts data for Gemini batch processing
@@ -99,7 +99,7 @@ For each post, extract:
 2. A comprehensive summary combining the post content and any scraped external content
 
 Posts data:
-{json.dumps(posts_for_gemini, indent=2)}
+{orjson.dumps(posts_for_gemini, option=orjson.OPT_INDENT_2).decode('utf-8')}
 
 Return ONLY a JSON array in this exact format:
 [
@@ -132,7 +132,7 @@ Requirements:
                     response_text = response_text.replace('```', '').strip()
                 
                 # Parse Gemini response
-                gemini_results = json.loads(response_text)
+                gemini_results = orjson.loads(response_text)
                 
                 # Build final output using Gemini results
                 output_posts = []
@@ -228,7 +228,7 @@ Requirements:
             "posts": output_posts
         }
         
-        print(json.dumps(final_output, indent=2, ensure_ascii=False))
+        print(orjson.dumps(final_output, option=orjson.OPT_INDENT_2).decode('utf-8'))
         
         return final_output
         
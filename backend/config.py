@@ -20,6 +20,21 @@ class Config:
     GOOGLE_FACT_CHECK_API_KEY: Optional[str] = os.getenv("GOOGLE_FACT_CHECK_API_KEY")
     GOOGLE_FACT_CHECK_CX: Optional[str] = os.getenv("GOOGLE_FACT_CHECK_CX")
     
+    # Semantic cache for text fact-checking (near-duplicate claims reuse a previous verdict)
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    SEMANTIC_CACHE_TTL: int = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))  # seconds
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+    SEMANTIC_CACHE_PCA_COMPONENTS: int = int(os.getenv("SEMANTIC_CACHE_PCA_COMPONENTS", "128"))  # 0 disables compression
+    SEMANTIC_CACHE_PCA_FIT_SIZE: int = int(os.getenv("SEMANTIC_CACHE_PCA_FIT_SIZE", "256"))
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "models/text-embedding-004")
+    # Exact-match cache of Custom Search results, keyed by query string
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "3600"))  # seconds
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "2048"))
+    # Ask Gemini for broader alternative queries (one Gemini call plus extra Custom Search queries) only when
+    # the original query returns fewer results than this; 0 disables alternative queries
+    ALTERNATIVE_QUERY_MIN_RESULTS: int = int(os.getenv("ALTERNATIVE_QUERY_MIN_RESULTS", "3"))
+    
     # Low-priority (social/UGC) domains to downrank (override via LOW_PRIORITY_DOMAINS)
     LOW_PRIORITY_DOMAINS: set = set((os.getenv(
         "LOW_PRIORITY_DOMAINS",
@@ -34,6 +49,8 @@ class Config:
     ) or "").split(","))
     # Analysis thresholds (kept configurable to avoid hardcoding)
     CONTEXT_SIM_THRESHOLD: float = float(os.getenv("CONTEXT_SIM_THRESHOLD", "0.6"))
+    # Minimum word overlap (Jaccard) with the claim before a search result is vectorized for relevance
+    RELEVANCE_PREFILTER_THRESHOLD: float = float(os.getenv("RELEVANCE_PREFILTER_THRESHOLD", "0.02"))
 
     # Streaming downloader (yt-dlp) integration
     # If true, prefer yt-dlp for any video_url (works for YouTube/Instagram/Twitter/etc.)
@@ -19,6 +19,7 @@ from services.educational_content_generator import EducationalContentGenerator
 from services.mongodb_service import MongoDBService
 from services.websocket_service import connection_manager, initialize_mongodb_change_stream, cleanup_mongodb_change_stream
 from utils.file_utils import save_upload_file, cleanup_temp_files
+from config import config
 
 app = FastAPI(
     title="Visual Verification Service",
@@ -27,7 +28,7 @@ app = FastAPI(
 )
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=config.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 # Add CORS middleware
@@ -78,6 +79,7 @@ async def shutdown_event():
     """Cleanup services on shutdown"""
     try:
         await cleanup_mongodb_change_stream()
+        await text_fact_checker.close()
         logger.info("🧹 All services cleaned up successfully")
     except Exception as e:
         logger.error(f"❌ Error during cleanup: {e}")
@@ -214,6 +216,28 @@ async def verify_text(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/verify/text/batch")
+async def verify_text_batch(claims: List[Dict[str, str]]):
+    """
+    Verify several textual claims at once, analyzing them in a single Gemini call
+    """
+    try:
+        results = await text_fact_checker.verify_batch([
+            (
+                claim["text_input"],
+                claim.get("claim_context", "Unknown context"),
+                claim.get("claim_date", "Unknown date")
+            )
+            for claim in claims
+        ])
+
+        return {"results": results}
+
+    except KeyError as e:
+        raise HTTPException(status_code=422, detail=f"Each claim needs {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/chatbot/verify")
 async def chatbot_verify(
     text_input: Optional[str] = Form(None),
@@ -0,0 +1,138 @@
+import logging
+import time
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
+from sklearn.decomposition import PCA
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """In-memory cache of verification responses keyed by claim embedding similarity"""
+
+    def __init__(self, similarity_threshold: float, ttl: int, max_entries: int,
+                 pca_components: int = 128, pca_fit_size: int = 256):
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.pca_components = pca_components
+        self.pca_fit_size = pca_fit_size
+
+        # Row i of the matrix is the L2-normalized (and, once fitted, projected) embedding for responses[i],
+        # quantized to int8 with a per-row scale so that row * scale approximates the float vector
+        self._embeddings: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        # Principal-subspace projection (dim x pca_components) and the mean it is centered on, fitted once
+        # on the first pca_fit_size entries
+        self._projection: Optional[np.ndarray] = None
+        self._mean: Optional[np.ndarray] = None
+        self._responses: List[Dict[str, Any]] = []
+        self._timestamps: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def lookup(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response whose embedding is most similar to the given one
+
+        Args:
+            embedding: Raw embedding of the claim being verified
+
+        Returns:
+            Cached response if the best match clears the similarity threshold, None otherwise
+        """
+        self._evict_expired()
+        if not self._responses:
+            return None
+
+        query, query_scale = self._quantize(self._prepare(embedding)[np.newaxis, :])
+        # Accumulate the int8 dot products in int32, then rescale to approximate cosine similarity
+        scores = np.einsum('ij,j->i', self._embeddings, query[0], dtype=np.int32) * (self._scales * query_scale[0])
+        best = int(np.argmax(scores))
+
+        if scores[best] >= self.similarity_threshold:
+            logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return self._responses[best]
+        return None
+
+    def insert(self, embedding: List[float], response: Dict[str, Any]) -> None:
+        """
+        Store a verification response under its claim embedding
+
+        Args:
+            embedding: Raw embedding of the verified claim
+            response: Verification response to return on future hits
+        """
+        vector, scale = self._quantize(self._prepare(embedding)[np.newaxis, :])
+        if self._embeddings is None:
+            self._embeddings, self._scales = vector, scale
+        else:
+            self._embeddings = np.vstack([self._embeddings, vector])
+            self._scales = np.concatenate([self._scales, scale])
+        self._responses.append(response)
+        self._timestamps.append(time.time())
+
+        if self._projection is None and self.pca_components and len(self._responses) >= self.pca_fit_size:
+            self._fit_projection()
+
+        # Drop the oldest entries once the cache is full
+        overflow = len(self._responses) - self.max_entries
+        if overflow > 0:
+            self._drop_oldest(overflow)
+
+    def _fit_projection(self) -> None:
+        """Fit PCA on the stored embeddings and compress the index to pca_components dimensions"""
+        n_components = min(self.pca_components, *self._embeddings.shape)
+        embeddings = self._embeddings.astype(np.float32) * self._scales[:, np.newaxis]
+        pca = PCA(n_components=n_components).fit(embeddings)
+        # Center before projecting: the dropped mean direction is shared by all claims, and keeping it in the
+        # renormalized vectors would inflate the similarity of unrelated claims past the threshold
+        self._mean = pca.mean_.astype(np.float32)
+        self._projection = np.ascontiguousarray(pca.components_.T, dtype=np.float32)
+        self._embeddings, self._scales = self._quantize(self._renormalize((embeddings - self._mean) @ self._projection))
+        logger.info(f"Semantic cache compressed to {n_components} dimensions")
+
+    def _prepare(self, embedding: List[float]) -> np.ndarray:
+        """Normalize an embedding and project it into the index space"""
+        vector = self._normalize(embedding)
+        if self._projection is not None:
+            vector = self._normalize((vector - self._mean) @ self._projection)
+        return vector
+
+    def _evict_expired(self) -> None:
+        """Remove entries older than the TTL (entries are stored oldest first)"""
+        cutoff = time.time() - self.ttl
+        expired = 0
+        for timestamp in self._timestamps:
+            if timestamp >= cutoff:
+                break
+            expired += 1
+        if expired:
+            self._drop_oldest(expired)
+
+    def _drop_oldest(self, count: int) -> None:
+        if count < len(self._responses):
+            self._embeddings, self._scales = self._embeddings[count:], self._scales[count:]
+        else:
+            self._embeddings, self._scales = None, None
+        del self._responses[:count]
+        del self._timestamps[:count]
+
+    @staticmethod
+    def _renormalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.ascontiguousarray(matrix / np.where(norms > 0, norms, 1.0), dtype=np.float32)
+
+    @staticmethod
+    def _quantize(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetric per-row int8 quantization; returns the int8 rows and their float32 scales"""
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+        return np.rint(matrix / scales[:, np.newaxis]).astype(np.int8), scales
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
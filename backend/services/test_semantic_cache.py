@@ -0,0 +1,100 @@
+"""Unit tests for SemanticCache (pure numpy/scikit-learn, no embedding API needed)"""
+
+import numpy as np
+
+import semantic_cache
+from semantic_cache import SemanticCache
+
+DIM = 64
+
+
+def unit(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector)
+
+
+def with_cosine(base: np.ndarray, cosine: float, rng: np.random.Generator) -> np.ndarray:
+    """A unit vector whose cosine similarity with the unit vector base is exactly cosine"""
+    noise = rng.standard_normal(base.shape)
+    orthogonal = unit(noise - noise.dot(base) * base)
+    return cosine * base + np.sqrt(1 - cosine ** 2) * orthogonal
+
+
+def make_cache(**overrides) -> SemanticCache:
+    settings = dict(similarity_threshold=0.92, ttl=3600, max_entries=1000, pca_components=0)
+    settings.update(overrides)
+    return SemanticCache(**settings)
+
+
+def test_quantized_scores_track_float_cosine():
+    rng = np.random.default_rng(0)
+    matrix = np.stack([unit(rng.standard_normal(DIM)) for _ in range(50)]).astype(np.float32)
+    query = unit(rng.standard_normal(DIM)).astype(np.float32)
+
+    rows, scales = SemanticCache._quantize(matrix)
+    query_row, query_scale = SemanticCache._quantize(query[np.newaxis, :])
+    approx = (rows.astype(np.int32) @ query_row[0].astype(np.int32)) * (scales * query_scale[0])
+
+    assert rows.dtype == np.int8
+    np.testing.assert_allclose(approx, matrix @ query, atol=0.02)
+
+
+def test_lookup_hits_above_threshold_and_misses_below():
+    rng = np.random.default_rng(1)
+    base = unit(rng.standard_normal(DIM))
+    cache = make_cache()
+    cache.insert(base.tolist(), {'verdict': 'false'})
+
+    assert cache.lookup(with_cosine(base, 0.95, rng).tolist()) == {'verdict': 'false'}
+    assert cache.lookup(with_cosine(base, 0.88, rng).tolist()) is None
+
+
+def test_expired_entries_are_evicted(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, 'time', lambda: clock[0])
+    rng = np.random.default_rng(2)
+    first, second = unit(rng.standard_normal(DIM)), unit(rng.standard_normal(DIM))
+    cache = make_cache(ttl=60)
+    cache.insert(first.tolist(), {'claim': 'first'})
+    clock[0] += 50
+    cache.insert(second.tolist(), {'claim': 'second'})
+
+    clock[0] += 20
+    assert cache.lookup(first.tolist()) is None
+    assert cache.lookup(second.tolist()) == {'claim': 'second'}
+    assert len(cache) == 1
+
+
+def test_oldest_entries_are_dropped_when_full():
+    rng = np.random.default_rng(3)
+    vectors = [unit(rng.standard_normal(DIM)) for _ in range(4)]
+    cache = make_cache(max_entries=3)
+    for i, vector in enumerate(vectors):
+        cache.insert(vector.tolist(), {'claim': i})
+
+    assert len(cache) == 3
+    assert cache.lookup(vectors[0].tolist()) is None
+    assert cache.lookup(vectors[3].tolist()) == {'claim': 3}
+
+
+def test_pca_fits_at_threshold_without_false_hits_from_the_shared_mean():
+    # Text embeddings share a large common direction (varying in strength); unrelated claims differ in the remainder
+    rng = np.random.default_rng(4)
+    common = unit(rng.standard_normal(DIM)) * 4
+    claims = [unit(common * (1 + 0.5 * rng.standard_normal()) + 0.5 * rng.standard_normal(DIM)) for _ in range(40)]
+    cache = make_cache(pca_components=16, pca_fit_size=32)
+
+    for i, claim in enumerate(claims[:31]):
+        cache.insert(claim.tolist(), {'claim': i})
+    assert cache._projection is None
+    cache.insert(claims[31].tolist(), {'claim': 31})
+    assert cache._projection is not None
+    assert cache._embeddings.shape == (32, 16)
+
+    # Unrelated claims have high raw cosine similarity because of the shared direction, yet stay below the threshold...
+    raw_scores = [float(claims[i] @ claims[j]) for i in range(32, 40) for j in range(32)]
+    assert 0.8 < max(raw_scores) < cache.similarity_threshold
+    # ...but must not be served each other's verdicts once the index is compressed
+    for claim in claims[32:]:
+        assert cache.lookup(claim.tolist()) is None
+    # An exact repeat of a stored claim still hits
+    assert cache.lookup(claims[5].tolist()) == {'claim': 5}
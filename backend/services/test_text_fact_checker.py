@@ -0,0 +1,129 @@
+"""Unit tests for TextFactChecker's semantic caching (Gemini, embeddings and Custom Search are stubbed)"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add backend root to path so config and the services package resolve
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import config
+from services.semantic_cache import SemanticCache
+from services.text_fact_checker import TextFactChecker
+
+SOURCES = [{'title': 'Fact check: the bridge did not collapse', 'snippet': 'Photos are from 2011.', 'link': 'https://factcheck.example/bridge'}]
+
+
+class FlakyModel:
+    """generate_content_async stand-in that fails for the first failures calls, then returns a verdict"""
+
+    def __init__(self, failures: int, results: int = 0):
+        self.failures = failures
+        self.results = results
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError('Gemini unavailable')
+        verdict = '{"verdict": "false", "verified": false, "message": "Old photos"}'
+        if self.results:
+            verdict = '{"results": [%s]}' % ', '.join([verdict] * self.results)
+        return SimpleNamespace(text=verdict)
+
+
+def make_checker(model: FlakyModel) -> TextFactChecker:
+    checker = TextFactChecker.__new__(TextFactChecker)
+    checker.model = model
+    checker.semantic_cache = SemanticCache(similarity_threshold=0.92, ttl=3600, max_entries=100, pca_components=0)
+    checker.searches = 0
+
+    async def embed(text):
+        return [1.0, 0.0, 0.0]
+
+    async def search(query):
+        checker.searches += 1
+        return SOURCES
+
+    checker._embed_claim = embed
+    checker._search_claims = search
+    checker._filter_relevant_results = lambda results, text: results
+    return checker
+
+
+def test_fallback_verdict_is_never_served_from_the_cache():
+    checker = make_checker(FlakyModel(failures=1))
+
+    first = asyncio.run(checker.verify('The bridge collapsed'))
+    assert first['details']['analysis']['analysis_method'] == 'fallback'
+    assert len(checker.semantic_cache) == 0
+
+    second = asyncio.run(checker.verify('The bridge collapsed'))
+    assert checker.searches == 2
+    assert second['verdict'] == 'false'
+
+    third = asyncio.run(checker.verify('The bridge collapsed!'))
+    assert checker.searches == 2
+    assert third['verdict'] == 'false'
+    assert third['details']['claim_text'] == 'The bridge collapsed!'
+
+
+def test_batch_fallback_verdicts_are_not_cached():
+    checker = make_checker(FlakyModel(failures=1, results=2))
+    items = [('The bridge collapsed', 'Unknown context', 'Unknown date')] * 2
+
+    responses = asyncio.run(checker.verify_batch(items))
+    assert [r['details']['analysis']['analysis_method'] for r in responses] == ['fallback', 'fallback']
+    assert len(checker.semantic_cache) == 0
+
+    responses = asyncio.run(checker.verify_batch(items))
+    assert [r['verdict'] for r in responses] == ['false', 'false']
+    assert len(checker.semantic_cache) == 2
+
+
+def test_no_content_is_not_cached():
+    checker = make_checker(FlakyModel(failures=0))
+
+    async def no_results(query):
+        checker.searches += 1
+        return []
+
+    checker._search_claims = no_results
+    assert asyncio.run(checker.verify('The bridge collapsed'))['verdict'] == 'no_content'
+    assert len(checker.semantic_cache) == 0
+
+
+def make_searcher(results_by_query: dict, broader_query: str):
+    checker = TextFactChecker.__new__(TextFactChecker)
+    checker.queries = []
+
+    async def perform_search(query):
+        checker.queries.append(query)
+        return list(results_by_query.get(query, []))
+
+    async def generate_content_async(prompt):
+        checker.queries.append('<gemini>')
+        return SimpleNamespace(text='{"broader_query": "%s"}' % broader_query)
+
+    checker._perform_search = perform_search
+    checker.model = SimpleNamespace(generate_content_async=generate_content_async)
+    return checker
+
+
+def test_alternative_queries_are_skipped_when_the_original_query_has_enough_results():
+    hits = [{'link': f'https://factcheck.example/{i}'} for i in range(config.ALTERNATIVE_QUERY_MIN_RESULTS)]
+    checker = make_searcher({'bridge collapse photos': hits}, 'bridge collapse')
+
+    assert asyncio.run(checker._search_claims('bridge collapse photos')) == hits
+    assert checker.queries == ['bridge collapse photos']
+
+
+def test_alternative_queries_fill_in_when_the_original_query_falls_short():
+    original = [{'link': 'https://factcheck.example/a'}]
+    broader = [{'link': 'https://factcheck.example/a'}, {'link': 'https://factcheck.example/b'}]
+    checker = make_searcher({'bridge collapse photos': original, 'bridge collapse': broader}, 'bridge collapse')
+
+    results = asyncio.run(checker._search_claims('bridge collapse photos'))
+    assert [r['link'] for r in results] == ['https://factcheck.example/a', 'https://factcheck.example/b']
+    assert checker.queries == ['bridge collapse photos', '<gemini>', 'bridge collapse']
@@ -1,11 +1,66 @@
-import requests
-import json
-from typing import Dict, List, Optional, Any
+import asyncio
+import aiohttp
+import logging
+import orjson
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, FrozenSet, Tuple
 import google.generativeai as genai
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from cachetools import TTLCache
+from sklearn.feature_extraction.text import HashingVectorizer
 import numpy as np
 from config import config
+from .semantic_cache import SemanticCache
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+_NON_WORD = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+# Markdown code fence (optionally tagged json) wrapped around Gemini's JSON replies
+_FENCE_RE = re.compile(r'^```(?:json)?|```$', re.MULTILINE)
+
+
+# analysis_method values of verdicts Gemini produced; only these are worth serving from the semantic cache
+_GEMINI_ANALYSIS_METHODS = frozenset({"gemini", "gemini_batch"})
+
+
+# Fact-check outlets/markers looked for in a result's URL or title, matched in a single pass
+_FACTCHECK_KEYWORDS = re.compile(
+    r'fact-check|factcheck|snopes|politifact|factcrescendo|boomlive|newschecker|afp'
+)
+
+
+@lru_cache(maxsize=2048)
+def _preprocess_text(text: str) -> str:
+    """
+    Preprocess text for similarity analysis (memoized: the claim is reused across every result)
+    
+    Args:
+        text: Raw text
+        
+    Returns:
+        Preprocessed text
+    """
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove special characters but keep spaces
+    text = _NON_WORD.sub(' ', text)
+    
+    # Remove extra whitespace
+    text = _WS_RE.sub(' ', text).strip()
+    
+    return text
+
+
+@lru_cache(maxsize=2048)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Lowercased word set of a text, memoized since the same claim is compared against every result"""
+    return frozenset(text.lower().split())
 
 
 class TextFactChecker:
@@ -16,10 +71,39 @@ class TextFactChecker:
         self.search_engine_id = config.GOOGLE_FACT_CHECK_CX
         self.base_url = "https://www.googleapis.com/customsearch/v1"
         
+        # Shared HTTP session (connection pooling + keep-alive), created lazily inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         # Configure Gemini for analysis
         genai.configure(api_key=config.GEMINI_API_KEY)
         self.model = genai.GenerativeModel(config.GEMINI_MODEL)
         
+        # Recent search results by exact query; cache reads/writes never await, so no lock is needed on the loop
+        self._search_cache: TTLCache = TTLCache(
+            maxsize=config.SEARCH_CACHE_MAX_ENTRIES,
+            ttl=config.SEARCH_CACHE_TTL
+        )
+        
+        # Stateless hashed term vectorizer for relevance scoring (no vocabulary fit per call)
+        self._hasher = HashingVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),  # Include bigrams
+            n_features=2**14,
+            alternate_sign=False,
+            norm='l2',
+            lowercase=True,
+            dtype=np.float32
+        )
+        
+        # Semantic cache of previous verdicts, keyed by claim embedding
+        self.semantic_cache = SemanticCache(
+            similarity_threshold=config.SEMANTIC_CACHE_THRESHOLD,
+            ttl=config.SEMANTIC_CACHE_TTL,
+            max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+            pca_components=config.SEMANTIC_CACHE_PCA_COMPONENTS,
+            pca_fit_size=config.SEMANTIC_CACHE_PCA_FIT_SIZE
+        ) if config.SEMANTIC_CACHE_ENABLED else None
+        
         if not self.api_key:
             raise ValueError("Google Custom Search API key is required")
         if not self.search_engine_id:
@@ -38,17 +122,29 @@ class TextFactChecker:
             Dictionary containing verification results
         """
         try:
-            print(f"🔍 DEBUG: TextFactChecker.verify called")
-            print(f"🔍 DEBUG: text_input = {text_input}")
-            print(f"🔍 DEBUG: claim_context = {claim_context}")
-            print(f"🔍 DEBUG: claim_date = {claim_date}")
-            print(f"Starting verification for: {text_input}")
+            logger.debug("Starting verification for: %s (context: %s, date: %s)", text_input, claim_context, claim_date)
+            
+            # Reuse the verdict of a near-duplicate claim if one was verified recently
+            claim_embedding = await self._embed_claim(text_input)
+            if claim_embedding is not None:
+                cached = self.semantic_cache.lookup(claim_embedding)
+                if cached:
+                    return {
+                        **cached,
+                        "details": {
+                            **cached["details"],
+                            "claim_text": text_input,
+                            "claim_context": claim_context,
+                            "claim_date": claim_date
+                        }
+                    }
+            
             # Search for fact-checked claims related to the input text
             search_results = await self._search_claims(text_input)
-            print(f"🔍 DEBUG: search_results = {search_results}")
+            logger.debug("Found %d search results", len(search_results))
             
             if not search_results:
-                return {
+                response = {
                     "verified": False,
                     "verdict": "no_content",
                     "message": "No fact-checked information found for this claim",
@@ -59,11 +155,12 @@ class TextFactChecker:
                         "fact_checks": []
                     }
                 }
+                return response
             
             # Analyze the search results
-            analysis = self._analyze_results(search_results, text_input)
+            analysis = await self._analyze_results(search_results, text_input)
             
-            return {
+            response = {
                 "verified": analysis["verified"],
                 "verdict": analysis["verdict"],
                 "message": analysis["message"],
@@ -75,6 +172,8 @@ class TextFactChecker:
                     "analysis": analysis
                 }
             }
+            self._remember_verdict(claim_embedding, response)
+            return response
             
         except Exception as e:
             return {
@@ -89,9 +188,144 @@ class TextFactChecker:
                 }
             }
     
+    async def verify_batch(self, items: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Verify several claims at once, analyzing all of them in a single Gemini call
+        
+        Args:
+            items: (text_input, claim_context, claim_date) tuples to verify
+            
+        Returns:
+            List of verification results aligned with items, shaped like verify()
+        """
+        if not items:
+            return []
+        
+        claim_embeddings = await asyncio.gather(*[self._embed_claim(text) for text, _, _ in items])
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        
+        # Serve near-duplicate claims from the semantic cache; search the rest concurrently
+        to_search = []
+        for i, ((text_input, claim_context, claim_date), claim_embedding) in enumerate(zip(items, claim_embeddings)):
+            cached = self.semantic_cache.lookup(claim_embedding) if claim_embedding is not None else None
+            if cached:
+                responses[i] = {
+                    **cached,
+                    "details": {
+                        **cached["details"],
+                        "claim_text": text_input,
+                        "claim_context": claim_context,
+                        "claim_date": claim_date
+                    }
+                }
+            else:
+                to_search.append(i)
+        
+        searches = await asyncio.gather(
+            *[self._search_claims(items[i][0]) for i in to_search],
+            return_exceptions=True
+        )
+        
+        # Claims with relevant sources go into the shared Gemini prompt
+        to_analyze = []
+        analyses: Dict[int, Dict[str, Any]] = {}
+        search_results_by_index: Dict[int, List[Dict[str, Any]]] = {}
+        for i, search_results in zip(to_search, searches):
+            text_input, claim_context, claim_date = items[i]
+            if isinstance(search_results, Exception):
+                responses[i] = {
+                    "verified": False,
+                    "verdict": "error",
+                    "message": f"Error during fact-checking: {str(search_results)}",
+                    "details": {
+                        "claim_text": text_input,
+                        "claim_context": claim_context,
+                        "claim_date": claim_date,
+                        "error": str(search_results)
+                    }
+                }
+                continue
+            
+            search_results_by_index[i] = search_results
+            relevant_results = self._filter_relevant_results(search_results, text_input) if search_results else []
+            if relevant_results:
+                to_analyze.append((i, relevant_results))
+            else:
+                analyses[i] = {
+                    "verified": False,
+                    "verdict": "no_content",
+                    "message": "No relevant fact-checked information found for this specific claim"
+                        if search_results else "No fact-checked information found for this claim"
+                }
+        
+        if to_analyze:
+            batch_analysis = await self._analyze_batch_with_gemini(
+                [(items[i][0], relevant_results) for i, relevant_results in to_analyze]
+            )
+            for (i, _), analysis in zip(to_analyze, batch_analysis):
+                analyses[i] = analysis
+        
+        for i, analysis in analyses.items():
+            text_input, claim_context, claim_date = items[i]
+            details = {
+                "claim_text": text_input,
+                "claim_context": claim_context,
+                "claim_date": claim_date,
+                "fact_checks": search_results_by_index[i]
+            }
+            if search_results_by_index[i]:
+                details["analysis"] = analysis
+            responses[i] = {
+                "verified": analysis["verified"],
+                "verdict": analysis["verdict"],
+                "message": analysis["message"],
+                "details": details
+            }
+            self._remember_verdict(claim_embeddings[i], responses[i])
+        
+        return responses
+    
+    def _remember_verdict(self, claim_embedding: Optional[List[float]], response: Dict[str, Any]) -> None:
+        """
+        Cache a verdict for near-duplicate claims, but only one Gemini actually produced: "no_content" and
+        fallback results reflect a missing fact-check or a failed analysis that may succeed on the next
+        request, and a cached copy would be served to every near-duplicate until the entry expires
+        
+        Args:
+            claim_embedding: Embedding of the verified claim, or None if caching is disabled or embedding failed
+            response: Verification response for the claim
+        """
+        analysis = response["details"].get("analysis") or {}
+        if claim_embedding is not None and analysis.get("analysis_method") in _GEMINI_ANALYSIS_METHODS:
+            self.semantic_cache.insert(claim_embedding, response)
+    
+    async def _embed_claim(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a claim for semantic cache lookup
+        
+        Args:
+            text: The claim text
+            
+        Returns:
+            Embedding vector, or None if caching is disabled or embedding failed
+        """
+        if self.semantic_cache is None:
+            return None
+        
+        try:
+            result = await genai.embed_content_async(
+                model=config.EMBEDDING_MODEL,
+                content=' '.join(text.lower().split())
+            )
+            return result["embedding"]
+        except Exception as e:
+            logger.warning(f"Claim embedding failed, skipping semantic cache: {e}")
+            return None
+    
     async def _search_claims(self, query: str) -> List[Dict[str, Any]]:
         """
-        Search for fact-checked claims using Google Custom Search API with LLM-powered fallback strategies
+        Search for fact-checked claims using Google Custom Search API, adding LLM-generated alternative
+        queries when the original query returns fewer than ALTERNATIVE_QUERY_MIN_RESULTS results
         
         Args:
             query: The search query
@@ -99,21 +333,35 @@ class TextFactChecker:
         Returns:
             List of search results
         """
-        # Try the original query first
-        results = await self._perform_search(query)
-        
-        # If no results, use LLM to create alternative queries
-        if not results:
-            print("No results found, using LLM to create alternative queries...")
-            
-            alternative_queries = self._create_alternative_queries(query)
-            print(f"Generated alternative queries: {alternative_queries}")
-
-            results = await self._perform_search(alternative_queries)
-            if results:
-                print(f"Found {len(results)} results with alternative query")
-            else:
-                print("No results found with alternative query")
+        original_results = await self._perform_search(query)
+        # Broader LLM-generated queries cost a Gemini call plus a Custom Search query each, so only
+        # spend them when the original query came back short
+        if len(original_results) >= config.ALTERNATIVE_QUERY_MIN_RESULTS:
+            return original_results
+        
+        alternative_queries = await self._create_alternative_queries(query)
+        logger.debug("Generated alternative queries: %s", alternative_queries)
+        
+        alternative_results = await asyncio.gather(
+            *[self._perform_search(alternative) for alternative in alternative_queries],
+            return_exceptions=True
+        )
+        
+        # Merge results, keeping the original query's ranking first and dropping duplicate links
+        results = []
+        seen_links = set()
+        for items in [original_results, *alternative_results]:
+            if isinstance(items, Exception):
+                logger.warning("Alternative query search failed: %s", items)
+                continue
+            for item in items:
+                link = item.get("link")
+                if link and link in seen_links:
+                    continue
+                seen_links.add(link)
+                results.append(item)
+        
+        logger.debug("Found %d results (%d from original query)", len(results), len(original_results))
         return results
     
     async def _perform_search(self, query: str) -> List[Dict[str, Any]]:
@@ -126,6 +374,11 @@ class TextFactChecker:
         Returns:
             List of search results
         """
+        cached = self._search_cache.get(query)
+        if cached is not None:
+            logger.debug("Search cache hit for query: %s", query)
+            return list(cached)
+        
         params = {
             "q": query,
             "key": self.api_key,
@@ -134,28 +387,49 @@ class TextFactChecker:
         }
         
         try:
-            print(f"Making request to: {self.base_url}")
-            print(f"Params: {params}")
+            # Never log params: they carry the API key
+            logger.debug("Searching %s for query: %s", self.base_url, query)
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            print(f"Response status: {response.status_code}")
-            print(f"Response text: {response.text}")
+            session = await self._get_session()
+            async with session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response_body = await response.read()
+                logger.debug("Search response status %s (%d bytes)", response.status, len(response_body))
+                
+                response.raise_for_status()
             
-            response.raise_for_status()
-            
-            data = response.json()
+            data = orjson.loads(response_body)
             items = data.get("items", [])
+            self._search_cache[query] = items
             
-            return items
+            return list(items)
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise Exception(f"API request failed: {str(e)}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Failed to parse API response: {str(e)}")
         except Exception as e:
             raise Exception(f"Search error: {str(e)}")
     
-    def _create_alternative_queries(self, query: str) -> List[str]:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use
+        
+        Returns:
+            Pooled aiohttp client session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _create_alternative_queries(self, query: str) -> List[str]:
         """
         Use LLM to create alternative search queries (broader and simpler)
         
@@ -166,7 +440,7 @@ class TextFactChecker:
             List of alternative queries to try
         """
         prompt = f"""
-You are a search query optimizer. Given a fact-checking query that returned no results, create alternative queries that might find relevant information.
+You are a search query optimizer. Given a fact-checking query, create alternative queries that might find additional relevant information.
 
 ORIGINAL QUERY: "{query}"
 
@@ -182,21 +456,19 @@ Examples:
 
 Respond in this exact JSON format:
 {{
-    "broader_query": "your broader query here",
+    "broader_query": "your broader query here"
 }}
 """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             response_text = response.text.strip()
             
             # Try to parse JSON response
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.replace('```', '').strip()
+            if response_text.startswith('```'):
+                response_text = _FENCE_RE.sub('', response_text).strip()
             
-            alternatives = json.loads(response_text)
+            alternatives = orjson.loads(response_text)
             
             # Return both alternatives
             queries = []
@@ -208,9 +480,10 @@ Respond in this exact JSON format:
             return queries
             
         except Exception as e:
-            print(f"Failed to create alternative queries with LLM: {e}")
+            logger.warning("Failed to create alternative queries with LLM: %s", e)
+            return []
     
-    def _analyze_results(self, results: List[Dict[str, Any]], original_text: str) -> Dict[str, Any]:
+    async def _analyze_results(self, results: List[Dict[str, Any]], original_text: str) -> Dict[str, Any]:
         """
         Analyze the search results using Gemini AI to determine overall verdict
         
@@ -228,19 +501,7 @@ Respond in this exact JSON format:
                 "message": "No fact-checked information found for this claim"
             }
         
-        # Filter relevant results
-        relevant_results = []
-        for result in results:
-            title = result.get("title", "").lower()
-            snippet = result.get("snippet", "").lower()
-            original_lower = original_text.lower()
-            
-            # Check if the result is relevant to our original text
-            relevance_score = self._calculate_relevance(result, original_text)
-            
-            print(f"Relevance score for '{title[:50]}...': {relevance_score:.3f}")
-            if relevance_score > 0.05:  # Very low threshold to catch all relevant results
-                relevant_results.append(result)
+        relevant_results = self._filter_relevant_results(results, original_text)
         
         if not relevant_results:
             return {
@@ -251,104 +512,106 @@ Respond in this exact JSON format:
         
         # Use Gemini to analyze the results
         try:
-            analysis = self._analyze_with_gemini(original_text, relevant_results)
+            analysis = await self._analyze_with_gemini(original_text, relevant_results)
             return analysis
         except Exception as e:
-            print(f"Gemini analysis failed: {str(e)}")
+            logger.warning("Gemini analysis failed: %s", e)
             # Fallback to simple analysis
             return self._fallback_analysis(relevant_results)
     
-    def _calculate_relevance(self, result: Dict[str, Any], original_text: str) -> float:
+    def _filter_relevant_results(self, results: List[Dict[str, Any]], original_text: str) -> List[Dict[str, Any]]:
         """
-        Calculate relevance score using TF-IDF similarity with multiple components
+        Keep only the search results relevant to the original text
         
         Args:
-            result: Search result dictionary
-            original_text: Original text being verified
+            results: List of search results from the API
+            original_text: The original text being verified
             
         Returns:
-            Relevance score between 0 and 1
+            Relevant results, in their original order
         """
-        score = 0.0
-        
-        # 1. Title relevance (40% weight)
-        title = result.get("title", "")
-        if title:
-            title_score = self._tfidf_similarity(title, original_text)
-            score += title_score * 0.6
+        # Score every result against the original text in a single vectorization pass
+        relevance_scores = self._calculate_relevance_batch(results, _preprocess_text(original_text))
         
-        # 2. Snippet relevance (30% weight)  
-        snippet = result.get("snippet", "")
-        if snippet:
-            snippet_score = self._tfidf_similarity(snippet, original_text)
-            score += snippet_score * 0.4
-        
-        # 3. Fact-check specific bonus (30% weight)
-        factcheck_score = self._has_factcheck_data(result)
-        score += factcheck_score * 0.1
+        relevant_results = []
+        for result, relevance_score in zip(results, relevance_scores):
+            logger.debug("Relevance score for '%.50s...': %.3f", result.get('title', ''), relevance_score)
+            if relevance_score > 0.05:  # Very low threshold to catch all relevant results
+                relevant_results.append(result)
         
-        return min(1.0, score)
+        return relevant_results
     
-    def _tfidf_similarity(self, text1: str, text2: str) -> float:
+    def _calculate_relevance_batch(self, results: List[Dict[str, Any]], preprocessed_original: str) -> List[float]:
         """
-        Calculate TF-IDF cosine similarity between two texts
+        Calculate relevance scores for all search results using term-vector similarity with multiple components
         
         Args:
-            text1: First text
-            text2: Second text
+            results: List of search result dictionaries
+            preprocessed_original: Original text being verified, already passed through _preprocess_text
             
         Returns:
-            Similarity score between 0 and 1
+            Relevance scores between 0 and 1, aligned with results
         """
-        if not text1.strip() or not text2.strip():
-            return 0.0
+        titles = [result.get("title", "") for result in results]
+        snippets = [result.get("snippet", "") for result in results]
+        
+        # Cheap word-overlap prefilter: results sharing (almost) no words with the claim skip vectorization
+        candidates = [
+            i for i, (title, snippet) in enumerate(zip(titles, snippets))
+            if self._simple_word_overlap(_preprocess_text(f"{title} {snippet}"), preprocessed_original)
+            >= config.RELEVANCE_PREFILTER_THRESHOLD
+        ]
         
-        try:
-            # Preprocess texts
-            texts = [self._preprocess_text(text1), self._preprocess_text(text2)]
-            
-            # Create TF-IDF vectors
-            vectorizer = TfidfVectorizer(
-                stop_words='english',
-                ngram_range=(1, 2),  # Include bigrams
-                max_features=500,
-                lowercase=True
+        # Titles and snippets of the remaining candidates are scored together against the original text
+        title_similarities = np.zeros(len(results))
+        snippet_similarities = np.zeros(len(results))
+        if candidates:
+            similarities = self._text_similarities(
+                preprocessed_original,
+                [titles[i] for i in candidates] + [snippets[i] for i in candidates]
             )
-            
-            tfidf_matrix = vectorizer.fit_transform(texts)
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            return float(similarity)
-            
-        except Exception as e:
-            print(f"TF-IDF calculation failed: {e}")
-            # Fallback to simple word overlap
-            return self._simple_word_overlap(text1, text2)
+            title_similarities[candidates] = similarities[:len(candidates)]
+            snippet_similarities[candidates] = similarities[len(candidates):]
+        
+        # 1. Title relevance (60% weight)
+        title_scores = title_similarities * 0.6
+        
+        # 2. Snippet relevance (40% weight)
+        snippet_scores = snippet_similarities * 0.4
+        
+        # 3. Fact-check specific bonus (10% weight)
+        factcheck_scores = np.array([self._has_factcheck_data(result) for result in results]) * 0.1
+        
+        return np.minimum(1.0, title_scores + snippet_scores + factcheck_scores).tolist()
     
-    def _preprocess_text(self, text: str) -> str:
+    def _text_similarities(self, preprocessed_query: str, documents: List[str]) -> np.ndarray:
         """
-        Preprocess text for TF-IDF analysis
+        Calculate hashed term-vector cosine similarity between a query and many documents
         
         Args:
-            text: Raw text
+            preprocessed_query: Preprocessed text every document is compared against
+            documents: Texts to score
             
         Returns:
-            Preprocessed text
+            Array of similarity scores between 0 and 1, aligned with documents
         """
-        import re
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
+        if not preprocessed_query or not documents:
+            return np.zeros(len(documents))
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        try:
+            # Preprocess texts; the query is always row 0
+            texts = [preprocessed_query] + [_preprocess_text(doc) for doc in documents]
+            
+            # Create hashed term vectors (stateless, nothing to fit)
+            term_matrix = self._hasher.transform(texts)
+            
+            # Rows are already L2-normalized, so one sparse product gives cosine similarity for every document
+            return (term_matrix[1:] @ term_matrix[0].T).toarray().ravel()
+            
+        except Exception as e:
+            logger.warning("Term-vector similarity calculation failed: %s", e)
+            # Fallback to simple word overlap
+            return np.array([self._simple_word_overlap(doc, preprocessed_query) for doc in documents])
     
     def _simple_word_overlap(self, text1: str, text2: str) -> float:
         """
@@ -361,16 +624,16 @@ Respond in this exact JSON format:
         Returns:
             Similarity score between 0 and 1
         """
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        words1 = _word_set(text1)
+        words2 = _word_set(text2)
         
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        intersection = len(words1 & words2)
+        union = len(words1 | words2)
         
-        return len(intersection) / len(union) if union else 0.0
+        return intersection / union if union else 0.0
     
     def _has_factcheck_data(self, result: Dict[str, Any]) -> float:
         """
@@ -390,21 +653,15 @@ Respond in this exact JSON format:
             return 1.0
         
         # Check for fact-check related keywords in URL or title
-        url = result.get("link", "").lower()
-        title = result.get("title", "").lower()
-        
-        factcheck_keywords = [
-            "fact-check", "factcheck", "snopes", "politifact", 
-            "factcrescendo", "boomlive", "newschecker", "afp"
-        ]
+        url = result.get("link", "")
+        title = result.get("title", "")
         
-        for keyword in factcheck_keywords:
-            if keyword in url or keyword in title:
-                return 1.0
+        if _FACTCHECK_KEYWORDS.search(f"{url}\n{title}".lower()):
+            return 1.0
         
         return 0.0
     
-    def _analyze_with_gemini(self, original_text: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_with_gemini(self, original_text: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Use Gemini AI to analyze fact-check results and determine verdict
         
@@ -449,16 +706,14 @@ Respond in this exact JSON format:
 """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             response_text = response.text.strip()
             
             # Try to parse JSON response
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.replace('```', '').strip()
+            if response_text.startswith('```'):
+                response_text = _FENCE_RE.sub('', response_text).strip()
             
-            analysis = json.loads(response_text)
+            analysis = orjson.loads(response_text)
             
             # Ensure required fields
             analysis.setdefault("verdict", "uncertain")
@@ -473,149 +728,107 @@ Respond in this exact JSON format:
             
             return analysis
             
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse Gemini response as JSON: {e}")
-            print(f"Raw response: {response_text}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse Gemini response as JSON: %s", e)
+            logger.debug("Raw response: %s", response_text)
             return self._fallback_analysis(results)
         except Exception as e:
-            print(f"Gemini analysis error: {e}")
+            logger.warning("Gemini analysis error: %s", e)
             return self._fallback_analysis(results)
     
-    def _fallback_analysis(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_batch_with_gemini(self, claims: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
         """
-        Fallback analysis when Gemini fails
+        Use Gemini AI to analyze several claims against their sources in a single call
         
         Args:
-            results: List of search results
+            claims: (claim text, relevant search results) pairs
             
         Returns:
-            Basic analysis results
-        """
-        return {
-            "verified": False,
-            "verdict": "uncertain",
-            "message": "Unable to determine claim accuracy from available sources. Found fact-checking articles but analysis failed.",
-            "confidence": "low",
-            "relevant_results_count": len(results),
-            "analysis_method": "fallback"
-        }
-    
-    def _extract_verdict_from_content(self, content: str) -> str:
+            Analysis results aligned with claims, each shaped like _analyze_with_gemini output
         """
-        Extract verdict from search result content
+        claims_text = ""
+        for i, (claim_text, results) in enumerate(claims, 1):
+            claims_text += f"\n--- CLAIM {i} ---\nCLAIM TO VERIFY: \"{claim_text}\"\n\nFACT-CHECKING SOURCES:\n"
+            for j, result in enumerate(results[:5], 1):  # Limit to top 5 results per claim
+                title = result.get("title", "")
+                snippet = result.get("snippet", "")
+                link = result.get("link", "")
+                claims_text += f"{j}. Title: {title}\n   Snippet: {snippet}\n   Link: {link}\n\n"
         
-        Args:
-            content: Combined title and snippet text
-            
-        Returns:
-            Verdict string
-        """
-        content_lower = content.lower()
-        
-        # Look for verdict indicators
-        if any(word in content_lower for word in ["false", "misleading", "incorrect", "debunked", "not true"]):
-            return "false"
-        elif any(word in content_lower for word in ["true", "accurate", "correct", "verified", "confirmed", "is true", "is correct"]):
-            return "true"
-        elif any(word in content_lower for word in ["partially", "mixed", "somewhat", "half"]):
-            return "mixed"
-        elif any(word in content_lower for word in ["unverified", "unproven", "uncertain", "disputed"]):
-            return "uncertain"
-        else:
-            return "unknown"
-    
-    def _analyze_verdicts(self, verdicts: List[str]) -> Dict[str, Any]:
-        """
-        Analyze verdicts to determine overall result
+        prompt = f"""
+You are a fact-checking expert. Analyze each of the following claims against its own fact-checking sources.
+{claims_text}
+STEP-BY-STEP ANALYSIS (for each claim independently):
+1. What does each source say ACTUALLY HAPPENED?
+2. What does each source say was FAKE or MISLEADING?
+3. Based on the evidence, what is the most likely truth about the claim?
+
+Respond in this exact JSON format, with exactly {len(claims)} entries in the same order as the claims above:
+{{
+    "results": [
+        {{
+            "verdict": "true|false|mixed|uncertain",
+            "verified": true|false,
+            "message": "Your explanation here",
+            "confidence": "high|medium|low",
+            "reasoning": "Your step-by-step reasoning process"
+        }}
+    ]
+}}
+"""
         
-        Args:
-            verdicts: List of verdict strings
+        try:
+            response = await self.model.generate_content_async(prompt)
+            response_text = response.text.strip()
             
-        Returns:
-            Analysis of verdicts
-        """
-        if not verdicts:
-            return {
-                "verified": False,
-                "verdict": "uncertain",
-                "message": "No verdicts found"
-            }
+            if response_text.startswith('```'):
+                response_text = _FENCE_RE.sub('', response_text).strip()
+            
+            batch_analysis = orjson.loads(response_text).get("results", [])
+            if not isinstance(batch_analysis, list):
+                raise ValueError("Expected a list under 'results'")
+            if len(batch_analysis) != len(claims):
+                logger.warning("Expected %d batch results, got %d", len(claims), len(batch_analysis))
+        except Exception as e:
+            logger.warning("Batch Gemini analysis error: %s", e)
+            batch_analysis = []
         
-        true_count = verdicts.count("true")
-        false_count = verdicts.count("false")
-        mixed_count = verdicts.count("mixed")
-        uncertain_count = verdicts.count("uncertain")
-        unknown_count = verdicts.count("unknown")
-        
-        total = len(verdicts)
-        
-        # Determine overall verdict
-        if false_count > 0:
-            overall_verdict = "false"
-            verified = False
-        elif true_count > 0 and false_count == 0:
-            overall_verdict = "true"
-            verified = True
-        elif mixed_count > 0:
-            overall_verdict = "mixed"
-            verified = False
-        elif uncertain_count > 0:
-            overall_verdict = "uncertain"
-            verified = False
-        else:
-            overall_verdict = "unknown"
-            verified = False
+        analyses = []
+        for i, (_, results) in enumerate(claims):
+            analysis = batch_analysis[i] if i < len(batch_analysis) else None
+            if not isinstance(analysis, dict):
+                analyses.append(self._fallback_analysis(results))
+                continue
+            
+            # Ensure required fields
+            analysis.setdefault("verdict", "uncertain")
+            analysis.setdefault("verified", False)
+            analysis.setdefault("message", "Analysis completed")
+            analysis.setdefault("confidence", "medium")
+            analysis.setdefault("reasoning", "Analysis completed")
+            
+            # Add metadata
+            analysis["relevant_results_count"] = len(results)
+            analysis["analysis_method"] = "gemini_batch"
+            analyses.append(analysis)
         
-        return {
-            "verified": verified,
-            "verdict": overall_verdict,
-            "true_count": true_count,
-            "false_count": false_count,
-            "mixed_count": mixed_count,
-            "uncertain_count": uncertain_count,
-            "unknown_count": unknown_count,
-            "total_verdicts": total
-        }
+        return analyses
     
-    def _build_message(self, analysis: Dict[str, Any], results: List[Dict[str, Any]]) -> str:
+    def _fallback_analysis(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Build a human-readable message based on the analysis
+        Fallback analysis when Gemini fails
         
         Args:
-            analysis: Analysis results
-            results: Relevant search results
+            results: List of search results
             
         Returns:
-            Formatted message
-        """
-        verdict = analysis["verdict"]
-        total_verdicts = analysis["total_verdicts"]
-        relevant_results_count = len(results)
-        
-        base_messages = {
-            "true": "This claim appears to be TRUE based on fact-checking sources.",
-            "false": "This claim appears to be FALSE based on fact-checking sources.",
-            "mixed": "This claim has MIXED evidence - some parts are true, others are false.",
-            "uncertain": "This claim is UNCERTAIN - insufficient evidence to determine accuracy.",
-            "unknown": "This claim needs further investigation - verdict unclear from available sources.",
-            "no_content": "No fact-checked information found for this claim."
+            Basic analysis results
+        """
+        return {
+            "verified": False,
+            "verdict": "uncertain",
+            "message": "Unable to determine claim accuracy from available sources. Found fact-checking articles but analysis failed.",
+            "confidence": "low",
+            "relevant_results_count": len(results),
+            "analysis_method": "fallback"
         }
-        
-        message = base_messages.get(verdict, "Unable to determine claim accuracy.")
-        
-        # Add details about sources
-        if relevant_results_count > 0:
-            message += f" Found {relevant_results_count} relevant fact-check(s) with {total_verdicts} total verdicts."
-            
-            # Add top sources
-            top_sources = []
-            for result in results[:3]:  # Show top 3 sources
-                title = result.get("title", "Unknown")
-                link = result.get("link", "")
-                if title not in top_sources and link:
-                    top_sources.append(f"{title}")
-            
-            if top_sources:
-                message += f" Sources include: {', '.join(top_sources[:3])}."
-        
-        return message